@@ -33,8 +33,21 @@ except ImportError as exc:
     print(f"WorkLogManager 모듈 로드 실패: {exc}")
 from cnt_data_plotter import CNTDataPlotter
 from error_log_manager import ErrorLogManager
-from db_file import read_db_file, is_cnt_related_data
+from db_file import read_db_file, is_cnt_related_data, extract_date_from_filename
 from db_file import convert_datetime_vectorized
+from db_file import set_working_set, build_working_set
+from db_query import query_db_files, build_date_index, parse_time_window, filter_files_by_date, build_condition_expr
+from db_follow import DbTailFollower, FOLLOW_INTERVAL_MS
+from db_sidecar import is_live_file
+from db_rollup import choose_rollup_level, query_rollups
+from db_catalog import refresh_catalog, get_union_columns, is_numeric_sql_type
+from db_connection import read_connection
+from plot_downsample import DownsampledPlot
+from plot_spans import ErrorSpanCollection
+from time_index import TimeIndex
+from load_job import BackgroundLoadJob
+from plot_progressive import ProgressivePlot
+from df_store import make_selection_key, open_merged_store, materialize_merged
 from matplotlib import colors as mcolors
 from matplotlib.lines import Line2D
 
@@ -51,6 +64,7 @@ artist_colors = {}
 artist_labels = {}
 color_popup = None
 current_fig = None  # 현재 figure 참조
+plot_downsampler = None  # 현재 figure의 다운샘플링 관리자 (콜백 유지를 위해 참조 보관)
 
 
 # 폴더/파일 선택 기능 추가
@@ -90,14 +104,15 @@ for i, db_file in enumerate(db_files[:5]):  # 처음 5개만 표시
 if len(db_files) > 5:
     print(f"  ... 외 {len(db_files)-5}개")
 
+# 파일명 날짜 인덱스 (시간 구간 조회 시 해당 날짜 파일만 선택)
+db_date_index = build_date_index(db_files)
+
 # 2. 첫 번째 DB에서 컬럼 목록 추출
-conn = sqlite3.connect(db_files[0])
 try:
-    df_sample = pd.read_sql_query("SELECT * FROM data LIMIT 1", conn)
+    with read_connection(db_files[0]) as conn:
+        df_sample = pd.read_sql_query("SELECT * FROM data LIMIT 1", conn)
 except Exception as e:
-    conn.close()
     raise ValueError(f"DB 읽기 실패: {e}")
-conn.close()
 
 # 3. 시간 컬럼 및 수치형 컬럼 자동 탐색 부분을 수정
 time_cols = [c for c in df_sample.columns if c.lower() in ['time', 'timestamp', 'datetime']]
@@ -144,6 +159,17 @@ if 'fault' in df_sample.columns and 'fault' not in num_cols:
     num_cols.append('fault')
     print("fault 컬럼 강제 추가")
 
+
+def get_catalog_extra_columns(catalog, known_cols, exclude_cols):
+    """카탈로그 기준 다른 파일에만 있는 숫자형 컬럼 목록 (파라미터 리스트를 전체 파일 합집합으로 확장)"""
+    union_cols, union_types = get_union_columns(catalog)
+    return [c for c in union_cols
+            if c not in known_cols and c not in exclude_cols and is_numeric_sql_type(union_types[c])]
+
+
+# 폴더 카탈로그 (창을 띄운 뒤 작업 스레드에서 갱신, start_catalog_refresh 참고)
+db_catalog = {}
+
 print(f"최종 사용 가능한 파라미터 수: {len(num_cols)}")
 
 # 디버깅: 누락된 컬럼들을 확인
@@ -198,7 +224,7 @@ button_column.grid(row=0, column=1, rowspan=2, sticky=tk.E)
 
 def apply_new_data_source(new_folder: str, new_files: list[str], mode: str) -> bool:
     """선택된 폴더/파일 정보로 전역 상태와 UI를 갱신합니다."""
-    global db_folder, db_files, df_sample, num_cols, time_cols, all_available_cols, numeric_cols, non_numeric_cols, manual_file_selection
+    global db_folder, db_files, db_date_index, db_catalog, df_sample, num_cols, time_cols, all_available_cols, numeric_cols, non_numeric_cols, manual_file_selection
 
     if not new_files:
         messagebox.showerror("오류", "선택한 경로에 DB 파일이 없습니다.")
@@ -206,19 +232,18 @@ def apply_new_data_source(new_folder: str, new_files: list[str], mode: str) -> b
 
     db_folder = new_folder
     db_files = new_files
+    db_date_index = build_date_index(db_files)
     manual_file_selection = mode == "files"
 
     print(f"\n데이터 소스 변경: {db_folder}")
     print(f"사용할 DB 파일 수: {len(db_files)}")
 
-    conn = sqlite3.connect(db_files[0])
     try:
-        df_sample_local = pd.read_sql_query("SELECT * FROM data LIMIT 1", conn)
+        with read_connection(db_files[0]) as conn:
+            df_sample_local = pd.read_sql_query("SELECT * FROM data LIMIT 1", conn)
     except Exception as exc:
-        conn.close()
         messagebox.showerror("오류", f"DB 읽기 실패: {exc}")
         return False
-    conn.close()
 
     # 전역 메타데이터 갱신
     df_sample = df_sample_local
@@ -242,6 +267,9 @@ def apply_new_data_source(new_folder: str, new_files: list[str], mode: str) -> b
     if 'fault' in df_sample.columns and 'fault' not in num_cols:
         num_cols.append('fault')
 
+    # 폴더 카탈로그는 작업 스레드에서 갱신 (완료되면 다른 파일에만 있는 컬럼을 리스트에 추가)
+    db_catalog = {}
+
     folder_label.config(text=f"현재 폴더: {db_folder}")
     if manual_file_selection:
         file_selection_var.set(f"수동 선택: {len(db_files)}개 파일")
@@ -280,6 +308,7 @@ def apply_new_data_source(new_folder: str, new_files: list[str], mode: str) -> b
             f"예시 목록:\n{sample_text}"
         )
 
+    start_catalog_refresh()
     messagebox.showinfo("완료", message)
     print(f"파라미터 리스트 새로고침 완료: {len(num_cols)}개")
     return True
@@ -320,6 +349,27 @@ btn_select_folder.pack(fill=tk.X)
 btn_select_files = ttk.Button(button_column, text="📄 파일 선택", command=select_files_for_analysis)
 btn_select_files.pack(fill=tk.X, pady=(4, 0))
 
+# 시간 구간 선택 영역 (비워 두면 전체 기간)
+time_window_frame = ttk.Frame(frame)
+time_window_frame.pack(fill=tk.X, pady=(0, 5))
+
+ttk.Label(time_window_frame, text="시간 구간:").pack(side=tk.LEFT)
+time_start_var = tk.StringVar()
+time_end_var = tk.StringVar()
+ttk.Entry(time_window_frame, textvariable=time_start_var, width=20).pack(side=tk.LEFT, padx=(5, 2))
+ttk.Label(time_window_frame, text="~").pack(side=tk.LEFT)
+ttk.Entry(time_window_frame, textvariable=time_end_var, width=20).pack(side=tk.LEFT, padx=(2, 5))
+
+
+def clear_time_window():
+    """시간 구간 입력 초기화 (전체 기간)"""
+    time_start_var.set("")
+    time_end_var.set("")
+
+
+ttk.Button(time_window_frame, text="전체 기간", command=clear_time_window).pack(side=tk.LEFT)
+ttk.Label(time_window_frame, text="형식: YYYY-MM-DD [HH:MM[:SS]]", font=('Arial', 8), foreground='gray').pack(side=tk.LEFT, padx=(8, 0))
+
 label = ttk.Label(frame, text="Y축 변수 선택:")
 label.pack(pady=5)
 
@@ -732,6 +782,7 @@ def add_custom_param():
         global frequent_params
         if name not in frequent_params:
             frequent_params.append(name)
+        set_working_set(build_working_set(frequent_params, custom_params))
         
         messagebox.showinfo("추가 완료", 
             f"'{name}' 파라미터가 추가되었습니다.\n포함된 파라미터: {len(selected_params)}개", parent=win)
@@ -786,6 +837,9 @@ custom_params["Laser & EUV Power"] = {
     'logic': 'AND'  # 두 조건을 모두 만족해야 함
 }
 
+# 작업 세트 설정: 캐시 미스 시 자주 쓰는 파라미터를 한 번의 DB 스캔으로 함께 읽음
+set_working_set(build_working_set(frequent_params, custom_params))
+
 # frequent_params 필터링 수정: custom_params도 포함
 frequent_params_filtered = []
 for param in frequent_params:
@@ -813,175 +867,194 @@ btn_add_param.pack(pady=10)
 # 중복 코드는 db_file.py로 통합되어 제거됨
 
 
+# 진행 중인 백그라운드 데이터 로드 작업 (BackgroundLoadJob)과 그 점진적 미리보기 (ProgressivePlot)
+current_load_job = None
+current_load_preview = None
+
+
+def _cancel_superseded_load():
+    """새 플롯 요청 시 진행 중인 로드를 취소하고 그 미리보기 창을 닫음 (이전 결과는 버림)"""
+    global current_load_preview
+    if current_load_job is not None and current_load_job.running:
+        current_load_job.cancel()
+        if current_load_preview is not None:
+            current_load_preview.close()
+    current_load_preview = None
+
+
 # plot_selected 함수의 사용자 정의 파라미터 부분 수정
 def plot_selected(event=None):
-    global yvar, ax1, ax, df_all, ax2, all_axes, plot_artists, artist_legend_map, plot_scale_mode, plot_style_mode, artist_colors, artist_labels, color_popup, current_fig
+    """선택한 파라미터의 데이터를 백그라운드에서 읽고, 완료되면 Tk 스레드에서 플롯"""
+    global current_load_job, current_load_preview
     
-    all_dfs = []
-    plot_artists.clear()
-    artist_legend_map.clear()
-    artist_legend_text_map.clear()
-    artist_colors.clear()
-    artist_labels.clear()
     sel = var_list.curselection()
     if not sel:
         return
-    yvar = var_list.get(sel[0])
+    plot_var = var_list.get(sel[0])
     
     # 헤더 항목 체크
-    if yvar.startswith("------"):
+    if plot_var.startswith("------"):
         return
 
-    print(f"선택된 파라미터: {yvar}")
+    print(f"선택된 파라미터: {plot_var}")
 
-    if yvar in custom_params:
-        param_info = custom_params[yvar]
+    if plot_var in custom_params:
+        param_info = custom_params[plot_var]
         print(f"사용자 정의 파라미터 정보: {param_info}")
         params_to_read = param_info['params']
-    elif yvar == "Laser & EUV Power":
+    elif plot_var == "Laser & EUV Power":
         params_to_read = ["laser_power_value", "euvChamber_euvPower_value"]
     else:
-        params_to_read = [yvar]
+        params_to_read = [plot_var]
 
     print(f"읽을 파라미터들: {params_to_read}")
 
-    # 병렬로 여러 파일 읽기 (고속)
-    from db_file import read_multiple_db_files_parallel, read_db_file_with_cache
-    
-    # 여러 파일이면 병렬 읽기 (ThreadPoolExecutor + Polars 병렬 처리), 단일 파일이면 캐싱 사용
-    if len(db_files) > 1:
-        print(f"⚡ 병렬 읽기 모드: {len(db_files)}개 파일")
-        dfs_list = read_multiple_db_files_parallel(
-            db_files, 
-            params_to_read, 
-            time_cols, 
-            convert_datetime_vectorized,
-            max_workers=None  # 자동 결정
+    # 조건 (custom_params에 정의된 경우)
+    param_conditions = {}
+    logic = 'AND'
+    if plot_var in custom_params:
+        param_info = custom_params[plot_var]
+        param_conditions = param_info.get('param_conditions', {})
+        logic = param_info.get('logic', 'AND')
+        print(f"적용할 조건들: {param_conditions}")
+        print(f"결합 로직: {logic}")
+
+    # 여러 파일 조회 (스레드/프로세스 풀 + Polars 병렬 처리, 캐시 사용)
+    # 조건 필터는 파일별 결과에 Polars predicate로 적용되어 병합/정렬 전에 행이 줄어듦
+    # 읽기는 작업 스레드에서 실행되고 GUI는 진행 표시줄로 진행 상황을 보여줌
+    print(f"⚡ 조회 모드: {len(db_files)}개 파일")
+    try:
+        window_start, window_end = parse_time_window(time_start_var.get(), time_end_var.get())
+    except ValueError as e:
+        messagebox.showerror("오류", str(e))
+        return
+    if window_start is not None or window_end is not None:
+        print(f"시간 구간: {window_start or '처음'} ~ {window_end or '끝'}")
+
+    # 이전 로드가 진행 중이면 취소하고 새로 시작 (이전 결과와 미리보기 창은 버림)
+    _cancel_superseded_load()
+
+    files_to_read = list(db_files)
+    date_index = db_date_index
+    carry_plc_state = carry_plc_state_var.get()
+
+    # 같은 선택을 이미 읽었으면 저장된 병합 결과(메모리 맵)를 바로 열기
+    store_key = make_selection_key(files_to_read, params_to_read, window_start, window_end,
+                                   param_conditions, logic, carry_plc_state)
+    df_stored = open_merged_store(files_to_read, store_key)
+    if df_stored is not None:
+        print(f"💾 저장된 병합 결과 재사용: {len(df_stored):,} 행")
+        load_status_var.set(f"{plot_var}: 저장된 결과 사용")
+        show_loaded_plot(plot_var, df_stored)
+        return
+
+    job = None
+    # 점진적 표시: figure를 바로 열고 파일이 끝날 때마다 이어 그림 (완료되면 전체 플롯으로 교체)
+    preview = ProgressivePlot(plot_var, params_to_read) if progressive_plot_var.get() else None
+
+    def load_work(progress_callback, cancel_event):
+        df_all_pl = query_db_files(
+            files_to_read,
+            params_to_read,
+            time_cols,
+            start=window_start,
+            end=window_end,
+            date_index=date_index,
+            param_conditions=param_conditions,
+            logic=logic,
+            max_workers=None,  # 자동 결정
+            backend='auto',  # 파일 수/총 크기로 스레드·프로세스 풀 자동 선택
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+            partial_callback=job.report_partial if preview is not None else None,
+            carry_plc_state=carry_plc_state,  # 날짜 경계에서 PLC 상태/마지막 유효값 이어받기
         )
-        # None이 아닌 결과만 필터링
-        all_dfs = [df for df in dfs_list if df is not None]
-    else:
-        # 단일 파일은 캐싱 사용
-        for db_path in db_files:
-            # CNT 관련 데이터 제외 (개선된 로직)
-            if is_cnt_related_data(db_path, params_to_read):
-                print(f"CNT 관련 데이터 제외: {os.path.basename(db_path)}")
-                continue
-                
-            df = read_db_file_with_cache(
-                db_path, 
-                params_to_read, 
-                time_cols, 
-                convert_datetime_vectorized,
-                use_cache=True
-            )
-            if df is not None:
-                all_dfs.append(df)
-                print(f"성공: {os.path.basename(db_path)} - {len(df)} 행")
-            else:
-                print(f"실패: {os.path.basename(db_path)}")
+        if df_all_pl is None or df_all_pl.height == 0:
+            return df_all_pl
+        # 병합 결과를 Arrow IPC 파일로 저장하고 메모리 맵으로 열어 pandas로 전달 (작업 스레드에서 저장)
+        return materialize_merged(files_to_read, store_key, df_all_pl)
+
+    def on_done(df_loaded):
+        if preview is not None:
+            preview.close()
+        if job is not current_load_job:
+            return  # 취소 요청 전에 끝난 이전 작업의 결과는 버림
+        _finish_load_job(job)
+        show_loaded_plot(plot_var, df_loaded)
+
+    def on_error(e):
+        _finish_load_job(job, "로드 실패")
+        if preview is not None:
+            preview.close()
+        messagebox.showerror("오류", str(e) if isinstance(e, ValueError) else f"데이터 로드 중 오류가 발생했습니다:\n{e}")
+
+    def on_cancelled():
+        _finish_load_job(job, "로드 취소됨")
+        if preview is not None:
+            preview.finish("로드 취소됨")
+
+    job = BackgroundLoadJob(root, load_work, on_done, on_error=on_error,
+                            on_progress=_update_load_progress, on_cancelled=on_cancelled,
+                            on_partial=preview.add_frame if preview is not None else None)
+    current_load_job = job
+    current_load_preview = preview
+    load_progress_var.set(0)
+    load_status_var.set(f"{plot_var}: 데이터 로드 중...")
+    btn_cancel_load.config(state=tk.NORMAL)
+    job.start()
+
+
+def _update_load_progress(done, total, message):
+    """작업 스레드의 파일별 진행 상황을 진행 표시줄에 반영 (Tk 스레드)"""
+    if total:
+        load_progress_var.set(100.0 * done / total)
+    load_status_var.set(f"[{done}/{total}] {message}")
+
+
+def _finish_load_job(job, status_text=""):
+    """로드 작업 종료 처리 (최신 작업일 때만 진행 표시 초기화)"""
+    if job is not current_load_job:
+        return
+    btn_cancel_load.config(state=tk.DISABLED)
+    load_progress_var.set(0 if status_text else 100)
+    load_status_var.set(status_text)
+
+
+def cancel_current_load():
+    """진행 중인 데이터 로드 취소"""
+    if current_load_job is not None:
+        current_load_job.cancel()
+        load_status_var.set("취소 중... (읽고 있는 파일이 끝나면 중단)")
+
+
+def show_loaded_plot(plot_var, df_loaded):
+    """
+    백그라운드에서 읽은 데이터로 플롯 생성 (Tk 스레드)
+    df_loaded: 메모리 맵 병합 결과(pandas), 빈 결과면 None 또는 행이 없는 Polars DataFrame
+    """
+    global yvar, ax1, ax, df_all, ax2, all_axes, plot_artists, artist_legend_map, plot_scale_mode, plot_style_mode, artist_colors, artist_labels, color_popup, current_fig
     
-    if not all_dfs:
+    yvar = plot_var
+    plot_artists.clear()
+    artist_legend_map.clear()
+    artist_legend_text_map.clear()
+    artist_colors.clear()
+    artist_labels.clear()
+    
+    if df_loaded is None:
         messagebox.showwarning("경고", "적합한 데이터가 없습니다.")
         return
+    if len(df_loaded) == 0:
+        messagebox.showwarning("경고", "조건을 만족하는 데이터가 없습니다.")
+        return
 
-    # Polars로 빠른 병합 (성능 향상)
-    if POLARS_AVAILABLE and pl is not None and len(all_dfs) > 1:
-        try:
-            # pandas DataFrame을 Polars로 변환
-            dfs_pl = [pl.from_pandas(df) for df in all_dfs]
-            # Polars concat (더 빠름)
-            df_all_pl = pl.concat(dfs_pl)
-            # datetime 정렬
-            df_all_pl = df_all_pl.sort('datetime')
-            # pandas로 변환 (matplotlib 호환)
-            df_all = df_all_pl.to_pandas()
-        except Exception as e:
-            print(f"Polars 병합 실패, pandas로 fallback: {e}")
-            # fallback: pandas concat
-            df_all = pd.concat(all_dfs, ignore_index=True)
-            df_all['datetime'] = pd.to_datetime(df_all['datetime'])
-            df_all = df_all.sort_values('datetime').reset_index(drop=True)
-    else:
-        # pandas 기반 병합
-        df_all = pd.concat(all_dfs, ignore_index=True)
-        df_all['datetime'] = pd.to_datetime(df_all['datetime'])
-        df_all = df_all.sort_values('datetime').reset_index(drop=True)
-
+    # 필터링된 결과는 작업 스레드에서 작은 dtype으로 바꿔 Arrow IPC 파일에 저장하고 메모리 맵으로 연 것
+    # (컬럼은 파일을 직접 참조하는 읽기 전용 배열이므로 플롯/구간 분석/저장은 복사 없이 조회만 함)
+    df_all = df_loaded
     print(f"통합 데이터: {len(df_all)} 행")
     print(f"컬럼들: {list(df_all.columns)}")
-
-    # 조건 적용 (custom_params에 정의된 경우)
-    if yvar in custom_params:
-        param_info = custom_params[yvar]
-        param_conditions = param_info.get('param_conditions', {})
-        logic = param_info.get('logic', 'AND')
-        
-        print(f"적용할 조건들: {param_conditions}")
-        print(f"결합 로직: {logic}")
-        
-        # 필터링 마스크 초기화
-        combined_mask = None
-        
-        for param, condition_data in param_conditions.items():
-            condition = condition_data.get('condition', '')
-            threshold = condition_data.get('threshold', '')
-            
-            print(f"처리 중인 조건: {param} - {condition} {threshold}")
-            
-            if condition and threshold and param in df_all.columns:
-                try:
-                    threshold_value = float(threshold)
-                    
-                    # 조건에 따라 마스크 생성 (0 초과 조건은 부동소수 정밀도 이슈를 고려해 epsilon 추가)
-                    epsilon = np.finfo(float).eps
-                    if condition == "이상":
-                        mask = df_all[param] >= threshold_value
-                    elif condition == "이하":
-                        mask = df_all[param] <= threshold_value
-                    elif condition == "초과":
-                        mask = df_all[param] > threshold_value + epsilon
-                    elif condition == "미만":
-                        mask = df_all[param] < threshold_value
-                    elif condition == "같음":
-                        mask = df_all[param] == threshold_value
-                    elif condition == "다름":
-                        mask = df_all[param] != threshold_value
-                    else:
-                        mask = pd.Series([True] * len(df_all), index=df_all.index)
-                    
-                    print(f"조건 적용 결과: {param} - {condition} {threshold} -> {mask.sum()}개 데이터 포인트 만족")
-                    
-                    # AND/OR 로직에 따라 마스크 결합
-                    if combined_mask is None:
-                        combined_mask = mask
-                        print(f"첫 번째 조건 설정: {combined_mask.sum()}개 포인트")
-                    elif logic == "AND":
-                        combined_mask = combined_mask & mask
-                        print(f"AND 결합 후: {combined_mask.sum()}개 포인트")
-                    elif logic == "OR":
-                        combined_mask = combined_mask | mask
-                        print(f"OR 결합 후: {combined_mask.sum()}개 포인트")
-                    
-                except ValueError:
-                    messagebox.showerror("오류", f"Threshold 값은 숫자로 입력해야 합니다: {threshold}")
-                    return
-            elif param not in df_all.columns:
-                print(f"경고: 파라미터 '{param}'이 데이터에 없습니다.")
-            elif not condition or not threshold:
-                print(f"조건이나 threshold가 비어있음: {param} - '{condition}' '{threshold}'")
-        
-        # 최종 마스크 적용
-        if combined_mask is not None:
-            original_count = len(df_all)
-            df_all = df_all[combined_mask].copy()
-            print(f"조건 필터링 결과: {original_count} -> {len(df_all)} 포인트")
-            
-            if len(df_all) == 0:
-                messagebox.showwarning("경고", "조건을 만족하는 데이터가 없습니다.")
-                return
-        else:
-            print("적용된 조건이 없습니다.")
+    # datetime 정렬 결과이므로 구간 선택/저장은 이진 탐색 슬라이스로 처리
+    df_time_index = TimeIndex.from_frame(df_all)
     
     # x축 데이터 설정 (조건 필터링 후)
     x = df_all['datetime']
@@ -1007,6 +1080,10 @@ def plot_selected(event=None):
     ax2 = None
     all_axes = [ax]
 
+    # 점이 많으면 화면 픽셀 폭 기준 min/max 다운샘플링 (줌/팬 시 보이는 구간을 원본 해상도에서 다시 계산)
+    global plot_downsampler
+    plot_downsampler = DownsampledPlot([ax])
+
     # 플롯 스타일 설정 함수
     def get_plot_style():
         """현재 플롯 스타일 모드에 따라 linestyle과 marker 반환"""
@@ -1040,7 +1117,8 @@ def plot_selected(event=None):
 
         if "laser_power_value" in available_params:
             print(f"Laser Power Scatter 플롯: X축 길이={len(x)}, Y축 길이={len(df_all['laser_power_value'])}")
-            scatter1 = ax1.scatter(
+            scatter1 = plot_downsampler.scatter(
+                ax1,
                 x,
                 df_all['laser_power_value'],
                 label='Laser Power',
@@ -1073,7 +1151,8 @@ def plot_selected(event=None):
         if "euvChamber_euvPower_value" in available_params:
             ax2 = ax1.twinx()
             print(f"EUV Power Scatter 플롯: X축 길이={len(x)}, Y축 길이={len(df_all['euvChamber_euvPower_value'])}")
-            scatter2 = ax2.scatter(
+            scatter2 = plot_downsampler.scatter(
+                ax2,
                 x,
                 df_all['euvChamber_euvPower_value'],
                 label='EUV Power',
@@ -1141,7 +1220,8 @@ def plot_selected(event=None):
             
             print(f"첫 번째 파라미터 플롯: {param}, X축 길이: {len(x)}, Y축 길이: {len(df_all[param])}")
             plot_style = get_plot_style()
-            line1 = ax1.plot(
+            line1 = plot_downsampler.plot(
+                ax1,
                 x,
                 df_all[param],
                 label=param,
@@ -1170,7 +1250,8 @@ def plot_selected(event=None):
                 
                 print(f"추가 파라미터 플롯: {param}, X축 길이: {len(x)}, Y축 길이: {len(df_all[param])}")
                 plot_style = get_plot_style()
-                line = new_ax.plot(
+                line = plot_downsampler.plot(
+                    new_ax,
                     x,
                     df_all[param],
                     label=param,
@@ -1212,7 +1293,7 @@ def plot_selected(event=None):
     else:
         # 단일 파라미터는 기존 로직 유지
         plot_style = get_plot_style()
-        single_lines = ax.plot(x, df_all[yvar], picker=5, **plot_style)
+        single_lines = plot_downsampler.plot(ax, x, df_all[yvar], picker=5, **plot_style)
         for created_line in single_lines:
             color_hex = mcolors.to_hex(created_line.get_color())
             artist_colors[created_line] = color_hex
@@ -1232,21 +1313,9 @@ def plot_selected(event=None):
     if plc_error_col:
         error_mask = df_all[plc_error_col] == 1
         if error_mask.any():
-            in_error = False
-            error_start = None
-            
-            for time_val, is_error in zip(df_all['datetime'], error_mask):
-                if is_error and not in_error:
-                    error_start = time_val
-                    in_error = True
-                elif not is_error and in_error:
-                    if error_start is not None:
-                        ax.axvspan(error_start, time_val, alpha=0.2, color='orange', label='PLC Error')
-                    in_error = False
-            
-            if in_error:
-                if error_start is not None:
-                    ax.axvspan(error_start, df_all['datetime'].iloc[-1], alpha=0.2, color='orange', label='PLC Error')
+            # 구간 계산은 벡터 연산, 표시는 PolyCollection 하나 (줌 시 보이는 구간만 합쳐 갱신)
+            plc_error_spans = ErrorSpanCollection(ax, df_all['datetime'].values, error_mask.values)
+            print(f"PLC Error 구간: {len(plc_error_spans)}개")
         
         print(f"PLC Error 구간 표시: {error_mask.sum()} 포인트")
 
@@ -1263,7 +1332,8 @@ def plot_selected(event=None):
     # ax1, ax2 설정 (Laser & EUV Power의 경우 ax1이 ax이고 ax2는 twinx)
     onselect_func = create_onselect_function_with_context(root, custom_params, df_all, yvar, ax, fig, 
                                                           ax1=ax if yvar == "Laser & EUV Power" else None, 
-                                                          ax2=ax2 if 'ax2' in locals() or 'ax2' in globals() else None)
+                                                          ax2=ax2 if 'ax2' in locals() or 'ax2' in globals() else None,
+                                                          time_index=df_time_index)
     span = SpanSelector(ax, onselect_func, 'horizontal', useblit=True, props=dict(alpha=0.3, facecolor='red'))
     # SpanSelector 객체가 가비지 컬렉션으로 사라지지 않도록 figure에 참조를 보관
     setattr(fig, "_span_selector", span)
@@ -1574,20 +1644,17 @@ def plot_selected(event=None):
             
             print(f"현재 화면 시간 범위: {dt_min} ~ {dt_max}")
             
-            # 현재 화면에 표시된 시간 범위의 데이터만 필터링
+            # 현재 화면에 표시된 시간 범위의 데이터만 필터링 (이진 탐색)
             # matplotlib 한계로 인해 경계 값이 살짝 잘리는 경우가 있어 여유 구간을 둔다.
             epsilon = pd.Timedelta(seconds=1)
             dt_min_adj = dt_min - epsilon
             dt_max_adj = dt_max + epsilon
-            mask_visible = (df_all['datetime'] >= dt_min_adj) & (df_all['datetime'] <= dt_max_adj)
-
-            if not mask_visible.any():
-                # 여유 범위 내에 데이터가 없다면 가장 가까운 상한선을 사용해 재시도한다.
-                nearest_max = df_all.loc[df_all['datetime'] >= dt_min, 'datetime'].max()
-                if pd.notna(nearest_max):
-                    mask_visible = (df_all['datetime'] >= dt_min_adj) & (df_all['datetime'] <= nearest_max)
+            df_visible = df_time_index.select(df_all, dt_min_adj, dt_max_adj)
 
-            df_visible = df_all[mask_visible].copy()
+            nearest_max = df_time_index.max_ns
+            if df_visible.empty and nearest_max is not None and df_time_index.count(dt_min, nearest_max) > 0:
+                # 여유 범위 내에 데이터가 없다면 가장 가까운 상한선(마지막 시각)을 사용해 재시도한다.
+                df_visible = df_time_index.select(df_all, dt_min_adj, nearest_max)
             
             print(f"필터링된 데이터 포인트: {len(df_visible)}개 (전체: {len(df_all)}개)")
             
@@ -1962,6 +2029,288 @@ btn_event_log.pack(pady=5)
 btn_plot = ttk.Button(frame, text="선택한 파라미터 플롯하기", command=plot_selected)
 btn_plot.pack(pady=10)
 
+# 백그라운드 데이터 로드 진행 표시 (진행 표시줄 + 상태 + 취소 버튼)
+load_progress_frame = ttk.Frame(frame)
+load_progress_frame.pack(fill=tk.X, pady=(0, 5))
+load_progress_var = tk.DoubleVar(value=0)
+load_status_var = tk.StringVar(value="")
+load_progress_bar = ttk.Progressbar(load_progress_frame, variable=load_progress_var, maximum=100, length=300)
+load_progress_bar.pack(side=tk.LEFT, padx=(0, 5))
+btn_cancel_load = ttk.Button(load_progress_frame, text="로드 취소", command=cancel_current_load, state=tk.DISABLED)
+btn_cancel_load.pack(side=tk.LEFT, padx=(0, 5))
+progressive_plot_var = tk.BooleanVar(value=True)
+ttk.Checkbutton(load_progress_frame, text="로딩 중 점진적 표시", variable=progressive_plot_var).pack(side=tk.LEFT, padx=(0, 5))
+carry_plc_state_var = tk.BooleanVar(value=False)
+ttk.Checkbutton(load_progress_frame, text="날짜 경계 PLC 상태 이어받기", variable=carry_plc_state_var).pack(side=tk.LEFT, padx=(0, 5))
+ttk.Label(load_progress_frame, textvariable=load_status_var, font=('Arial', 9), foreground='gray').pack(side=tk.LEFT)
+
+
+# 카탈로그 갱신 작업 (플롯 로드와 별개로 실행)
+catalog_refresh_job = None
+
+
+def start_catalog_refresh():
+    """폴더 카탈로그를 작업 스레드에서 갱신하고, 완료되면 전체 파일의 컬럼 합집합을 파라미터 리스트에 반영"""
+    global catalog_refresh_job
+    if catalog_refresh_job is not None and catalog_refresh_job.running:
+        catalog_refresh_job.cancel()
+
+    files = list(db_files)
+    known_cols = list(df_sample.columns)
+
+    def on_done(catalog):
+        global db_catalog
+        if job is not catalog_refresh_job or files != db_files:
+            return  # 그 사이 데이터 소스가 바뀜
+        db_catalog = catalog
+        extra_cols = [c for c in get_catalog_extra_columns(catalog, known_cols, time_cols) if c not in num_cols]
+        if not extra_cols:
+            return
+        num_cols.extend(extra_cols)
+        if "------ 나머지 파라미터 ------" not in var_list.get(0, tk.END):
+            var_list.insert(tk.END, "------ 나머지 파라미터 ------")
+        for col in extra_cols:
+            var_list.insert(tk.END, col)
+        print(f"다른 파일에만 있는 컬럼 추가: {len(extra_cols)}개 (파라미터 {len(num_cols)}개)")
+
+    def on_error(exc):
+        print(f"카탈로그 갱신 실패: {exc}")
+
+    job = BackgroundLoadJob(root, lambda progress, _cancel: refresh_catalog(files, progress),
+                            on_done, on_error=on_error)
+    catalog_refresh_job = job
+    job.start()
+
+
+# 실시간 추적 상태 (오늘 날짜 DB의 새 행만 주기적으로 읽어 미리보기 figure에 이어 붙임)
+live_follow = None  # {'follower', 'plot', 'param_conditions', 'logic', 'condition', 'condition_cols', 'job', 'after_id'}
+
+
+def toggle_live_follow():
+    """선택한 파라미터의 오늘 날짜 DB 실시간 추적 시작/중지"""
+    global live_follow
+    if live_follow is not None:
+        stop_live_follow()
+        return
+
+    sel = var_list.curselection()
+    if not sel:
+        return
+    plot_var = var_list.get(sel[0])
+    if plot_var.startswith("------"):
+        return
+
+    param_conditions = {}
+    logic = 'AND'
+    if plot_var in custom_params:
+        param_info = custom_params[plot_var]
+        params_to_read = param_info['params']
+        param_conditions = param_info.get('param_conditions', {})
+        logic = param_info.get('logic', 'AND')
+    elif plot_var == "Laser & EUV Power":
+        params_to_read = ["laser_power_value", "euvChamber_euvPower_value"]
+    else:
+        params_to_read = [plot_var]
+
+    live_files = [f for f in db_files if is_live_file(f)]
+    if not live_files:
+        messagebox.showinfo("실시간 추적", "오늘 날짜의 DB 파일이 없습니다.")
+        return
+    follower = DbTailFollower(live_files[-1], params_to_read, time_cols)
+    if not follower.is_valid:
+        messagebox.showinfo("실시간 추적", f"{os.path.basename(live_files[-1])}에 선택한 파라미터가 없습니다.")
+        return
+    try:
+        build_condition_expr(param_conditions, logic)  # threshold 형식 확인
+    except ValueError as e:
+        messagebox.showerror("오류", str(e))
+        return
+
+    print(f"📡 실시간 추적 시작: {os.path.basename(follower.db_path)} ({plot_var})")
+    live_plot = ProgressivePlot(plot_var, params_to_read, status_label="실시간", frame_unit="조회",
+                                window_title=f"Live: {plot_var}")
+    live_follow = {'follower': follower, 'plot': live_plot, 'param_conditions': param_conditions, 'logic': logic,
+                   'condition': None, 'condition_cols': None, 'job': None, 'after_id': None}
+    btn_live_follow.config(text="⏹ 실시간 추적 중지")
+    _poll_live_follow()
+
+
+def _poll_live_follow():
+    """새 행 조회를 작업 스레드에서 실행하고 결과를 figure에 이어 붙인 뒤 다음 조회 예약"""
+    state = live_follow
+    if state is None:
+        return
+    state['after_id'] = None
+    if not state['plot'].is_open:
+        stop_live_follow()
+        return
+
+    def poll_work(_progress, _cancel):
+        df_new = state['follower'].poll()
+        if df_new is None:
+            return None
+        # 오늘 파일에 없는 파라미터의 조건은 건너뜀 (컬럼 구성이 바뀔 때만 조건식을 다시 만듦)
+        columns = set(df_new.columns)
+        if columns != state['condition_cols']:
+            state['condition'] = build_condition_expr(state['param_conditions'], state['logic'], columns)
+            state['condition_cols'] = columns
+        if state['condition'] is not None:
+            df_new = df_new.filter(state['condition'])
+        return df_new
+
+    def on_done(df_new):
+        if live_follow is not state:
+            return  # 중지된 추적의 결과는 버림
+        if df_new is not None and df_new.height:
+            state['plot'].add_frame(df_new)
+            state['plot'].redraw()
+            load_status_var.set(f"실시간 추적: {os.path.basename(state['follower'].db_path)} "
+                                f"{state['follower'].rows_read:,} 행")
+        state['after_id'] = root.after(FOLLOW_INTERVAL_MS, _poll_live_follow)
+
+    def on_error(e):
+        if live_follow is state:
+            stop_live_follow()
+            messagebox.showerror("오류", f"실시간 추적 중 오류가 발생했습니다:\n{e}")
+
+    state['job'] = BackgroundLoadJob(root, poll_work, on_done, on_error=on_error).start()
+
+
+def stop_live_follow():
+    """실시간 추적 중지 (figure는 마지막 상태로 남겨 둠)"""
+    global live_follow
+    state = live_follow
+    live_follow = None
+    btn_live_follow.config(text="📡 실시간 추적 (오늘)")
+    if state is None:
+        return
+    if state['after_id'] is not None:
+        root.after_cancel(state['after_id'])
+    state['plot'].finish("추적 중지")
+    print(f"📡 실시간 추적 중지: {state['follower'].rows_read:,} 행 읽음")
+
+
+btn_live_follow = ttk.Button(frame, text="📡 실시간 추적 (오늘)", command=toggle_live_follow)
+btn_live_follow.pack(pady=(0, 5))
+
+
+def plot_overview():
+    """선택한 파라미터의 장기간 개요 플롯 (롤업 min/max 범위 + 평균, 조건 필터 미적용)"""
+    global current_load_job
+
+    sel = var_list.curselection()
+    if not sel:
+        return
+    overview_var = var_list.get(sel[0])
+    if overview_var.startswith("------"):
+        return
+
+    if overview_var in custom_params:
+        params_to_read = custom_params[overview_var]['params']
+    elif overview_var == "Laser & EUV Power":
+        params_to_read = ["laser_power_value", "euvChamber_euvPower_value"]
+    else:
+        params_to_read = [overview_var]
+
+    try:
+        window_start, window_end = parse_time_window(time_start_var.get(), time_end_var.get())
+    except ValueError as e:
+        messagebox.showerror("오류", str(e))
+        return
+
+    # 이전 로드가 진행 중이면 취소하고 새로 시작 (이전 결과와 미리보기 창은 버림)
+    _cancel_superseded_load()
+
+    candidate_files = filter_files_by_date(db_files, window_start, window_end, db_date_index)
+    overview_time_cols = list(time_cols)
+
+    def overview_work(progress_callback, cancel_event):
+        # CNT 판정과 롤업 조회(없으면 생성)는 파일 수에 비례하므로 작업 스레드에서 실행
+        files = [f for f in candidate_files if not is_cnt_related_data(f, params_to_read)]
+        if not files:
+            return None
+
+        # 표시 구간 길이에 맞는 롤업 단계 선택 (파라미터당 수천 점 이내)
+        file_dates = [d for d in (extract_date_from_filename(f) for f in files) if d is not None]
+        span_start = window_start or (min(file_dates) if file_dates else None)
+        span_end = window_end or (max(file_dates) + datetime.timedelta(days=1) if file_dates else None)
+        if span_start is not None and span_end is not None:
+            span_seconds = (span_end - span_start).total_seconds()
+        else:
+            span_seconds = len(files) * 86400
+        level = choose_rollup_level(span_seconds)
+        print(f"개요 플롯: {overview_var}, {len(files)}개 파일, 롤업 단계 {level}")
+
+        df_rollup = query_rollups(files, params_to_read, overview_time_cols, level, window_start, window_end,
+                                  progress_callback=progress_callback, cancel_event=cancel_event)
+        return level, df_rollup
+
+    def on_done(result):
+        if job is not current_load_job:
+            return  # 취소 요청 전에 끝난 이전 작업의 결과는 버림
+        _finish_load_job(job)
+        if result is None or result[1] is None or result[1].height == 0:
+            messagebox.showwarning("경고", "적합한 데이터가 없습니다.")
+            return
+        show_overview_plot(overview_var, params_to_read, *result)
+
+    def on_error(e):
+        _finish_load_job(job, "개요 로드 실패")
+        messagebox.showerror("오류", f"개요 데이터 로드 중 오류가 발생했습니다:\n{e}")
+
+    def on_cancelled():
+        _finish_load_job(job, "로드 취소됨")
+
+    job = BackgroundLoadJob(root, overview_work, on_done, on_error=on_error,
+                            on_progress=_update_load_progress, on_cancelled=on_cancelled)
+    current_load_job = job
+    load_progress_var.set(0)
+    load_status_var.set(f"{overview_var}: 개요 롤업 로드 중...")
+    btn_cancel_load.config(state=tk.NORMAL)
+    job.start()
+
+
+def show_overview_plot(overview_var, params_to_read, level, df_rollup):
+    """롤업 결과로 개요 플롯 생성 (Tk 스레드)"""
+    fig, ax_overview = plt.subplots(figsize=(12, 6))
+    try:
+        if fig.canvas.manager is not None:
+            fig.canvas.manager.set_window_title(f"Overview: {overview_var}")
+    except Exception:
+        pass
+
+    colors = ['tab:blue', 'tab:orange', 'tab:green', 'tab:red', 'tab:purple', 'tab:brown', 'tab:pink', 'tab:gray']
+    buckets = df_rollup['bucket'].to_numpy()
+    handles = []
+    for i, param in enumerate(p for p in params_to_read if f"{p}__mean" in df_rollup.columns):
+        target_ax = ax_overview if i == 0 else ax_overview.twinx()
+        if i > 1:
+            target_ax.spines['right'].set_position(('outward', 60 * (i - 1)))
+        color = colors[i % len(colors)]
+        target_ax.fill_between(
+            buckets,
+            df_rollup[f"{param}__min"].to_numpy(),
+            df_rollup[f"{param}__max"].to_numpy(),
+            color=color, alpha=0.2, linewidth=0,
+        )
+        handles += target_ax.plot(buckets, df_rollup[f"{param}__mean"].to_numpy(), color=color, linewidth=1, label=param)
+        target_ax.set_ylabel(param, color=color)
+        target_ax.tick_params(axis='y', labelcolor=color)
+
+    ax_overview.legend(handles=handles, loc='upper left')
+    ax_overview.set_title(f"{overview_var} 개요 ({level} 롤업: 평균 + min/max 범위, {df_rollup.height:,} 구간)")
+    ax_overview.set_xlabel("Time")
+    ax_overview.grid(True)
+    ax_overview.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))
+    fig.autofmt_xdate()
+    fig.tight_layout()
+    plt.show()
+
+
+# 개요 플롯 버튼 추가 (롤업 기반, 긴 기간용)
+btn_overview = ttk.Button(frame, text="개요 플롯 (장기간)", command=plot_overview)
+btn_overview.pack(pady=5)
+
 # 탭 2: CNT 데이터 플롯 탭 추가
 cnt_tab = ttk.Frame(notebook)
 notebook.add(cnt_tab, text="CNT 데이터 플롯")
@@ -1999,5 +2348,6 @@ btn_work_log.pack(pady=5)
 # 작업 로그 관리자 초기화 완료 (work_log_manager에서 초기화 정보 출력됨)
 
 print("tkinter 메인루프 시작")
+start_catalog_refresh()
 root.mainloop()
 print("프로그램 종료")
\ No newline at end of file
@@ -5,11 +5,116 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from time_index import TimeIndex, num_to_ns
+from range_stats import RangeStats
+
+
+# m_i 판정 임계값 (P, EUV가 이 값보다 커야 적분 가능)
+POWER_EPSILON = 1e-10
+
+# 시간 간격이 이 값(초) 이상이면 세그먼트 분리
+TIME_GAP_THRESHOLD = 2.0
+
+
+class IntegrationIndex:
+    """
+    Laser & EUV Power 적분용 누적 인덱스 (플롯당 한 번 O(n) 생성)
+    
+    m_i = {1, if P_i > 0 AND EUV_i > 0; 0, otherwise}
+    v_i = m_i * m_{i+1} (단, t_{i+1} - t_i >= 2초이면 v_i = 0)
+    v_i = 1인 연속 구간이 하나의 세그먼트이며, v 구간 [s, e)는 포인트 s ~ e에 해당합니다.
+    
+    v를 적용한 사다리꼴 에너지/적분 시간과 파워의 누적합, v = 1 구간(run) 경계를 미리 계산해 두므로
+    포인트 구간 [lo, hi)의 총 에너지/샷수는 O(1), 세그먼트 정보는 O(log n + 세그먼트 수)로 계산됩니다.
+    """
+    
+    def __init__(self, t, P, EUV):
+        """
+        초기화
+        Args:
+            t: np.ndarray, time array [s] (정렬됨)
+            P: np.ndarray, laser power array [W]
+            EUV: np.ndarray, EUV signal array
+        """
+        t = np.asarray(t, dtype=float)
+        # NaN을 0으로 처리 (NaN도 0으로 인식)
+        P_clean = np.nan_to_num(np.asarray(P, dtype=float), nan=0.0)
+        EUV_clean = np.nan_to_num(np.asarray(EUV, dtype=float), nan=0.0)
+        
+        # 조건 마스크 m_i 정의 (P=0, EUV=0, P<0, EUV<0, NaN은 모두 m = 0)
+        m = (P_clean > POWER_EPSILON) & (EUV_clean > POWER_EPSILON)
+        
+        # v_i = m_i * m_{i+1} (연속성 체크)
+        # 시간 간격이 큰 경우 v를 0으로 강제 설정 (데이터 수집 중단 구간에서 세그먼트 분리)
+        dt = np.diff(t)
+        v = m[:-1] & m[1:] & (dt < TIME_GAP_THRESHOLD)
+        
+        # E_i = v_i * (P_i + P_{i+1})/2 * Δt_i 의 누적합 (cum_energy[k] = Σ_{i<k} E_i)
+        P_avg = 0.5 * (P_clean[:-1] + P_clean[1:])
+        self.cum_energy = np.concatenate(([0.0], np.cumsum(np.where(v, P_avg * dt, 0.0))))
+        self.cum_time = np.concatenate(([0.0], np.cumsum(np.where(v, dt, 0.0))))
+        self.cum_power = np.concatenate(([0.0], np.cumsum(P_clean)))
+        
+        # v = 1인 연속 구간의 경계: v 인덱스 [run_start, run_end)
+        edges = np.diff(np.concatenate(([0], v.view(np.int8), [0])))
+        self.run_start = np.flatnonzero(edges == 1)
+        self.run_end = np.flatnonzero(edges == -1)
+        self.n = len(t)
+    
+    def __len__(self):
+        return self.n
+    
+    def query(self, lo, hi, E_pulse):
+        """
+        포인트 구간 [lo, hi)의 총 에너지/샷수 및 적분 세그먼트
+        
+        Returns:
+            dict: E_total(총 에너지 [J]), N_shots(총 샷수),
+                  seg_start/seg_end(세그먼트 표시 시작/끝 포인트 인덱스 배열),
+                  integral_time(세그먼트별 적분 시간 [s]), integral_points(세그먼트별 포인트 수),
+                  avg_power(세그먼트별 평균 파워 [W])
+            세그먼트 표시 끝과 평균 파워는 기존 표시와 같이 마지막 v 인덱스의 포인트(seg_end)까지 기준입니다.
+        """
+        # 포인트 [lo, hi)에 해당하는 v 인덱스는 [lo, hi - 1)
+        v_hi = max(lo, hi - 1)
+        E_total = float(self.cum_energy[v_hi] - self.cum_energy[lo])
+        
+        # 구간과 겹치는 run만 골라 구간 경계로 자름
+        k0 = np.searchsorted(self.run_end, lo, side='right')
+        k1 = np.searchsorted(self.run_start, v_hi, side='left')
+        seg_start = np.maximum(self.run_start[k0:k1], lo)
+        seg_v_end = np.minimum(self.run_end[k0:k1], v_hi)  # v 구간 끝(미포함)
+        
+        return {
+            'E_total': E_total,
+            'N_shots': E_total / E_pulse,
+            'seg_start': seg_start,
+            'seg_end': seg_v_end - 1,
+            'integral_time': self.cum_time[seg_v_end] - self.cum_time[seg_start],
+            'integral_points': seg_v_end - seg_start + 1,
+            'avg_power': (self.cum_power[seg_v_end] - self.cum_power[seg_start]) / (seg_v_end - seg_start),
+        }
+
+
+def compute_integration_segments(t, P, EUV, E_pulse):
+    """
+    적분 세그먼트 및 총 에너지/샷수 계산 (전체 구간에 대한 IntegrationIndex 질의)
+    
+    Args:
+        t: np.ndarray, time array [s]
+        P: np.ndarray, laser power array [W]
+        EUV: np.ndarray, EUV signal array
+        E_pulse: float, energy per pulse [J]
+        
+    Returns:
+        dict: IntegrationIndex.query 결과
+    """
+    return IntegrationIndex(t, P, EUV).query(0, len(t), E_pulse)
+
 
 def compute_total_energy(t, P, EUV, E_pulse):
     """
@@ -25,50 +130,12 @@ def compute_total_energy(t, P, EUV, E_pulse):
         E_total: float, 총 에너지 [J]
         N_shots: float, 총 샷수
     """
-    # NaN을 0으로 처리 (NaN도 0으로 인식)
-    P_clean = np.where(np.isnan(P), 0, P)
-    EUV_clean = np.where(np.isnan(EUV), 0, EUV)
-    
-    # 조건 마스크 m_i 정의: m_i = {1, if P_i > 0 AND EUV_i > 0; 0, otherwise}
-    # np.where는 조건이 True면 1, False면 0을 반환하므로 모든 경우가 명시적으로 처리됨
-    # - P > 0 AND EUV > 0 → m = 1
-    # - P <= 0 OR EUV <= 0 → m = 0 (P=0, EUV=0, P<0, EUV<0, NaN 모두 포함)
-    epsilon = 1e-10
-    m = np.where((P_clean > epsilon) & (EUV_clean > epsilon), 1, 0)
-    
-    # v_i = m_i * m_{i+1} (연속성 체크)
-    v = m[:-1] * m[1:]
-    
-    # 시간 간격이 큰 경우 v를 0으로 강제 설정 (세그먼트 분리)
-    # 이유: P와 EUV가 모두 > 0이어서 m=1이지만, 실제로는 데이터 수집 중단 구간이 있을 수 있음
-    # - 시간 간격 >= 임계값(2초)인 경우 → v = 0으로 설정
-    # - 이렇게 하면 시간 간격이 2초 이상인 지점에서 세그먼트가 분리됨
-    dt_array = np.diff(t) if len(t) > 1 else np.array([0])
-    if len(dt_array) > 0:
-        # 임계값: 2초 (2초 이상이면 세그먼트 분리)
-        time_gap_threshold = 2.0
-        # 큰 시간 간격이 있는 위치 찾기 (2초 이상)
-        large_gap_mask = dt_array >= time_gap_threshold
-        
-        # 큰 시간 간격이 있는 위치에서 v=0으로 강제 설정 (세그먼트 분리)
-        v[large_gap_mask] = 0
-    
-    # Δt_i = t_{i+1} - t_i
-    dt = np.diff(t)
-    
-    # (P_i + P_{i+1}) / 2 (P_clean 사용)
-    P_avg = 0.5 * (P_clean[:-1] + P_clean[1:])
-    
-    # E_total = Σ v_i * (P_i + P_{i+1})/2 * Δt_i
-    E_total = np.sum(v * P_avg * dt)
-    
-    # N_shots = E_total / E_pulse
-    N_shots = E_total / E_pulse
-    
-    return E_total, N_shots
+    result = compute_integration_segments(t, P, EUV, E_pulse)
+    return result['E_total'], result['N_shots']
 
 
-def create_onselect_function_with_context(root, custom_params, df_all, yvar, ax, fig, ax1=None, ax2=None):
+def create_onselect_function_with_context(root, custom_params, df_all, yvar, ax, fig, ax1=None, ax2=None,
+                                          time_index=None):
     """
     컨텍스트를 캡처하는 구간 선택 분석 함수를 생성하는 팩토리 함수
     
@@ -81,6 +148,7 @@ def create_onselect_function_with_context(root, custom_params, df_all, yvar, ax,
         fig: matplotlib figure
         ax1: 첫 번째 축 (선택사항, Laser & EUV Power용)
         ax2: 두 번째 축 (선택사항, Laser & EUV Power용)
+        time_index: df_all['datetime']의 TimeIndex (없으면 여기서 한 번 생성)
         
     Returns:
         onselect 함수
@@ -89,11 +157,47 @@ def create_onselect_function_with_context(root, custom_params, df_all, yvar, ax,
     if ax1 is None:
         ax1 = ax
     
+    # 드래그마다 전체 마스크를 만들지 않도록 시간 인덱스는 한 번만 생성 (선택은 이진 탐색)
+    if time_index is None:
+        time_index = TimeIndex.from_frame(df_all)
+    if not time_index.is_sorted:
+        df_all = df_all[df_all['datetime'].notna()].sort_values('datetime').reset_index(drop=True)
+        time_index = TimeIndex.from_frame(df_all)
+    
+    # 컬럼별 구간 통계/적분 인덱스는 처음 쓸 때 한 번만 만들고 이후 드래그는 상수 시간 질의
+    range_stats_cache = {}
+    integration_cache = {}
+    
+    def get_range_stats(col):
+        """컬럼의 RangeStats (df_all 행 순서)"""
+        if col not in range_stats_cache:
+            values = pd.to_numeric(df_all[col], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+            range_stats_cache[col] = RangeStats(values)
+        return range_stats_cache[col]
+    
+    def get_integration_index():
+        """
+        레이저/EUV 파워가 모두 있는 행만으로 만든 IntegrationIndex
+        
+        Returns:
+            tuple: (유효 행 위치 배열, 유효 행 datetime64 배열, IntegrationIndex 또는 None)
+        """
+        if 'index' not in integration_cache:
+            P = pd.to_numeric(df_all['laser_power_value'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+            EUV = pd.to_numeric(df_all['euvChamber_euvPower_value'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+            valid_pos = np.flatnonzero(~np.isnan(P) & ~np.isnan(EUV))
+            times = df_all['datetime'].values[valid_pos]
+            index = None
+            if len(valid_pos) >= 2:
+                t = (times - times[0]) / np.timedelta64(1, 's')
+                index = IntegrationIndex(t, P[valid_pos], EUV[valid_pos])
+            integration_cache['index'] = (valid_pos, times, index)
+        return integration_cache['index']
+    
     def onselect_with_context(xmin, xmax):
         try:
-            dt_min = mdates.num2date(xmin).replace(tzinfo=None)
-            dt_max = mdates.num2date(xmax).replace(tzinfo=None)
-            df_sel = df_all[(df_all['datetime'] >= dt_min) & (df_all['datetime'] <= dt_max)]
+            lo, hi = time_index.bounds(num_to_ns(xmin), num_to_ns(xmax))
+            df_sel = df_all.iloc[lo:hi]
             
             if len(df_sel) < 2:
                 plt.pause(0.01)
@@ -112,173 +216,38 @@ def create_onselect_function_with_context(root, custom_params, df_all, yvar, ax,
             
             if yvar == "Laser & EUV Power":
                 # laser_power_value와 euvChamber_euvPower_value 컬럼이 있는지 확인
-                required_cols = ['laser_power_value', 'euvChamber_euvPower_value']
-                missing_cols = [col for col in required_cols if col not in df_sel.columns]
-                
-                if 'laser_power_value' not in df_sel.columns or df_sel['laser_power_value'].isna().all():
+                if 'laser_power_value' not in df_all.columns or get_range_stats('laser_power_value').count(lo, hi) == 0:
                     messagebox.showinfo("선택 구간 정보", msg + "\n\n레이저 파워 데이터가 없어 샷수 계산을 할 수 없습니다.")
                     return
                 
-                if 'euvChamber_euvPower_value' not in df_sel.columns or df_sel['euvChamber_euvPower_value'].isna().all():
+                if 'euvChamber_euvPower_value' not in df_all.columns or get_range_stats('euvChamber_euvPower_value').count(lo, hi) == 0:
                     messagebox.showinfo("선택 구간 정보", msg + "\n\nEUV 파워 데이터가 없어 샷수 계산을 할 수 없습니다.")
                     return
                 
-                # 데이터 정렬 및 NaN 제거
-                df_processed = df_sel.sort_values('datetime').reset_index(drop=True)
-                
-                # 유효한 데이터만 필터링 (둘 다 NaN이 아닌 경우)
-                valid_mask = df_processed['laser_power_value'].notna() & df_processed['euvChamber_euvPower_value'].notna()
-                df_valid = df_processed[valid_mask].copy()
+                # 유효한 데이터(둘 다 NaN이 아닌 행) 중 선택 구간 [lo, hi)에 해당하는 범위 [a, b)
+                valid_pos, times, integration_index = get_integration_index()
+                a = int(np.searchsorted(valid_pos, lo))
+                b = int(np.searchsorted(valid_pos, hi))
                 
-                if len(df_valid) < 2:
+                if integration_index is None or b - a < 2:
                     messagebox.showinfo("선택 구간 정보", msg + "\n\n유효한 레이저 파워 및 EUV 파워 데이터가 부족합니다.")
                     return
                 
-                # 시간 배열 (초 단위)
-                t = (df_valid['datetime'] - df_valid['datetime'].iloc[0]).dt.total_seconds().values
-                P = df_valid['laser_power_value'].values
-                EUV = df_valid['euvChamber_euvPower_value'].values
-                
-                # NaN이 있는 경우 제거 (추가 안전장치)
-                valid_indices = ~(np.isnan(t) | np.isnan(P) | np.isnan(EUV))
-                if valid_indices.sum() < 2:
-                    messagebox.showinfo("선택 구간 정보", msg + "\n\n유효한 데이터 포인트가 부족합니다.")
-                    return
-                
-                t = t[valid_indices]
-                P = P[valid_indices]
-                EUV = EUV[valid_indices]
-                
-                # NaN을 0으로 처리
-                P_clean = np.where(np.isnan(P), 0, P)
-                EUV_clean = np.where(np.isnan(EUV), 0, EUV)
-                
-                # 새로운 논리로 총 에너지 및 샷수 계산
+                # 총 에너지, 샷수 및 적분 세그먼트 (누적합 인덱스 질의)
                 E_pulse = 5e-4  # 0.0005 J = 500 μJ
-                E_total, N_shots = compute_total_energy(t, P_clean, EUV_clean, E_pulse)
-                
-                # 적분되는 세그먼트 찾기
-                # 
-                # 1단계: Power 데이터 기반으로 m_i 정의
-                # m_i = {1, if P_i > 0 AND EUV_i > 0; 0, otherwise}
-                # - P > 0 AND EUV > 0 → m = 1 (적분 가능)
-                # - P <= 0 OR EUV <= 0 → m = 0 (적분 불가)
-                epsilon = 1e-10
-                m = np.where((P_clean > epsilon) & (EUV_clean > epsilon), 1, 0)
-                
-                # 2단계: m 기반으로 v_i 계산 (원래 정의)
-                # v_i = m_i * m_{i+1} (연속성 체크)
-                # - v_i = 1: 포인트 i와 i+1이 모두 적분 가능 (m[i] = 1 AND m[i+1] = 1)
-                # - v_i = 0: 포인트 i 또는 i+1 중 하나라도 적분 불가 (m[i] = 0 OR m[i+1] = 0)
-                dt_array = np.diff(t) if len(t) > 1 else np.array([0])
-                v = m[:-1] * m[1:]
-                
-                # 3단계: 시간 간격이 큰 경우 v를 0으로 강제 설정 (세그먼트 분리)
-                # 이유: P와 EUV가 모두 > 0이어서 m=1이지만, 실제로는 데이터 수집 중단 구간이 있을 수 있음
-                # - 시간 간격 >= 임계값(2초)인 경우 → v = 0으로 설정
-                # - 이렇게 하면 시간 간격이 2초 이상인 지점에서 세그먼트가 분리됨
-                # 
-                # 즉, v = 0의 최종 정의:
-                #   (1) Power 데이터 기반: m[i] = 0 OR m[i+1] = 0 → v[i] = 0
-                #   (2) 시간 간격 기반: dt[i] >= 2초 → v[i] = 0 (강제 설정)
-                if len(dt_array) > 0:
-                    # 임계값: 2초 (2초 이상이면 세그먼트 분리)
-                    time_gap_threshold = 2.0
-                    # 큰 시간 간격이 있는 위치 찾기 (2초 이상)
-                    large_gap_mask = dt_array >= time_gap_threshold
-                    
-                    # 큰 시간 간격이 있는 위치에서 v=0으로 강제 설정 (세그먼트 분리)
-                    v[large_gap_mask] = 0
-                    
-                
-                # v_i = 1인 연속된 구간을 세그먼트로 찾기 (v 기준으로 세그먼트 정의)
-                # v_i = 0이 되면 세그먼트가 끝남
-                segments = []
-                segment_start_idx = None
-                
-                for i in range(len(v)):
-                    if v[i] == 1:
-                        # v_i = 1인 경우 - 연속된 적분 구간 내부
-                        if segment_start_idx is None:
-                            segment_start_idx = i  # 세그먼트 시작
-                    else:
-                        # v_i = 0인 경우 - 세그먼트 종료
-                        if segment_start_idx is not None:
-                            # v[segment_start_idx:i] = 1인 구간이 세그먼트
-                            # v[i] = 0이므로 세그먼트는 segment_start_idx부터 i-1까지
-                            segment_end_idx = i - 1  # 마지막 v 인덱스 (i-1)
-                            segments.append((segment_start_idx, segment_end_idx))
-                            segment_start_idx = None
-                
-                # 마지막 세그먼트 처리
-                if segment_start_idx is not None:
-                    segment_end_idx = len(v) - 1  # v의 마지막 인덱스
-                    segments.append((segment_start_idx, segment_end_idx))
-                
-                # 세그먼트 정보 수집 (v = 1인 구간 기준)
-                segment_info_list = []
-                total_integral_time = 0
-                total_integral_points = 0
-                
-                # dt_array 재계산 (v 기준 세그먼트에 맞게)
-                dt_array_full = np.diff(t) if len(t) > 1 else np.array([0])
+                seg_result = integration_index.query(a, b, E_pulse)
+                E_total = seg_result['E_total']
+                N_shots = seg_result['N_shots']
                 
-                for seg_idx, (start_idx, end_idx) in enumerate(segments):
-                    # v 기준 세그먼트: v[start_idx:end_idx+1] = 1인 구간
-                    # v[i] = m[i] * m[i+1]이므로, v[i] = 1이면 포인트 i와 i+1이 연속된 적분 구간
-                    # 따라서 v[start_idx:end_idx+1] = 1이면 포인트 start_idx부터 포인트 end_idx+1까지가 세그먼트
-                    point_start_idx = start_idx
-                    point_end_idx = end_idx + 1  # v 인덱스 end_idx까지이면 포인트 end_idx+1까지
-                    
-                    # 포인트 인덱스 범위 확인
-                    if point_end_idx > len(df_valid):
-                        point_end_idx = len(df_valid)
-                    
-                    # 세그먼트의 시작과 끝 시간 (포인트 기준)
-                    seg_start_datetime = df_valid['datetime'].iloc[point_start_idx]
-                    seg_end_datetime = df_valid['datetime'].iloc[point_end_idx - 1]  # 마지막 포인트
-                    
-                    # v 기준으로 실제 적분되는 시간 계산 (v = 1인 구간의 dt 합)
-                    # v[start_idx:end_idx+1] = 1인 구간의 dt 합
-                    # dt_array_full[start_idx:end_idx+1]의 합
-                    if end_idx + 1 <= len(dt_array_full):
-                        seg_integral_time = np.sum(dt_array_full[start_idx:end_idx+1])
-                    else:
-                        seg_integral_time = np.sum(dt_array_full[start_idx:])
-                    
-                    # v 기준으로 실제 적분되는 포인트 수 계산
-                    # v[start_idx:end_idx+1] = 1인 구간의 포인트 수
-                    # v 구간이 (end_idx - start_idx + 1)개이면, 포인트는 (end_idx - start_idx + 2)개
-                    seg_integral_points = (end_idx - start_idx + 1) + 1
-                    
-                    # 세그먼트 시간과 포인트 수는 적분 시간과 포인트 수와 동일하게 설정
-                    seg_time = seg_integral_time
-                    seg_points = seg_integral_points
-                    
-                    # 세그먼트 평균 파워 - 세그먼트 내 모든 포인트의 평균
-                    seg_point_indices = np.arange(point_start_idx, point_end_idx)
-                    seg_P = P_clean[seg_point_indices]
-                    seg_avg_power = np.mean(seg_P) if len(seg_P) > 0 else 0.0
-                    
-                    segment_info_list.append({
-                        'index': seg_idx + 1,
-                        'start': seg_start_datetime,
-                        'end': seg_end_datetime,
-                        'duration': seg_time,  # 적분 시간과 동일
-                        'points': seg_points,  # 적분 포인트 수와 동일
-                        'integral_time': seg_integral_time,
-                        'integral_points': seg_integral_points,
-                        'avg_power': seg_avg_power
-                    })
-                    
-                    total_integral_time += seg_integral_time
-                    total_integral_points += seg_integral_points
+                seg_count = len(seg_result['seg_start'])
+                total_integral_time = float(np.sum(seg_result['integral_time']))
+                total_integral_points = int(np.sum(seg_result['integral_points']))
                 
                 # 구간 정보
-                segment_start = df_valid['datetime'].iloc[0]
-                segment_end = df_valid['datetime'].iloc[-1]
+                segment_start = pd.Timestamp(times[a])
+                segment_end = pd.Timestamp(times[b - 1])
                 segment_duration = (segment_end - segment_start).total_seconds()
-                total_points = len(t)
+                total_points = b - a
                 
                 # 날짜 범위 계산
                 start_date = segment_start.strftime('%Y-%m-%d')
@@ -294,21 +263,22 @@ def create_onselect_function_with_context(root, custom_params, df_all, yvar, ax,
                     f"\n{date_range_text}"
                     f"\n적분되는 총 시간: {total_integral_time:.2f}초"
                     f"\n적분되는 총 포인트 수: {total_integral_points}개"
-                    f"\n적분 세그먼트 수: {len(segments)}개"
+                    f"\n적분 세그먼트 수: {seg_count}개"
                 )
                 
                 # 각 세그먼트 상세 정보
-                if len(segment_info_list) > 0:
-                    msg += "\n\n[세그먼트별 상세 정보]"
-                    for seg_info in segment_info_list:
-                        seg_start_str = seg_info['start'].strftime('%Y-%m-%d %H:%M:%S')
-                        seg_end_str = seg_info['end'].strftime('%Y-%m-%d %H:%M:%S')
-                        msg += (
-                            f"\n세그먼트 {seg_info['index']}: {seg_start_str} ~ {seg_end_str}"
-                            f"\n  적분 시간: {seg_info['integral_time']:.2f}초"
-                            f"\n  적분 포인트 수: {seg_info['integral_points']}개"
-                            f"\n  평균 파워: {seg_info['avg_power']:.3f} W"
+                if seg_count > 0:
+                    seg_start_strs = pd.DatetimeIndex(times[seg_result['seg_start']]).strftime('%Y-%m-%d %H:%M:%S')
+                    seg_end_strs = pd.DatetimeIndex(times[seg_result['seg_end']]).strftime('%Y-%m-%d %H:%M:%S')
+                    seg_lines = ["\n\n[세그먼트별 상세 정보]"]
+                    for seg_idx in range(seg_count):
+                        seg_lines.append(
+                            f"\n세그먼트 {seg_idx + 1}: {seg_start_strs[seg_idx]} ~ {seg_end_strs[seg_idx]}"
+                            f"\n  적분 시간: {seg_result['integral_time'][seg_idx]:.2f}초"
+                            f"\n  적분 포인트 수: {seg_result['integral_points'][seg_idx]}개"
+                            f"\n  평균 파워: {seg_result['avg_power'][seg_idx]:.3f} W"
                         )
+                    msg += "".join(seg_lines)
                 else:
                     msg += "\n\n적분 가능한 세그먼트가 없습니다."
                 
@@ -325,22 +295,25 @@ def create_onselect_function_with_context(root, custom_params, df_all, yvar, ax,
             else:
                 # 단일 파라미터 분석
                 if yvar in df_sel.columns:
-                    param_data = df_sel[yvar].dropna()
-                    if len(param_data) > 1:
-                        time_diff = df_sel['datetime'].diff().dt.total_seconds().dropna()
-                        avg_interval = time_diff.mean()
+                    stats = get_range_stats(yvar)
+                    param_count = stats.count(lo, hi)
+                    if param_count > 1:
+                        # 정렬된 구간이므로 평균 시간 간격 = 전체 시간 차이 / (포인트 수 - 1)
+                        avg_interval = delta_sec / (hi - lo - 1)
                         
-                        param_integral = param_data.mean() * delta_sec
-                        param_avg = param_data.mean()
-                        param_max = param_data.max()
-                        param_min = param_data.min()
+                        param_avg = stats.mean(lo, hi)
+                        param_integral = param_avg * delta_sec
+                        param_std = stats.std(lo, hi)
+                        param_max = stats.max(lo, hi)
+                        param_min = stats.min(lo, hi)
                         
                         msg += f"\n\n{yvar}:\n"
                         msg += f"  적분값: {param_integral:.3f} (단위·초)\n"
                         msg += f"  평균값: {param_avg:.3f}\n"
+                        msg += f"  표준편차: {param_std:.3f}\n"
                         msg += f"  최대값: {param_max:.3f}\n"
                         msg += f"  최소값: {param_min:.3f}\n"
-                        msg += f"  샷수 (데이터 포인트): {len(param_data)}개\n"
+                        msg += f"  샷수 (데이터 포인트): {param_count}개\n"
                         msg += f"  평균 시간 간격: {avg_interval:.3f}초\n"
                         msg += f"  연속 시간 간격: {delta_sec:.2f}초\n"
                 
@@ -348,19 +321,22 @@ def create_onselect_function_with_context(root, custom_params, df_all, yvar, ax,
                     param_list = custom_params[yvar]['params'] if isinstance(custom_params[yvar], dict) else custom_params[yvar]
                     for param in param_list:
                         if param in df_sel.columns:
-                            param_data = df_sel[param].dropna()
-                            if len(param_data) > 1:
-                                param_integral = param_data.mean() * delta_sec
-                                param_avg = param_data.mean()
-                                param_max = param_data.max()
-                                param_min = param_data.min()
+                            stats = get_range_stats(param)
+                            param_count = stats.count(lo, hi)
+                            if param_count > 1:
+                                param_avg = stats.mean(lo, hi)
+                                param_integral = param_avg * delta_sec
+                                param_std = stats.std(lo, hi)
+                                param_max = stats.max(lo, hi)
+                                param_min = stats.min(lo, hi)
                                 
                                 msg += f"\n\n{param}:\n"
                                 msg += f"  적분값: {param_integral:.3f} (단위·초)\n"
                                 msg += f"  평균값: {param_avg:.3f}\n"
+                                msg += f"  표준편차: {param_std:.3f}\n"
                                 msg += f"  최대값: {param_max:.3f}\n"
                                 msg += f"  최소값: {param_min:.3f}\n"
-                                msg += f"  샷수 (데이터 포인트): {len(param_data)}개\n"
+                                msg += f"  샷수 (데이터 포인트): {param_count}개\n"
             
             # 스크롤 가능한 정보 창 표시 (복사 가능)
             def show_scrollable_info(title, message):
@@ -0,0 +1,80 @@
+"""
+datetime 변환 마이크로 벤치마크
+db_file.convert_datetime_vectorized_polars(int64 나노초 엔진)와
+이전 구현(시/분/초 추출 + pl.duration)의 변환 시간을 시간 인코딩별로 비교합니다.
+
+사용법:
+    python bench_datetime.py [행 수]
+"""
+
+import sys
+import time
+import datetime
+
+import numpy as np
+import polars as pl
+
+from db_file import convert_datetime_vectorized_polars
+
+
+BASE_DATE = datetime.datetime(2025, 10, 1)
+REPEAT = 5
+
+
+def legacy_convert_datetime_polars(lf, time_col, base_date):
+    """이전 구현: datetime은 시/분/초를 초로 합쳐 duration, 숫자는 Int64 초로 잘라 duration"""
+    base_date_pl = pl.lit(datetime.datetime(base_date.year, base_date.month, base_date.day)).cast(pl.Datetime)
+    col_dtype = lf.collect_schema().get(time_col)
+    if col_dtype == pl.Datetime:
+        time_seconds = (
+            pl.col(time_col).dt.hour() * 3600
+            + pl.col(time_col).dt.minute() * 60
+            + pl.col(time_col).dt.second()
+            + pl.col(time_col).dt.microsecond() / 1_000_000
+        )
+        datetime_expr = base_date_pl + pl.duration(seconds=time_seconds)
+    else:
+        datetime_expr = base_date_pl + pl.duration(seconds=pl.col(time_col).cast(pl.Int64))
+    return lf.with_columns(datetime_expr.alias("datetime"))
+
+
+def make_inputs(n):
+    """시간 인코딩별 입력 DataFrame (자정 기준 초, 소수 초 포함)"""
+    rng = np.random.default_rng(0)
+    seconds = np.sort(rng.uniform(0, 86400, n)).round(3)
+    stamps = np.datetime64('2025-09-30') + (seconds * 1e9).astype('timedelta64[ns]')
+    df_seconds = pl.DataFrame({'time': seconds})
+    df_datetime = pl.DataFrame({'time': stamps})
+    df_hms = df_datetime.select(pl.col('time').dt.strftime('%H:%M:%S%.3f'))
+    return {'float seconds': df_seconds, 'datetime': df_datetime, 'HH:MM:SS string': df_hms}
+
+
+def best_time(func, df):
+    """REPEAT번 실행한 최소 시간 (초), 실패하면 None"""
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        try:
+            func(df.lazy(), 'time', BASE_DATE).collect()
+        except Exception:
+            return None
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(n):
+    print(f"행 수: {n:,} (최소값 / {REPEAT}회)")
+    print(f"{'인코딩':<18}{'이전 구현':>12}{'ns 엔진':>12}{'배율':>8}  소수 초 유지")
+    for name, df in make_inputs(n).items():
+        t_old = best_time(legacy_convert_datetime_polars, df)
+        t_new = best_time(convert_datetime_vectorized_polars, df)
+        result = convert_datetime_vectorized_polars(df.lazy(), 'time', BASE_DATE).collect()['datetime']
+        keeps_fraction = bool((result.dt.nanosecond() != 0).any())
+        old_text = f"{t_old * 1000:9.1f} ms" if t_old is not None else "   지원 안 함"
+        ratio = f"{t_old / t_new:6.1f}x" if t_old is not None else "     -"
+        print(f"{name:<18}{old_text:>12}{t_new * 1000:9.1f} ms{ratio:>8}  {keeps_fraction}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
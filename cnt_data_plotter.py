@@ -21,6 +21,8 @@ import datetime
 import numpy as np
 import math
 
+from time_index import TimeIndex
+
 # 한글 폰트 설정 (경고 방지)
 import matplotlib
 matplotlib.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
@@ -50,6 +52,7 @@ class CNTDataPlotter:
         self.drag_rect = None
         self.drag_text = None
         self.shift_pressed = False
+        self._time_index_cache = None  # (데이터, 시간 컬럼, TimeIndex)
         
         self.setup_ui()
         self.load_all_files()
@@ -65,40 +68,8 @@ class CNTDataPlotter:
             return
         
         try:
-            # 시간 컬럼 찾기
-            time_columns = [col for col in self.current_data.columns 
-                          if 'time' in col.lower() or 'date' in col.lower() or '시간' in col]
-            
-            if time_columns:
-                time_col = time_columns[0]
-                try:
-                    x_data = pd.to_datetime(self.current_data[time_col])
-                    # matplotlib 날짜를 pandas datetime으로 변환
-                    if isinstance(xmin, (int, float)) and isinstance(xmax, (int, float)):
-                        # matplotlib date number를 datetime으로 변환
-                        xmin_dt = mdates.num2date(xmin).replace(tzinfo=None)
-                        xmax_dt = mdates.num2date(xmax).replace(tzinfo=None) 
-                        # timezone naive로 만들기
-                        if x_data.dt.tz is not None:
-                            x_data = x_data.dt.tz_localize(None)
-                        mask = (x_data >= xmin_dt) & (x_data <= xmax_dt)
-                        print(f"시간 기반 필터링: {xmin_dt} ~ {xmax_dt}, 매칭 데이터: {mask.sum()}개")
-                    else:
-                        # 인덱스 기반 필터링으로 폴백
-                        mask = (self.current_data.index >= int(xmin)) & (self.current_data.index <= int(xmax))
-                        print(f"인덱스 기반 필터링 (폴백): {int(xmin)} ~ {int(xmax)}, 매칭 데이터: {mask.sum()}개")
-                except Exception as e:
-                    print(f"시간 변환 실패: {e}")
-                    # 시간 변환 실패시 인덱스 기반 필터링
-                    mask = (self.current_data.index >= int(xmin)) & (self.current_data.index <= int(xmax))
-                    print(f"인덱스 기반 필터링 (예외): {int(xmin)} ~ {int(xmax)}, 매칭 데이터: {mask.sum()}개")
-            else:
-                # 인덱스 기반 필터링
-                mask = (self.current_data.index >= int(xmin)) & (self.current_data.index <= int(xmax))
-                print(f"인덱스 기반 필터링: {int(xmin)} ~ {int(xmax)}, 매칭 데이터: {mask.sum()}개")
-            
             # 선택된 범위의 데이터
-            selected_data = self.current_data[mask][self.current_column]
+            selected_data = self._select_rows(xmin, xmax)[self.current_column]
             
             if len(selected_data) == 0:
                 return
@@ -132,6 +103,37 @@ class CNTDataPlotter:
         except Exception as e:
             print(f"드래그 선택 처리 오류: {e}")
     
+    def _get_time_index(self, time_col):
+        """현재 데이터 시간 컬럼의 TimeIndex (데이터가 바뀌었을 때만 다시 생성)"""
+        cache = self._time_index_cache
+        if cache is not None and cache[0] is self.current_data and cache[1] == time_col:
+            return cache[2]
+        time_index = TimeIndex(self.current_data[time_col])
+        self._time_index_cache = (self.current_data, time_col, time_index)
+        return time_index
+    
+    def _select_rows(self, xmin, xmax):
+        """
+        드래그 구간 [xmin, xmax]의 행 반환
+        시간 컬럼이 있으면 캐시된 TimeIndex로 이진 탐색(드래그마다 to_datetime/전체 마스크 없음),
+        없거나 변환에 실패하면 인덱스 기준으로 필터링
+        """
+        time_columns = [col for col in self.current_data.columns 
+                      if 'time' in col.lower() or 'date' in col.lower() or '시간' in col]
+        
+        if time_columns and isinstance(xmin, (int, float)) and isinstance(xmax, (int, float)):
+            try:
+                selected = self._get_time_index(time_columns[0]).select_num(self.current_data, xmin, xmax)
+                print(f"시간 기반 필터링: 매칭 데이터: {len(selected)}개")
+                return selected
+            except Exception as e:
+                print(f"시간 변환 실패: {e}")
+        
+        # 인덱스 기반 필터링 (시간 컬럼이 없거나 변환 실패시)
+        mask = (self.current_data.index >= int(xmin)) & (self.current_data.index <= int(xmax))
+        print(f"인덱스 기반 필터링: {int(xmin)} ~ {int(xmax)}, 매칭 데이터: {mask.sum()}개")
+        return self.current_data[mask]
+    
     def on_span_select(self, xmin, xmax):
         """SpanSelector 드래그 선택 콜백 (로그 데이터 리더 방식)"""
         if self.current_data is None or self.current_column is None:
@@ -148,29 +150,8 @@ class CNTDataPlotter:
             return
         
         try:
-            # 데이터 필터링 (기존 on_select 로직 사용)
-            time_columns = [col for col in self.current_data.columns 
-                          if 'time' in col.lower() or 'date' in col.lower() or '시간' in col]
-            
-            if time_columns:
-                time_col = time_columns[0]
-                try:
-                    x_data = pd.to_datetime(self.current_data[time_col])
-                    if isinstance(xmin, (int, float)) and isinstance(xmax, (int, float)):
-                        xmin_dt = mdates.num2date(xmin).replace(tzinfo=None)
-                        xmax_dt = mdates.num2date(xmax).replace(tzinfo=None) 
-                        if x_data.dt.tz is not None:
-                            x_data = x_data.dt.tz_localize(None)
-                        mask = (x_data >= xmin_dt) & (x_data <= xmax_dt)
-                    else:
-                        mask = (self.current_data.index >= int(xmin)) & (self.current_data.index <= int(xmax))
-                except Exception as e:
-                    mask = (self.current_data.index >= int(xmin)) & (self.current_data.index <= int(xmax))
-            else:
-                mask = (self.current_data.index >= int(xmin)) & (self.current_data.index <= int(xmax))
-            
-            # 선택된 범위의 데이터
-            selected_data = self.current_data[mask][self.current_column]
+            # 선택된 범위의 데이터 (기존 on_select 로직 사용)
+            selected_data = self._select_rows(xmin, xmax)[self.current_column]
 
             # 빈값/비숫자 값은 NaN으로 처리하고 제거
             try:
@@ -0,0 +1,224 @@
+"""
+DB 데이터 메모리 캐시 모듈
+파일별·컬럼별로 Polars Series를 보관하는 메모리 예산(바이트) 기반 LRU 캐시를 제공합니다.
+
+- 컬럼 단위로 저장하므로 파라미터 조합이 겹치는 요청은 같은 메모리를 공유합니다.
+- 캐시 적중 시 저장된 Series로 DataFrame을 조립만 하므로 복사가 발생하지 않습니다.
+  (Polars DataFrame은 불변이므로 반환값은 읽기 전용으로 취급됩니다.)
+- 원본 파일의 크기/수정 시간이 바뀌면 해당 파일의 항목은 모두 무효화됩니다.
+- 파일에 없는 파라미터는 카탈로그 컬럼 목록으로 판단해 결과에서 빼므로
+  (read_db_file과 동일) 그런 파라미터가 섞인 요청도 캐시에서 바로 처리됩니다.
+"""
+
+import threading
+from collections import OrderedDict
+
+import polars as pl
+
+from db_sidecar import get_file_stamp
+from db_catalog import get_file_info
+
+
+# 기본 메모리 예산: 1 GiB
+DEFAULT_CACHE_MAX_BYTES = 1024 ** 3
+
+
+class ColumnCache:
+    """컬럼 단위 LRU 캐시 (메모리 예산 기반 제거)"""
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_MAX_BYTES, plc_error_candidates=()):
+        """
+        초기화
+        Args:
+            max_bytes: 캐시 메모리 예산 (바이트)
+            plc_error_candidates: PLC error 컬럼 후보 (우선순위 순)
+        """
+        self.max_bytes = int(max_bytes)
+        self.plc_error_candidates = list(plc_error_candidates)
+        self._entries = OrderedDict()  # (db_path, column) -> (pl.Series, nbytes)
+        self._files = {}               # db_path -> {'stamp', 'time_col', 'plc_error_col', 'height', 'count'}
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+    def get(self, db_path, params_to_read):
+        """
+        요청 파라미터를 모두 캐시에서 찾으면 read_db_file과 같은 컬럼 구성으로 반환
+
+        Args:
+            db_path: DB 파일 경로
+            params_to_read: 읽을 파라미터 리스트
+
+        Returns:
+            pl.DataFrame: 캐시된 데이터 (복사 없음), 미스이면 None
+        """
+        with self._lock:
+            info = self._files.get(db_path)
+            if info is None or info['stamp'] != get_file_stamp(db_path):
+                if info is not None:
+                    self._invalidate_locked(db_path)
+                self.misses += 1
+                return None
+
+            columns = self._output_columns(info, params_to_read)
+            if columns is None or any((db_path, col) not in self._entries for col in columns):
+                self.misses += 1
+                return None
+
+            series = []
+            for col in columns:
+                key = (db_path, col)
+                self._entries.move_to_end(key)
+                series.append(self._entries[key][0])
+            self.hits += 1
+
+        return pl.DataFrame(series)
+
+    def put(self, db_path, df):
+        """
+        read_db_file 결과(Polars DataFrame)를 컬럼 단위로 저장
+
+        Args:
+            db_path: DB 파일 경로
+            df: 저장할 Polars DataFrame (첫 컬럼은 시간 컬럼)
+        """
+        if df is None or df.width == 0:
+            return
+
+        stamp = get_file_stamp(db_path)
+        if stamp is None:
+            return
+
+        time_col = df.columns[0]
+        plc_error_col = next((c for c in self.plc_error_candidates if c in df.columns), None)
+        # 파일에 실제로 있는 컬럼 (없는 파라미터를 캐시 미스로 보지 않기 위해 카탈로그에서 가져옴)
+        file_info = get_file_info(db_path)
+        file_columns = frozenset(file_info['columns']) if file_info is not None else None
+
+        with self._lock:
+            info = self._files.get(db_path)
+            if info is not None and (info['stamp'] != stamp or info['height'] != df.height):
+                self._invalidate_locked(db_path)
+                info = None
+
+            new_columns = [col for col in df.columns if (db_path, col) not in self._entries]
+            new_bytes = sum(df[col].estimated_size() for col in new_columns)
+            if new_bytes > self.max_bytes:
+                # 예산보다 큰 항목은 저장하지 않음 (다른 항목만 밀어내게 됨)
+                return
+
+            if info is None:
+                self._files[db_path] = {
+                    'stamp': stamp,
+                    'time_col': time_col,
+                    'plc_error_col': plc_error_col,
+                    'file_columns': file_columns,
+                    'height': df.height,
+                    'count': 0,
+                }
+            info = self._files[db_path]
+
+            for col in df.columns:
+                key = (db_path, col)
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    continue
+                series = df[col]
+                nbytes = series.estimated_size()
+                self._entries[key] = (series, nbytes)
+                self._bytes += nbytes
+                info['count'] += 1
+
+            self._evict_locked()
+
+    # ------------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------------
+    def invalidate(self, db_path):
+        """특정 파일의 캐시 항목 모두 제거"""
+        with self._lock:
+            self._invalidate_locked(db_path)
+
+    def clear(self):
+        """캐시 전체 초기화 (통계 포함)"""
+        with self._lock:
+            self._entries.clear()
+            self._files.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def set_max_bytes(self, max_bytes):
+        """메모리 예산 변경 (초과분은 즉시 제거)"""
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict_locked()
+
+    def stats(self):
+        """
+        캐시 통계 반환
+
+        Returns:
+            dict: hits, misses, evictions, hit_rate, entries, files, bytes, max_bytes
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'files': len(self._files),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    # ------------------------------------------------------------------
+    # 내부 함수
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _output_columns(info, params_to_read):
+        """read_db_file 결과와 같은 순서의 컬럼 목록 (파일에 있는 요청 파라미터가 없으면 None)"""
+        time_col = info['time_col']
+        file_columns = info['file_columns']
+        params = [p for p in dict.fromkeys(params_to_read)
+                  if p != time_col and (file_columns is None or p in file_columns)]
+        if not params:
+            return None
+        columns = [time_col] + params
+        plc_error_col = info['plc_error_col']
+        if plc_error_col and plc_error_col not in columns:
+            columns.append(plc_error_col)
+        if time_col != 'datetime':
+            columns.append('datetime')
+        return columns
+
+    def _invalidate_locked(self, db_path):
+        for key in [k for k in self._entries if k[0] == db_path]:
+            self._bytes -= self._entries.pop(key)[1]
+        self._files.pop(db_path, None)
+
+    def _evict_locked(self):
+        while self._bytes > self.max_bytes and self._entries:
+            (db_path, _), (_, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
+            self.evictions += 1
+            info = self._files.get(db_path)
+            if info is not None:
+                info['count'] -= 1
+                if info['count'] <= 0:
+                    del self._files[db_path]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        s = self.stats()
+        return (f"ColumnCache({s['entries']} entries, {s['files']} files, "
+                f"{s['bytes'] / 1024 ** 2:.1f}/{s['max_bytes'] / 1024 ** 2:.1f} MiB, "
+                f"hit rate {s['hit_rate']:.0%})")
@@ -0,0 +1,342 @@
+"""
+DB 폴더 카탈로그 모듈
+폴더 안 DB 파일별 스키마/행 수/시간 범위/PLC error 컬럼을 JSON 인덱스로 보관합니다.
+
+카탈로그는 DB 폴더의 '.ldr_cache/catalog.json'에 저장되며, 파일 크기와 수정 시간(mtime)이
+바뀐 파일만 다시 조사(probe)하므로 폴더를 바꾸거나 다시 열 때 점진적으로 갱신됩니다.
+리더는 매번 PRAGMA table_info를 실행하는 대신 카탈로그의 컬럼 정보를 사용합니다.
+
+get_file_info로 한 파일씩 조사한 결과는 메모리에 바로 반영하지만, catalog.json은
+CATALOG_SAVE_INTERVAL_SECONDS에 한 번만 다시 씁니다. 여러 파일을 차례로 확인하는 호출 측은
+반복이 끝난 뒤 save_catalogs로 한 번 저장합니다. (프로그램 종료 시에도 저장)
+"""
+
+import os
+import re
+import json
+import time
+import atexit
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from db_sidecar import get_cache_dir, get_file_stamp
+from db_connection import read_connection
+
+try:
+    from print_utils import tprint
+except ImportError:
+    tprint = print
+
+
+CATALOG_FILE_NAME = "catalog.json"
+
+# 카탈로그 포맷 버전 (포맷이 바뀌면 기존 카탈로그 무시)
+CATALOG_FORMAT_VERSION = 2
+
+# 카탈로그 조사 최대 병렬 스레드 수 (I/O 대기 위주)
+CATALOG_PROBE_WORKERS = 8
+
+# get_file_info가 catalog.json을 다시 쓰는 최소 간격 (초)
+CATALOG_SAVE_INTERVAL_SECONDS = 5.0
+
+# PLC error 컬럼 후보 (우선순위 순, db_file.PLC_ERROR_CANDIDATES와 동일)
+PLC_ERROR_CANDIDATES = ['plc_connection_error', 'serverFault', 'fault']
+
+# 시간 컬럼 후보 (datetime 컬럼이 있으면 병합 파일로 보고 우선 사용)
+TIME_COL_CANDIDATES = ['datetime', 'time', 'timestamp']
+
+# CNT 관련 파라미터/컬럼명 패턴들 (미리 컴파일)
+CNT_PATTERNS = [
+    re.compile(r'cnt\d*'),  # cnt, cnt1, cnt2 등
+    re.compile(r'cn[a-z]\d*'),  # cnA, cnB, cnC 등
+    re.compile(r'count\d*'),  # count, count1, count2 등
+    re.compile(r'monitor\d*'),  # monitor, monitor1 등
+    re.compile(r'sensor\d*cnt'),  # sensor1cnt 등
+]
+
+
+def match_cnt_pattern(name):
+    """이름(소문자 비교)이 CNT 관련 패턴에 해당하면 True"""
+    name_lower = name.lower()
+    return any(pattern.search(name_lower) for pattern in CNT_PATTERNS)
+
+
+_lock = threading.RLock()
+_catalogs = {}  # 폴더 경로 -> {'files': {파일명: 정보}, 'dirty': bool, 'saved_at': 마지막 저장 시각, 'db_path': 폴더 안 파일 경로}
+
+
+def get_catalog_path(db_path):
+    """DB 파일이 있는 폴더의 카탈로그 파일 경로 반환"""
+    return os.path.join(get_cache_dir(db_path), CATALOG_FILE_NAME)
+
+
+def _folder_key(db_path):
+    return os.path.dirname(os.path.abspath(db_path))
+
+
+def _load_folder(db_path):
+    """폴더 카탈로그를 메모리로 로드 (이미 로드했으면 그대로 반환)"""
+    folder = _folder_key(db_path)
+    catalog = _catalogs.get(folder)
+    if catalog is not None:
+        return catalog
+
+    files = {}
+    try:
+        with open(get_catalog_path(db_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == CATALOG_FORMAT_VERSION:
+            files = data.get("files", {})
+    except (OSError, ValueError):
+        pass
+
+    catalog = {'files': files, 'dirty': False, 'saved_at': 0.0, 'db_path': db_path}
+    _catalogs[folder] = catalog
+    return catalog
+
+
+def _save_folder(db_path):
+    """변경된 폴더 카탈로그를 저장 (쓰기 권한이 없으면 메모리에만 유지)"""
+    catalog = _catalogs.get(_folder_key(db_path))
+    if catalog is None or not catalog['dirty']:
+        return
+
+    catalog_path = get_catalog_path(db_path)
+    tmp_path = f"{catalog_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(catalog_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CATALOG_FORMAT_VERSION, "files": catalog['files']}, f, ensure_ascii=False)
+        os.replace(tmp_path, catalog_path)
+        catalog['dirty'] = False
+        catalog['saved_at'] = time.monotonic()
+    except OSError as e:
+        tprint(f"  카탈로그 저장 실패: {catalog_path} ({e})")
+
+
+def probe_db_file(db_path):
+    """
+    DB 파일의 스키마와 범위 정보 조사 (연결 한 번)
+
+    행 수와 시간 범위는 로그가 시간 순으로 추가된다는 가정으로 rowid 기준 첫/마지막 행에서
+    구하므로 전체 테이블을 스캔하지 않습니다. CNT 관련 여부도 이때 모든 테이블의 컬럼명으로
+    한 번만 판정하여 저장합니다.
+
+    Args:
+        db_path: DB 파일 경로
+
+    Returns:
+        dict: columns, dtypes, row_count, time_col, time_min, time_max, plc_error_col,
+              cnt_column(CNT 관련 컬럼 "테이블.컬럼", 없으면 None), size, mtime_ns (실패 시 None)
+    """
+    stamp = get_file_stamp(db_path)
+    if stamp is None:
+        return None
+
+    try:
+        # 읽기 전용 연결 풀 사용 (이어지는 데이터/events 읽기가 같은 연결을 재사용)
+        with read_connection(db_path) as conn:
+            table_info = conn.execute("PRAGMA table_info(data)").fetchall()
+            if not table_info:
+                return None
+            columns = [row[1] for row in table_info]
+            dtypes = {row[1]: row[2] for row in table_info}
+
+            time_col = None
+            lower_map = {col.lower(): col for col in columns}
+            for candidate in TIME_COL_CANDIDATES:
+                if candidate in lower_map:
+                    time_col = lower_map[candidate]
+                    break
+            plc_error_col = next((c for c in PLC_ERROR_CANDIDATES if c in columns), None)
+
+            # 모든 테이블 컬럼에서 CNT 관련 컬럼 확인 (is_cnt_related_data 판정용)
+            cnt_column = None
+            tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+            for table in tables:
+                table_columns = columns if table == 'data' else [
+                    row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+                ]
+                cnt_col = next((col for col in table_columns if match_cnt_pattern(col)), None)
+                if cnt_col is not None:
+                    cnt_column = f"{table}.{cnt_col}"
+                    break
+
+            try:
+                row_count = conn.execute("SELECT max(rowid) FROM data").fetchone()[0] or 0
+            except sqlite3.Error:
+                # WITHOUT ROWID 테이블 등
+                row_count = conn.execute("SELECT count(*) FROM data").fetchone()[0]
+
+            time_min = time_max = None
+            if time_col is not None and row_count:
+                try:
+                    first = conn.execute(f"SELECT {time_col} FROM data ORDER BY rowid LIMIT 1").fetchone()
+                    last = conn.execute(f"SELECT {time_col} FROM data ORDER BY rowid DESC LIMIT 1").fetchone()
+                    time_min = first[0] if first else None
+                    time_max = last[0] if last else None
+                except sqlite3.Error:
+                    pass
+    except sqlite3.Error as e:
+        print(f"{db_path} 카탈로그 조사 실패: {e}")
+        return None
+
+    return {
+        'size': stamp[0],
+        'mtime_ns': stamp[1],
+        'columns': columns,
+        'dtypes': dtypes,
+        'row_count': row_count,
+        'time_col': time_col,
+        'time_min': time_min,
+        'time_max': time_max,
+        'plc_error_col': plc_error_col,
+        'cnt_column': cnt_column,
+    }
+
+
+def _lookup_locked(db_path):
+    """카탈로그 항목 반환 (없거나 파일 크기/mtime이 바뀌었으면 None)"""
+    info = _load_folder(db_path)['files'].get(os.path.basename(db_path))
+    stamp = get_file_stamp(db_path)
+    if info is not None and stamp is not None and (info['size'], info['mtime_ns']) == tuple(stamp):
+        return info
+    return None
+
+
+def _store_locked(db_path, info):
+    """조사 결과를 카탈로그에 반영 (조사 실패면 항목 제거)"""
+    catalog = _load_folder(db_path)
+    name = os.path.basename(db_path)
+    if info is None:
+        if catalog['files'].pop(name, None) is not None:
+            catalog['dirty'] = True
+        return
+    catalog['files'][name] = info
+    catalog['dirty'] = True
+
+
+def get_file_info(db_path):
+    """
+    DB 파일의 카탈로그 정보 반환 (필요하면 조사, 카탈로그 저장은 일정 간격으로 묶어서 수행)
+
+    Args:
+        db_path: DB 파일 경로
+
+    Returns:
+        dict: probe_db_file 형식의 정보, 파일을 읽을 수 없으면 None
+    """
+    with _lock:
+        info = _lookup_locked(db_path)
+    if info is not None:
+        return info
+
+    # 조사는 잠금 밖에서 (병렬 읽기 시 다른 파일 조사를 막지 않도록)
+    info = probe_db_file(db_path)
+    with _lock:
+        _store_locked(db_path, info)
+        # 차가운 폴더에서 파일마다 catalog.json 전체를 다시 쓰지 않도록 저장 간격 제한
+        if time.monotonic() - _load_folder(db_path)['saved_at'] >= CATALOG_SAVE_INTERVAL_SECONDS:
+            _save_folder(db_path)
+    return info
+
+
+def save_catalogs(db_files=None):
+    """
+    미뤄 둔 카탈로그 변경 저장 (get_file_info를 여러 번 호출한 뒤 한 번 호출)
+
+    Args:
+        db_files: 저장할 폴더의 DB 파일 경로 리스트 (None이면 로드된 모든 폴더)
+    """
+    with _lock:
+        if db_files is None:
+            paths = [catalog['db_path'] for catalog in _catalogs.values()]
+        else:
+            paths = list({_folder_key(db_path): db_path for db_path in db_files}.values())
+        for db_path in paths:
+            _save_folder(db_path)
+
+
+atexit.register(save_catalogs)
+
+
+def refresh_catalog(db_files, progress_callback=None):
+    """
+    파일 목록의 카탈로그를 점진적으로 갱신 (바뀐 파일만 조사, 저장은 한 번)
+
+    조사는 잠금 밖에서 스레드 풀로 병렬 실행하므로 그동안 다른 스레드의 get_file_info가
+    막히지 않습니다. 파일이 많아 오래 걸릴 수 있으므로 GUI에서는 작업 스레드에서 호출합니다.
+
+    Args:
+        db_files: DB 파일 경로 리스트
+        progress_callback: 진행 콜백 progress_callback(완료 수, 전체 수, 메시지) (선택)
+
+    Returns:
+        dict: {파일 경로: 정보} (읽을 수 없는 파일은 제외)
+    """
+    result = {}
+    with _lock:
+        for db_path in db_files:
+            result[db_path] = _lookup_locked(db_path)
+    pending = [db_path for db_path, info in result.items() if info is None]
+
+    # 바뀐 파일만 잠금 밖에서 병렬 조사
+    probed = {}
+    if pending:
+        workers = max(1, min(len(pending), CATALOG_PROBE_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(probe_db_file, db_path): db_path for db_path in pending}
+            for done, future in enumerate(as_completed(futures), 1):
+                probed[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(done, len(pending), "카탈로그 조사")
+
+    with _lock:
+        for db_path, info in probed.items():
+            _store_locked(db_path, info)
+            result[db_path] = info
+
+        # 폴더에서 사라진 파일 항목 정리 후 폴더별로 한 번만 저장
+        folders = {}
+        for db_path in db_files:
+            folders.setdefault(_folder_key(db_path), db_path)
+        for folder, db_path in folders.items():
+            catalog = _load_folder(db_path)
+            removed = [name for name in catalog['files']
+                       if not os.path.exists(os.path.join(folder, name))]
+            for name in removed:
+                del catalog['files'][name]
+            if removed:
+                catalog['dirty'] = True
+            _save_folder(db_path)
+
+    if probed:
+        tprint(f"  🗂 카탈로그 갱신: {len(probed)}/{len(db_files)}개 파일 조사")
+    return {db_path: info for db_path, info in result.items() if info is not None}
+
+
+def is_numeric_sql_type(declared_type):
+    """SQLite 선언 타입이 숫자 affinity(INTEGER/REAL/NUMERIC)인지 확인"""
+    declared_type = (declared_type or '').upper()
+    if not declared_type or 'CHAR' in declared_type or 'CLOB' in declared_type or 'TEXT' in declared_type:
+        return False
+    return declared_type != 'BLOB'
+
+
+def get_union_columns(catalog):
+    """
+    카탈로그에 있는 모든 파일의 컬럼 합집합 (처음 나온 순서 유지)
+
+    Args:
+        catalog: refresh_catalog 결과
+
+    Returns:
+        tuple: (컬럼 리스트, {컬럼: 선언 타입})
+    """
+    columns = {}
+    for info in catalog.values():
+        for col in info['columns']:
+            if col not in columns:
+                columns[col] = info['dtypes'].get(col, '')
+    return list(columns), columns
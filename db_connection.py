@@ -0,0 +1,208 @@
+"""
+읽기 전용 SQLite 연결 풀 모듈
+스키마 조사(카탈로그), 데이터 읽기, events 조회가 파일별로 같은 연결을 재사용하도록 합니다.
+
+- 모든 연결은 'mode=ro' URI로 열어 쓰기 잠금/저널을 사용하지 않습니다.
+- 지난 날짜의 닫힌 파일은 'immutable=1'로 열어 SQLite가 파일 잠금과 변경 확인을 생략합니다.
+  (오늘 날짜 파일이나 최근에 수정된 파일은 기록 중일 수 있으므로 immutable을 쓰지 않습니다.)
+- 연결마다 스캔용 PRAGMA(mmap_size, cache_size, temp_store)를 한 번 설정합니다.
+- 파일별 유휴 연결 수와 풀에 두는 파일 수를 제한하고, 원본 파일의 크기/수정 시간이 바뀌면
+  immutable 연결은 버리고 새로 엽니다.
+- 풀에 돌려받는 연결은 'PRAGMA shrink_memory'로 페이지 캐시를 비워 유휴 연결이 캐시 메모리
+  (연결당 최대 cache_size)를 붙잡고 있지 않도록 합니다.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from db_sidecar import get_file_stamp, is_live_file
+
+
+# 스캔용 PRAGMA (읽기 전용 연결에 설정)
+READ_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",   # 256 MiB 메모리 맵 읽기
+    "PRAGMA cache_size=-65536",     # 페이지 캐시 64 MiB
+    "PRAGMA temp_store=MEMORY",     # 정렬/임시 테이블은 메모리에서
+)
+
+# 파일별 유휴 연결 최대 수
+MAX_IDLE_PER_FILE = 2
+
+# 유휴 연결을 보관하는 최대 파일 수 (오래 사용하지 않은 파일부터 닫음)
+MAX_POOLED_FILES = 32
+
+# 마지막 수정 후 이 시간(초)이 지나야 immutable로 열기 (날짜가 바뀐 직후 마무리 기록 대비)
+IMMUTABLE_MIN_AGE_SECONDS = 600
+
+
+class _PooledConnection(sqlite3.Connection):
+    """풀 정보(pool_key: 경로, 스탬프, immutable 여부)를 붙일 수 있는 연결"""
+    pool_key = None
+
+
+def is_closed_file(db_path, stamp=None):
+    """
+    더 이상 기록되지 않는 파일인지 확인 (immutable로 열어도 되는지)
+
+    Args:
+        db_path: DB 파일 경로
+        stamp: get_file_stamp 결과 (None이면 조회)
+
+    Returns:
+        bool: 오늘 날짜 파일이 아니고 최근 IMMUTABLE_MIN_AGE_SECONDS 동안 수정되지 않았으면 True
+    """
+    if stamp is None:
+        stamp = get_file_stamp(db_path)
+    if stamp is None or is_live_file(db_path):
+        return False
+    return time.time() - stamp[1] / 1e9 >= IMMUTABLE_MIN_AGE_SECONDS
+
+
+def open_read_connection(db_path, immutable=False):
+    """
+    읽기 전용 연결 열기 (풀을 거치지 않음)
+
+    Args:
+        db_path: DB 파일 경로
+        immutable: True면 immutable=1 (닫힌 파일에만 사용)
+
+    Returns:
+        sqlite3.Connection: 작업 스레드 간에 넘겨 쓸 수 있는 연결 (한 번에 한 스레드만 사용)
+    """
+    uri = f"file:{os.path.abspath(db_path)}?mode=ro"
+    if immutable:
+        uri += "&immutable=1"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False, factory=_PooledConnection)
+    for pragma in READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+class ReadConnectionPool:
+    """파일별 읽기 전용 연결 풀"""
+
+    def __init__(self, max_idle_per_file=MAX_IDLE_PER_FILE, max_files=MAX_POOLED_FILES):
+        """
+        초기화
+        Args:
+            max_idle_per_file: 파일별 유휴 연결 최대 수
+            max_files: 유휴 연결을 보관하는 최대 파일 수
+        """
+        self.max_idle_per_file = max_idle_per_file
+        self.max_files = max_files
+        self._idle = OrderedDict()  # 절대 경로 -> {'stamp', 'immutable', 'conns': [연결]}
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+
+    def acquire(self, db_path):
+        """
+        연결 가져오기 (유휴 연결이 있으면 재사용)
+
+        Returns:
+            sqlite3.Connection: 사용 후 release로 반환해야 하는 연결
+        """
+        path = os.path.abspath(db_path)
+        stamp = get_file_stamp(path)
+        stale = []
+        with self._lock:
+            entry = self._idle.get(path)
+            if entry is not None and entry['immutable'] and entry['stamp'] != stamp:
+                # immutable 연결은 파일 변경을 감지하지 못하므로 버림
+                stale = self._idle.pop(path)['conns']
+                entry = None
+            if entry is not None and entry['conns']:
+                self._idle.move_to_end(path)
+                self.reused += 1
+                conn = entry['conns'].pop()
+                _close_all(stale)
+                return conn
+
+        _close_all(stale)
+        immutable = is_closed_file(path, stamp)
+        conn = open_read_connection(path, immutable=immutable)
+        conn.pool_key = (path, stamp, immutable)
+        self.opened += 1
+        return conn
+
+    def release(self, conn):
+        """사용한 연결 반환 (페이지 캐시를 비운 뒤 보관, 풀이 가득 찼거나 파일이 바뀌었으면 닫음)"""
+        path, stamp, immutable = conn.pool_key
+        if not _shrink(conn):
+            _close_all([conn])
+            return
+        evicted = []
+        with self._lock:
+            entry = self._idle.get(path)
+            if entry is None:
+                entry = self._idle[path] = {'stamp': stamp, 'immutable': immutable, 'conns': []}
+            self._idle.move_to_end(path)
+            # immutable 연결은 같은 스탬프일 때만 보관 (기록 중인 파일의 일반 연결은 항상 최신 내용을 읽음)
+            same_file = entry['immutable'] == immutable and (not immutable or entry['stamp'] == stamp)
+            if same_file and len(entry['conns']) < self.max_idle_per_file:
+                entry['conns'].append(conn)
+                conn = None
+            while len(self._idle) > self.max_files:
+                evicted.extend(self._idle.popitem(last=False)[1]['conns'])
+        if conn is not None:
+            evicted.append(conn)
+        _close_all(evicted)
+
+    @contextmanager
+    def connection(self, db_path):
+        """with 문으로 연결을 빌려 쓰기 (오류가 나면 연결을 풀에 돌려주지 않고 닫음)"""
+        conn = self.acquire(db_path)
+        try:
+            yield conn
+        except BaseException:
+            _close_all([conn])
+            raise
+        self.release(conn)
+
+    def close_all(self):
+        """유휴 연결 모두 닫기"""
+        with self._lock:
+            conns = [conn for entry in self._idle.values() for conn in entry['conns']]
+            self._idle.clear()
+        _close_all(conns)
+
+
+def _shrink(conn):
+    """유휴 연결의 페이지 캐시 해제 (실패하면 False -> 연결을 닫음)"""
+    try:
+        conn.execute("PRAGMA shrink_memory")
+    except sqlite3.Error:
+        return False
+    return True
+
+
+def _close_all(conns):
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+# 프로세스 전역 연결 풀
+_read_pool = ReadConnectionPool()
+
+
+def get_read_pool():
+    """프로세스 전역 읽기 전용 연결 풀 반환"""
+    return _read_pool
+
+
+def read_connection(db_path):
+    """
+    전역 풀에서 읽기 전용 연결 빌리기
+
+    사용 예:
+        with read_connection(db_path) as conn:
+            rows = conn.execute("SELECT ...").fetchall()
+    """
+    return _read_pool.connection(db_path)
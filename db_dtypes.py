@@ -0,0 +1,200 @@
+"""
+로드 시 dtype 최적화 모듈
+Polars 결과를 pandas로 변환하기 전에 컬럼별 통계(한 번의 select)로 더 작은 dtype을 골라 변환합니다.
+
+- 0/1 값만 있는 플래그 컬럼(plc_connection_error, serverFault, fault 등) -> uint8
+- 정수형 컬럼(원본 dtype이 정수) -> 값 범위에 맞는 가장 작은 정수형 (빈 값이 있으면 float32/float64)
+  (실수형 컬럼은 불러온 구간의 값이 모두 정수여도 정수형으로 바꾸지 않음 -> 구간에 따라 dtype이 바뀌지 않음)
+- 실수 컬럼 -> float32로 바꿨다가 되돌려도 모든 값이 정확히 같을 때만 float32
+  (epoch 초, 누적 카운터 등 큰 값은 float32 유효 자릿수(약 7자리)를 넘으므로 float64 유지,
+   손실을 감수하고 줄이려면 dtype_policy.json에서 float32 지정)
+- 반복되는 문자열 -> Categorical (고유값 비율 CATEGORY_MAX_UNIQUE_RATIO 이하)
+
+자동 판단 대신 컬럼별 정책을 dtype_policy.json으로 지정할 수 있습니다.
+    {"columns": {"plc_connection_error": "flag", "some_counter": "float64", "state": "category"}}
+정책 값: auto(기본), flag, float32, float64, category, keep
+"""
+
+import os
+import json
+
+import numpy as np
+import polars as pl
+
+from db_catalog import PLC_ERROR_CANDIDATES, TIME_COL_CANDIDATES
+
+try:
+    from print_utils import tprint
+except ImportError:
+    tprint = print
+
+
+DTYPE_POLICY_FILE = 'dtype_policy.json'
+POLICY_KINDS = ('auto', 'flag', 'float32', 'float64', 'category', 'keep')
+
+# Categorical로 바꾸는 최대 고유값 비율 (고유값 수 / 행 수)
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# 작은 것부터 시도하는 정수형 (빈 값이 없을 때만 사용, pandas에서도 같은 dtype 유지)
+_INT_CANDIDATES = [
+    (pl.UInt8, np.uint8), (pl.Int8, np.int8),
+    (pl.UInt16, np.uint16), (pl.Int16, np.int16),
+    (pl.UInt32, np.uint32), (pl.Int32, np.int32),
+]
+
+_policy_cache = {}  # 경로 -> (mtime_ns, 정책 dict)
+
+
+def load_dtype_policy(path=DTYPE_POLICY_FILE):
+    """
+    컬럼별 dtype 정책 파일 로드 (파일이 바뀌었을 때만 다시 읽음)
+
+    Args:
+        path: 정책 JSON 파일 경로
+
+    Returns:
+        dict: {컬럼명: 정책} (파일이 없거나 읽기 실패 시 빈 dict)
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _policy_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        tprint(f"{path} 로드 실패: {e}")
+        return {}
+
+    policy = {}
+    for col, kind in data.get('columns', data).items():
+        if kind in POLICY_KINDS:
+            policy[col] = kind
+        else:
+            tprint(f"  {path}: 알 수 없는 dtype 정책 무시 ({col}: {kind})")
+    _policy_cache[path] = (mtime_ns, policy)
+    return policy
+
+
+def _smallest_int_dtype(min_value, max_value):
+    """[min_value, max_value]를 담는 가장 작은 정수형 (없으면 None)"""
+    for pl_dtype, np_dtype in _INT_CANDIDATES:
+        info = np.iinfo(np_dtype)
+        if info.min <= min_value and max_value <= info.max:
+            return pl_dtype
+    return None
+
+
+def _column_stats_exprs(col, dtype):
+    """컬럼 하나의 통계 표현식 리스트 (한 번의 select로 모든 컬럼을 함께 계산)"""
+    c = pl.col(col)
+    if dtype.is_numeric():
+        x = c.cast(pl.Float64).fill_nan(None)
+        x32 = x.cast(pl.Float32).cast(pl.Float64)
+        return [
+            x.min().alias(f"{col}\0min"),
+            x.max().alias(f"{col}\0max"),
+            x.null_count().alias(f"{col}\0nulls"),  # NaN 포함
+            (x == x.round()).all().alias(f"{col}\0integral"),
+            (x == x32).all().alias(f"{col}\0f32_exact"),
+        ]
+    if dtype == pl.Utf8:
+        return [c.n_unique().alias(f"{col}\0unique")]
+    return []
+
+
+def plan_dtypes(df, policy=None, skip_cols=()):
+    """
+    컬럼별 변환 dtype 결정
+
+    Args:
+        df: Polars DataFrame
+        policy: {컬럼명: 정책} (None이면 dtype_policy.json)
+        skip_cols: 변환하지 않을 컬럼 (시간 컬럼은 항상 제외)
+
+    Returns:
+        dict: {컬럼명: 변환할 Polars dtype} (바꿀 필요가 없는 컬럼은 없음)
+    """
+    if policy is None:
+        policy = load_dtype_policy()
+    skip = set(skip_cols) | set(TIME_COL_CANDIDATES)
+
+    columns = [col for col in df.columns if col not in skip and policy.get(col, 'auto') != 'keep']
+    stats_exprs = []
+    for col in columns:
+        stats_exprs.extend(_column_stats_exprs(col, df.schema[col]))
+    stats = df.select(stats_exprs).row(0, named=True) if stats_exprs and df.height else {}
+
+    plan = {}
+    for col in columns:
+        dtype = df.schema[col]
+        kind = policy.get(col, 'auto')
+        if kind == 'float64':
+            target = pl.Float64
+        elif kind == 'float32':
+            target = pl.Float32
+        elif kind == 'category':
+            target = pl.Categorical
+        elif f"{col}\0min" in stats:
+            target = _plan_numeric(col, stats, dtype.is_integer(),
+                                   force_flag=(kind == 'flag' or col in PLC_ERROR_CANDIDATES))
+        elif f"{col}\0unique" in stats:
+            ratio = stats[f"{col}\0unique"] / df.height
+            target = pl.Categorical if ratio <= CATEGORY_MAX_UNIQUE_RATIO else None
+        else:
+            target = None
+        if target is not None and target != dtype:
+            plan[col] = target
+    return plan
+
+
+def _plan_numeric(col, stats, is_integer_dtype, force_flag=False):
+    """숫자 컬럼 통계로 변환 dtype 결정 (None이면 그대로, 정수형 축소는 원본이 정수형일 때만)"""
+    min_value, max_value = stats[f"{col}\0min"], stats[f"{col}\0max"]
+    has_nulls = stats[f"{col}\0nulls"] > 0
+    if min_value is None:
+        return pl.Float32  # 모두 빈 값
+    integral = stats[f"{col}\0integral"]
+
+    if integral and not has_nulls:
+        # 0/1 플래그 컬럼은 원본이 실수형이어도 uint8 (정수형은 pandas에서도 그대로 유지)
+        if force_flag and 0 <= min_value and max_value <= 1:
+            return pl.UInt8
+        if is_integer_dtype:
+            return _smallest_int_dtype(min_value, max_value)
+    # 빈 값(NaN)이 있으면 pandas에서 실수형이 되므로 float32로 값이 정확히 유지되는지만 확인
+    if stats[f"{col}\0f32_exact"]:
+        return pl.Float32
+    return None
+
+
+def optimize_dtypes(df, policy=None, skip_cols=(), verbose=True):
+    """
+    메모리를 줄이도록 컬럼 dtype 변환 (pandas 변환 직전에 호출)
+
+    Args:
+        df: Polars DataFrame (None이면 그대로 반환)
+        policy: {컬럼명: 정책} (None이면 dtype_policy.json)
+        skip_cols: 변환하지 않을 컬럼
+        verbose: 변환 결과(메모리 감소량) 출력 여부
+
+    Returns:
+        pl.DataFrame: 변환된 데이터프레임
+    """
+    if df is None or df.width == 0:
+        return df
+    plan = plan_dtypes(df, policy, skip_cols)
+    if not plan:
+        return df
+
+    before = df.estimated_size()
+    df = df.with_columns([pl.col(col).cast(dtype) for col, dtype in plan.items()])
+    if verbose:
+        after = df.estimated_size()
+        tprint(f"  🗜 dtype 최적화: {len(plan)}개 컬럼, "
+               f"{before / 1024 ** 2:.1f} -> {after / 1024 ** 2:.1f} MiB ({before / max(after, 1):.1f}배 감소)")
+    return df
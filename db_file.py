@@ -32,10 +32,23 @@ import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import tkinter as tk
 from tkinter import ttk, messagebox
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
+import atexit
+import sys
+import types
+from contextlib import contextmanager
 from functools import lru_cache
 import hashlib
 import pickle
+from db_sidecar import load_sidecar, update_sidecar
+from db_cache import ColumnCache, DEFAULT_CACHE_MAX_BYTES
+from db_catalog import get_file_info, save_catalogs, is_numeric_sql_type, match_cnt_pattern
+from db_dtypes import optimize_dtypes
+from db_connection import read_connection
+
+# PLC error 컬럼 후보 (우선순위 순)
+PLC_ERROR_CANDIDATES = ['plc_connection_error', 'serverFault', 'fault']
 
 
 def extract_date_from_filename(filename):
@@ -64,78 +77,85 @@ def extract_date_from_filename(filename):
 # 1. 벡터화된 DateTime 변환 알고리즘 (Polars 기반)
 # ============================================================================
 
+# datetime 컬럼 해상도 (int64 epoch 나노초)
+DATETIME_DTYPE = pl.Datetime('ns')
+NS_PER_SECOND = 1_000_000_000
+
+
+def _base_day_ns(base_date):
+    """기준 날짜 자정의 epoch 나노초 (int)"""
+    day = datetime.datetime(base_date.year, base_date.month, base_date.day)
+    return int((day - datetime.datetime(1970, 1, 1)) // datetime.timedelta(microseconds=1)) * 1000
+
+
+def time_of_day_ns_expr(time_col, col_dtype):
+    """
+    시간 컬럼을 자정 기준 나노초(Int64) 표현식으로 변환 (dtype별 분기, 행 단위 Python 없음)
+    
+    - 숫자: 자정 기준 초 (소수 초 유지)
+    - datetime/time: 시각 부분만 사용 (날짜는 파일명의 기준 날짜로 대체)
+    - 문자열: 'HH:MM:SS[.f]' 또는 'YYYY-MM-DD HH:MM:SS[.f]'의 시각 부분, 그 외에는 숫자(초) 문자열로 해석
+    
+    Args:
+        time_col: 시간 컬럼명
+        col_dtype: 시간 컬럼의 Polars dtype
+        
+    Returns:
+        pl.Expr: 자정 기준 나노초 (해석할 수 없는 값과 NaN/inf는 null)
+    """
+    col = pl.col(time_col)
+    if col_dtype is not None and col_dtype.is_numeric():
+        return (col.cast(pl.Float64) * NS_PER_SECOND).round().cast(pl.Int64, strict=False)
+    if isinstance(col_dtype, pl.Datetime):
+        return col.dt.time().cast(pl.Int64)
+    if col_dtype == pl.Time:
+        return col.cast(pl.Int64)
+    if col_dtype == pl.Date:
+        return pl.lit(0, dtype=pl.Int64)
+    
+    # 문자열: 첫 ':' 위치를 기준으로 시/분/초를 잘라 정수 연산 (앞의 날짜 부분 형식과 무관)
+    text = col.cast(pl.Utf8).str.strip_chars()
+    colon = text.str.find(':', literal=True).cast(pl.Int64)
+    hour_start = (colon - 2).clip(lower_bound=0)
+    hours = text.str.slice(hour_start, 2).str.strip_chars_end(':').cast(pl.Int64, strict=False)
+    minutes = text.str.slice(colon + 1, 2).cast(pl.Int64, strict=False)
+    seconds = text.str.slice(colon + 4).cast(pl.Float64, strict=False)
+    hms_ns = (hours * 3600 + minutes * 60) * NS_PER_SECOND + (seconds * NS_PER_SECOND).round().cast(pl.Int64, strict=False)
+    numeric_ns = (text.cast(pl.Float64, strict=False) * NS_PER_SECOND).round().cast(pl.Int64, strict=False)
+    return pl.coalesce([hms_ns, numeric_ns])
+
+
 def convert_datetime_vectorized_polars(lf_or_df, time_col, base_date):
     """
     Polars DataFrame/LazyFrame을 사용한 벡터화 datetime 변환
     
+    기준 날짜 자정의 epoch 나노초에 자정 기준 나노초(time_of_day_ns_expr)를 정수로 더해
+    datetime[ns]를 만듭니다. duration 연산이나 pandas fallback 없이 한 번의 표현식으로 끝납니다.
+    
     Args:
         lf_or_df: Polars DataFrame 또는 LazyFrame
         time_col: 시간 컬럼명
         base_date: 기본 날짜 (datetime 객체)
         
     Returns:
-        Polars LazyFrame: datetime 컬럼이 추가된 LazyFrame
+        Polars LazyFrame 또는 DataFrame: datetime 컬럼이 추가된 프레임 (입력과 같은 종류)
     """
-    try:
-        # base_date를 Polars datetime literal로 생성
-        base_datetime = datetime.datetime(
-            base_date.year, base_date.month, base_date.day,
-            0, 0, 0
-        )
-        base_date_pl = pl.lit(base_datetime).cast(pl.Datetime)
-        
-        # 스키마에서 타입 확인 (LazyFrame인 경우 collect_schema() 사용)
-        if hasattr(lf_or_df, 'collect_schema'):
-            # LazyFrame: collect_schema()로 경량 스키마 확인
-            schema = lf_or_df.collect_schema()
-            col_dtype = schema.get(time_col)
-        elif hasattr(lf_or_df, 'schema'):
-            # DataFrame: 직접 schema 속성 사용
-            schema = lf_or_df.schema
-            col_dtype = schema.get(time_col) if hasattr(schema, 'get') else None
-        else:
-            col_dtype = None
-        
-        if col_dtype == pl.Datetime:
-            # datetime 타입: 날짜는 base_date, 시간만 추출하여 더하기
-            # 시간을 초로 변환 (벡터화)
-            time_seconds = (
-                pl.col(time_col).dt.hour() * 3600
-                + pl.col(time_col).dt.minute() * 60
-                + pl.col(time_col).dt.second()
-                + pl.col(time_col).dt.microsecond() / 1_000_000  # 마이크로초를 초로 변환
-            )
-            datetime_expr = base_date_pl + pl.duration(seconds=time_seconds)
-        else:
-            # 숫자 타입: 초 단위로 해석하여 base_date에 더하기
-            datetime_expr = (
-                base_date_pl 
-                + pl.duration(seconds=pl.col(time_col).cast(pl.Int64))
-            )
-        
-        return lf_or_df.with_columns([
-            datetime_expr.alias("datetime")
-        ])
-        
-    except Exception as e:
-        print(f"Polars datetime 변환 실패, pandas fallback 사용: {e}")
-        # fallback: pandas로 변환 후 처리
-        if hasattr(lf_or_df, 'collect'):
-            df_pd = lf_or_df.collect().to_pandas()
-        elif hasattr(lf_or_df, 'to_pandas'):
-            df_pd = lf_or_df.to_pandas()
-        else:
-            df_pd = lf_or_df
-            
-        df_pd['datetime'] = convert_datetime_vectorized(df_pd[time_col], base_date)
-        return pl.from_pandas(df_pd).lazy()
+    # 스키마에서 타입 확인 (LazyFrame인 경우 collect_schema()로 경량 확인)
+    if hasattr(lf_or_df, 'collect_schema'):
+        col_dtype = lf_or_df.collect_schema().get(time_col)
+    else:
+        col_dtype = lf_or_df.schema.get(time_col)
+    
+    datetime_expr = (pl.lit(_base_day_ns(base_date), dtype=pl.Int64)
+                     + time_of_day_ns_expr(time_col, col_dtype)).cast(DATETIME_DTYPE)
+    return lf_or_df.with_columns(datetime_expr.alias("datetime"))
 
 
 # ============================================================================
 # 2. PLC Error 기반 NaN 복원 알고리즘 (Polars 기반)
 # ============================================================================
 
-def restore_plc_error_data_polars(lf, plc_error_col, cols_in_db):
+def restore_plc_error_data_polars(lf, plc_error_col, cols_in_db, seed=None):
     """
     Polars 기반 PLC error 정보를 사용한 NaN 데이터 복원
     
@@ -143,6 +163,7 @@ def restore_plc_error_data_polars(lf, plc_error_col, cols_in_db):
         lf: Polars LazyFrame
         plc_error_col: PLC error 컬럼명
         cols_in_db: 복원할 파라미터 컬럼 리스트
+        seed: 하루 중간부터 읽을 때 앞쪽 행까지의 복원 상태 (query_plc_seed 결과, None이면 처음부터)
         
     Returns:
         Polars LazyFrame: 복원된 LazyFrame (collect는 호출하지 않음)
@@ -154,49 +175,30 @@ def restore_plc_error_data_polars(lf, plc_error_col, cols_in_db):
     
     tprint(f"PLC error 초고속 복원 시작 (Polars): {plc_error_col}")
     
-    # 1. PLC 상태 복원
-    # 첫 유효값을 찾기 위해 먼저 collect (작은 작업)
-    df_temp = lf.select(pl.col(plc_error_col)).head(1000).collect()
-    initial_state = 0
-    if len(df_temp) > 0 and df_temp[plc_error_col].is_not_null().any():
-        first_valid = df_temp.filter(pl.col(plc_error_col).is_not_null())
-        if len(first_valid) > 0:
-            initial_state = int(first_valid[plc_error_col][0])
-    
-    # PLC error 컬럼 forward fill
+    # 1. PLC 상태 복원 (forward fill, 앞쪽 빈 값은 첫 유효 상태, 전체가 비어 있으면 0)
+    # 첫 유효 상태도 표현식으로 계산하므로 collect 없이 LazyFrame 체이닝 유지
+    # (seed가 있으면 앞쪽 빈 값은 읽지 않은 앞부분의 마지막 상태)
+    initial_state = pl.col(plc_error_col).drop_nulls().first() if seed is None else seed['plc_state']
     lf = lf.with_columns([
         pl.col(plc_error_col)
         .forward_fill()
         .fill_null(initial_state)
+        .fill_null(0)
         .cast(pl.Int64)
         .alias(plc_error_col)
     ])
     
-    # 2. 에러 마스크 생성
-    error_mask = pl.col(plc_error_col) == 1
-    valid_mask = pl.col(plc_error_col) == 0
-    
-    # 3. 모든 파라미터를 한 번에 복원 (벡터화 최적화)
-    schema_names = lf.collect_schema().names()
-    restore_columns = []
-    
-    for param in cols_in_db:
-        if param in schema_names and param != plc_error_col:
-            # 에러 구간은 null로 마스킹하고 forward fill
-            filled_col = (
-                pl.when(error_mask)
-                .then(None)  # 에러 구간은 null
-                .otherwise(pl.col(param))
-                .forward_fill()
-            )
-            
-            # 정상 구간에서만 복원된 값 사용
-            restore_columns.append(
-                pl.when(valid_mask & filled_col.is_not_null())
-                .then(filled_col)
-                .otherwise(pl.col(param))
-                .alias(param)
-            )
+    # 2. 모든 파라미터를 한 번에 복원 (벡터화 최적화)
+    schema = lf.collect_schema()
+    last_valid = seed['last_valid'] if seed is not None else {}
+    restore_columns = [
+        _plc_restored_expr(param, plc_error_col, _plc_filled_expr(
+            param, plc_error_col,
+            None if last_valid.get(param) is None
+            else pl.lit(last_valid[param]).cast(schema[param], strict=False)))
+        for param in cols_in_db
+        if param in schema_names and param != plc_error_col
+    ]
     
     # 모든 파라미터를 한 번에 처리 (단일 with_columns 호출로 최적화)
     if restore_columns:
@@ -207,111 +209,187 @@ def restore_plc_error_data_polars(lf, plc_error_col, cols_in_db):
     return lf
 
 
+def _plc_filled_expr(param, plc_error_col, carry=None):
+    """
+    에러 구간(PLC=1)을 null로 가린 값의 forward fill 표현식
+    
+    Args:
+        carry: 이전 청크 마지막의 forward fill 값 또는 표현식 (청크 앞쪽 빈 값을 이어서 채움, None이면 없음)
+    """
+    filled = (
+        pl.when(pl.col(plc_error_col) == 1)
+        .then(None)  # 에러 구간은 null
+        .otherwise(pl.col(param))
+        .forward_fill()
+    )
+    if carry is not None:
+        filled = filled.fill_null(carry)
+    return filled
+
+
+def _plc_restored_expr(param, plc_error_col, filled):
+    """정상 구간(PLC=0)에서만 forward fill 값으로 복원하는 표현식"""
+    return (
+        pl.when((pl.col(plc_error_col) == 0) & filled.is_not_null())
+        .then(filled)
+        .otherwise(pl.col(param))
+        .alias(param)
+    )
+
+
+class StreamingPlcRestorer:
+    """
+    청크(파일/조회 단위)로 나눠 들어오는 데이터를 시간 순서대로 PLC 복원
+    
+    마지막 PLC 상태와 파라미터별 마지막 forward fill 값을 청크 사이에 이어받으므로,
+    청크를 모두 이어 붙여 restore_plc_error_data_polars로 한 번에 복원한 결과와 같습니다.
+    첫 유효 PLC 상태가 나오기 전의 청크는 상태를 알 수 없으므로 보관했다가 함께 복원합니다.
+    """
+    
+    def __init__(self, params):
+        """
+        초기화
+        Args:
+            params: 복원할 파라미터 리스트
+        """
+        self.params = list(params)
+        self.plc_state = None   # 마지막 PLC 상태 (첫 유효 상태가 나오기 전에는 None)
+        self.last_valid = {}    # 파라미터별 마지막 forward fill 값
+        self._pending = []      # 첫 유효 PLC 상태가 나오기 전의 청크 [(df, plc_error_col)]
+    
+    @property
+    def has_pending(self):
+        """첫 유효 PLC 상태를 기다리며 보관 중인 청크가 있으면 True"""
+        return bool(self._pending)
+    
+    def push(self, df, plc_error_col):
+        """
+        다음 청크 입력
+        
+        Args:
+            df: 시간 순서상 이전 청크 바로 뒤의 Polars DataFrame
+            plc_error_col: 이 청크의 PLC error 컬럼명 (없으면 None)
+            
+        Returns:
+            list: 복원이 끝난 청크 리스트 (입력 순서, 보관 중이면 빈 리스트)
+        """
+        if df is None or df.height == 0:
+            return []
+        if plc_error_col is None or plc_error_col not in df.columns:
+            # PLC 컬럼이 없는 청크는 복원 없이 통과 (보관 중인 청크는 기본 상태로 먼저 내보냄)
+            return self.flush() + [df]
+        
+        if self.plc_state is None:
+            first_valid = df[plc_error_col].drop_nulls()
+            if len(first_valid) == 0:
+                self._pending.append((df, plc_error_col))
+                return []
+            self.plc_state = int(first_valid[0])
+            ready = [self._restore(p_df, p_col) for p_df, p_col in self._pending]
+            self._pending = []
+            return ready + [self._restore(df, plc_error_col)]
+        return [self._restore(df, plc_error_col)]
+    
+    def flush(self):
+        """
+        보관 중인 청크를 기본 상태(0)로 복원해 반환 (입력이 끝났을 때 호출)
+        
+        Returns:
+            list: 복원이 끝난 청크 리스트
+        """
+        if not self._pending:
+            return []
+        self.plc_state = 0
+        ready = [self._restore(p_df, p_col) for p_df, p_col in self._pending]
+        self._pending = []
+        return ready
+    
+    def _restore(self, df, plc_error_col):
+        """이어받은 상태로 청크 하나 복원하고 상태 갱신"""
+        df = df.with_columns(
+            pl.col(plc_error_col).forward_fill().fill_null(self.plc_state).cast(pl.Int64).alias(plc_error_col)
+        )
+        self.plc_state = int(df[plc_error_col][-1])
+        
+        params = [p for p in self.params if p in df.columns and p != plc_error_col]
+        if not params:
+            return df
+        filled_cols = {p: f"__filled_{p}" for p in params}
+        df = df.with_columns([
+            _plc_filled_expr(p, plc_error_col, self.last_valid.get(p)).alias(filled_cols[p]) for p in params
+        ])
+        for p in params:
+            self.last_valid[p] = df[filled_cols[p]][-1]
+        return df.with_columns([
+            _plc_restored_expr(p, plc_error_col, pl.col(filled_cols[p])) for p in params
+        ]).drop(list(filled_cols.values()))
+
+
 # ============================================================================
-# 1. 벡터화된 DateTime 변환 알고리즘 (Pandas 호환 - fallback용)
+# 1. 벡터화된 DateTime 변환 알고리즘 (Pandas 호환)
 # ============================================================================
 
-def make_to_datetime_safe(base_date):
+def _datetime_time_of_day_ns(values):
+    """datetime 값(Series)의 자정 기준 나노초 (int64 배열, NaT는 0)"""
+    values = pd.to_datetime(values)
+    if values.dt.tz is not None:
+        values = values.dt.tz_localize(None)
+    values = values.astype('datetime64[ns]')
+    return (values - values.dt.normalize()).to_numpy(dtype='timedelta64[ns]').view('i8')
+
+
+def _seconds_to_ns(seconds):
+    """자정 기준 초(float 배열)를 나노초(int64 배열)로 변환 (소수 초 유지, NaN/inf는 0)"""
+    seconds = np.asarray(seconds, dtype=float)
+    return np.round(np.where(np.isfinite(seconds), seconds, 0.0) * NS_PER_SECOND).astype(np.int64)
+
+
+def _object_time_of_day_ns(series):
     """
-    안전한 datetime 변환 함수를 생성하는 팩토리 함수
+    여러 타입이 섞인 object/문자열 Series의 자정 기준 나노초
+    
+    값마다 타입을 확인하지 않고 astype(str) 한 번으로 모든 값을 문자열로 맞춘 뒤
+    (숫자는 '1.5', datetime/time 객체는 'YYYY-MM-DD HH:MM:SS.f'/'HH:MM:SS' 형태),
+    Polars 문자열 경로(time_of_day_ns_expr)로 숫자/시각/날짜+시각을 한 번에 나눠 변환합니다.
     
-    Args:
-        base_date: 기본 날짜 (datetime 객체)
-        
     Returns:
-        to_datetime_safe 함수
+        tuple: (자정 기준 나노초 int64 배열, 변환 성공 마스크 bool 배열)
     """
-    def to_datetime_safe(value):
-        # NaN이나 None 값 먼저 체크
-        if pd.isna(value):
-            return pd.NaT
-            
-        # isinstance 체크 부분 수정 - datetime.datetime으로 변경
-        if isinstance(value, pd.Timestamp) or isinstance(value, datetime.datetime):
-            time_part = value.time()
-            return base_date.replace(hour=time_part.hour,
-                                     minute=time_part.minute,
-                                     second=time_part.second,
-                                     microsecond=time_part.microsecond)
-        try:
-            # 문자열이나 숫자 타입을 먼저 확인
-            if isinstance(value, str):
-                # 빈 문자열 체크
-                if not value.strip():
-                    return pd.NaT
-                value = float(value)
-            elif not isinstance(value, (int, float)):
-                return pd.NaT
-                
-            return base_date + datetime.timedelta(seconds=int(float(value)))
-        except (ValueError, TypeError, OverflowError):
-            return pd.NaT
-    return to_datetime_safe
+    text = pl.from_pandas(series.astype(str)).alias('time')
+    tod = pl.DataFrame([text]).select(time_of_day_ns_expr('time', pl.Utf8))['time']
+    valid = tod.is_not_null().to_numpy()
+    return tod.fill_null(0).to_numpy(), valid
 
 
 def convert_datetime_vectorized(series, base_date):
     """
-    pandas Series를 벡터화 방식으로 datetime 변환
+    pandas Series를 벡터화 방식으로 datetime 변환 (dtype별 분기, 값 단위 Python 없음)
+    
+    convert_datetime_vectorized_polars와 같은 규칙으로 기준 날짜 자정 + 자정 기준 나노초를 계산합니다.
+    - datetime64: 시각 부분만 사용 (날짜는 base_date로 대체)
+    - 숫자: 자정 기준 초 (소수 초 유지)
+    - object/문자열: _object_time_of_day_ns로 숫자/시각 문자열/날짜+시각을 한 번에 나눠 변환
     
     Args:
         series: 변환할 pandas Series (시간 데이터)
         base_date: 기본 날짜 (datetime 객체)
         
     Returns:
-        pandas Series: datetime 변환된 Series
+        pandas Series: datetime64[ns] Series (변환할 수 없는 값은 NaT)
     """
-    try:
-        # 1. NaN 값 처리
-        valid_mask = pd.notna(series)
-        result = pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
-        
-        if not valid_mask.any():
-            return result
-            
-        valid_series = series[valid_mask]
-        
-        # 2. 이미 datetime 타입인 경우 (벡터화 처리)
-        datetime_mask = valid_series.apply(lambda x: isinstance(x, (pd.Timestamp, datetime.datetime)))
-        if datetime_mask.any():
-            # datetime 타입 값들을 Series로 변환 (dt accessor 사용을 위해)
-            datetime_series = pd.to_datetime(valid_series[datetime_mask])
-            
-            # numpy 기반으로 시간 부분을 timedelta로 변환
-            time_seconds = (
-                datetime_series.dt.hour * 3600
-                + datetime_series.dt.minute * 60
-                + datetime_series.dt.second
-                + datetime_series.dt.microsecond / 1_000_000  # 마이크로초도 포함
-            )
-            
-            # base_date에 시간 부분을 더해서 최종 datetime 생성
-            result.loc[datetime_series.index] = pd.Timestamp(base_date) + pd.to_timedelta(time_seconds, unit='s')
-        
-        # 3. 숫자 타입 처리 (vectorized)
-        numeric_mask = ~datetime_mask
-        if numeric_mask.any():
-            numeric_values = valid_series[numeric_mask]
-            try:
-                # 문자열을 숫자로 변환 시도
-                numeric_converted = pd.to_numeric(numeric_values, errors='coerce')
-                valid_numeric = pd.notna(numeric_converted)
-                
-                if valid_numeric.any():
-                    # 벡터화된 timedelta 계산
-                    seconds = numeric_converted[valid_numeric].astype(int)
-                    base_timestamps = pd.Timestamp(base_date)
-                    result.loc[numeric_converted[valid_numeric].index] = base_timestamps + pd.to_timedelta(seconds, unit='s')
-                    
-            except Exception:
-                pass
-        
-        return result
-        
-    except Exception as e:
-        print(f"벡터화 변환 실패, fallback 사용: {e}")
-        # fallback to apply method
-        to_datetime_safe = make_to_datetime_safe(base_date)
-        return series.apply(to_datetime_safe)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        valid = series.notna().to_numpy()
+        tod_ns = _datetime_time_of_day_ns(series)
+    elif pd.api.types.is_numeric_dtype(series):
+        seconds = series.to_numpy(dtype=float, na_value=np.nan)
+        valid = np.isfinite(seconds)
+        tod_ns = _seconds_to_ns(seconds)
+    else:
+        tod_ns, valid = _object_time_of_day_ns(series)
+    
+    values = np.full(len(series), np.datetime64('NaT'), dtype='datetime64[ns]')
+    values[valid] = (_base_day_ns(base_date) + tod_ns[valid]).view('datetime64[ns]')
+    return pd.Series(values, index=series.index)
 
 
 # ============================================================================
@@ -402,18 +480,70 @@ def is_restored_file(file_path):
     return name_without_ext.lower().endswith('restored')
 
 
-def read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized):
+def read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized, use_sidecar=True,
+                 return_polars=False):
     """
     DB 파일 읽기 함수 - PLC 복원 기능 포함 (Polars 기반)
     
+    한 번 변환/복원한 결과는 Parquet 사이드카(db_sidecar)에 저장되며,
+    이후에는 DB를 다시 읽지 않고 필요한 컬럼만 사이드카에서 읽습니다.
+    
     Args:
         db_path: 데이터베이스 파일 경로
         params_to_read: 읽을 파라미터 리스트
         time_cols: 시간 컬럼 리스트
         convert_datetime_vectorized: 벡터화된 datetime 변환 함수 (호환성 유지용, 사용 안 함)
+        use_sidecar: Parquet 사이드카 사용 여부
+        return_polars: True면 pandas 변환 없이 Polars DataFrame 반환
         
     Returns:
-        pd.DataFrame: 처리된 데이터프레임 (matplotlib 호환을 위해 pandas로 반환)
+        pd.DataFrame 또는 pl.DataFrame: 처리된 데이터프레임 (기본은 matplotlib 호환을 위해 pandas)
+    """
+    df_pl_result = _read_db_file_polars(db_path, params_to_read, time_cols, use_sidecar=use_sidecar)
+    if df_pl_result is None or return_polars:
+        return df_pl_result
+    
+    # matplotlib 호환을 위해 pandas로 변환 (마지막 단계, 값이 유지되는 가장 작은 dtype으로)
+    return _to_pandas(df_pl_result)
+
+
+def _to_pandas(df_pl):
+    """Polars 결과를 dtype 최적화(optimize_dtypes) 후 pandas로 변환 (파일 단위라 로그는 생략)"""
+    return optimize_dtypes(df_pl, verbose=False).to_pandas()
+
+
+def _read_db_file_polars(db_path, params_to_read, time_cols, use_sidecar=True):
+    """
+    DB 파일을 읽어 변환/복원까지 마친 Polars DataFrame 반환 (사이드카 우선)
+    
+    Returns:
+        pl.DataFrame: 처리된 데이터프레임, 실패 시 None
+    """
+    if use_sidecar:
+        df_sidecar = load_sidecar(db_path, params_to_read)
+        if df_sidecar is not None:
+            return df_sidecar
+    
+    result = _read_db_file_from_sqlite(db_path, params_to_read, time_cols)
+    if result is None:
+        return None
+    
+    df_pl_result, schema_info = result
+    if use_sidecar:
+        update_sidecar(db_path, df_pl_result, **schema_info)
+    return df_pl_result
+
+
+def _read_db_file_from_sqlite(db_path, params_to_read, time_cols, time_range=None):
+    """
+    SQLite DB 파일을 직접 읽어 datetime 변환 및 PLC 복원 수행
+    
+    Args:
+        time_range: (시작 초, 종료 초) 자정 기준 초 단위 구간, 숫자형 time 컬럼이면
+            WHERE time BETWEEN 절로 해당 구간만 읽음 (None이면 전체)
+    
+    Returns:
+        tuple: (pl.DataFrame, 스키마 정보 dict), 실패 시 None
     """
     if not POLARS_AVAILABLE:
         raise ImportError("Polars가 필요합니다. 설치: pip install polars")
@@ -421,31 +551,13 @@ def read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized
     # 파일명이 'restored'로 끝나면 PLC 복원 건너뛰기
     skip_plc_restoration = is_restored_file(db_path)
     
-    # SQLite 연결 최적화 및 스키마 확인 (Polars로 직접)
-    conn = None
-    try:
-        conn = sqlite3.connect(db_path)
-        # SQLite 성능 최적화 PRAGMA 설정
-        conn.execute("PRAGMA journal_mode=OFF")  # WAL 비활성화 (읽기 전용 시)
-        conn.execute("PRAGMA synchronous=OFF")   # 동기화 비활성화 (속도 향상)
-        conn.execute("PRAGMA cache_size=-100000")  # 캐시 크기 증가 (100MB)
-        
-        # Polars로 직접 스키마 확인 (pandas 거치지 않음)
-        try:
-            schema_df = pl.read_database(
-                query="PRAGMA table_info(data)",
-                connection=conn
-            )
-            available_cols = schema_df['name'].to_list()
-        except Exception:
-            # Polars로 실패 시 최소한만 pandas 사용 (fallback)
-            pragma_df = pd.read_sql_query("PRAGMA table_info(data)", conn)
-            available_cols = pragma_df['name'].tolist()
-    except Exception as e:
-        print(f"{db_path} 스키마 확인 실패: {e}")
-        if conn:
-            conn.close()
+    # 폴더 카탈로그에서 스키마 확인 (파일이 바뀌지 않았으면 PRAGMA를 다시 실행하지 않음)
+    file_info = get_file_info(db_path)
+    if file_info is None:
+        print(f"{db_path} 스키마 확인 실패")
         return None
+    available_cols = file_info['columns']
+    declared_types = file_info['dtypes']
 
     # datetime 컬럼이 이미 있으면 그대로 사용 (병합 파일 처리)
     datetime_already_exists = 'datetime' in available_cols
@@ -463,9 +575,8 @@ def read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized
         return None
     
     # PLC error 컬럼 찾기
-    plc_error_candidates = ['plc_connection_error', 'serverFault', 'fault']
     plc_error_col = None
-    for candidate in plc_error_candidates:
+    for candidate in PLC_ERROR_CANDIDATES:
         if candidate in available_cols:
             plc_error_col = candidate
             break
@@ -476,32 +587,31 @@ def read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized
     
     query = f"SELECT {', '.join(query_cols)} FROM data"
     
+    # 일부 구간만 필요하면 숫자형(자정 기준 초) time 컬럼에 대해 WHERE 절 추가
+    plc_seed = None
+    if time_range is not None and not datetime_already_exists and is_numeric_sql_type(declared_types.get(time_col)):
+        range_start, range_end = time_range
+        query += f" WHERE {time_col} BETWEEN {float(range_start)} AND {float(range_end)}"
+        if plc_error_col and not skip_plc_restoration and range_start > 0:
+            # 구간 앞부분은 읽지 않으므로 그 부분의 PLC 상태/마지막 유효값을 SQLite에서 집계해 이어받음
+            plc_seed = query_plc_seed(db_path, time_col, plc_error_col, cols_in_db, range_start)
+    
     # Polars로 직접 SQLite 읽기 (LazyFrame으로 - 효율적)
     lf = None
     
-    # 방법 1: sqlite3 연결 객체 사용 (최적화된 연결 재사용)
+    # 방법 1: 읽기 전용 연결 풀의 연결 사용 (카탈로그 조사/events 조회와 같은 연결 재사용)
     try:
-        if conn is None:
-            conn = sqlite3.connect(db_path)
-            conn.execute("PRAGMA journal_mode=OFF")
-            conn.execute("PRAGMA synchronous=OFF")
-            conn.execute("PRAGMA cache_size=-100000")
-        
-        # Polars로 직접 읽기 (LazyFrame 반환 시도)
-        df_temp = pl.read_database(
-            query=query,
-            connection=conn
-        )
+        with read_connection(db_path) as conn:
+            # Polars로 직접 읽기 (LazyFrame 반환 시도)
+            df_temp = pl.read_database(
+                query=query,
+                connection=conn
+            )
         # LazyFrame으로 변환하여 연산 체이닝
         lf = df_temp.lazy()
-        conn.close()
-        conn = None
     except Exception as e:
         # 방법 2: connection_uri 사용
         try:
-            if conn:
-                conn.close()
-                conn = None
             df_temp = pl.read_database_uri(
                 uri=f"sqlite:///{db_path}",
                 query=query,
@@ -511,18 +621,12 @@ def read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized
         except Exception as e2:
             # 방법 3: pandas로 읽어서 Polars로 변환 (최종 fallback)
             try:
-                if conn is None:
-                    conn = sqlite3.connect(db_path)
-                df_pd_temp = pd.read_sql_query(query, conn)
-                if conn:
-                    conn.close()
-                    conn = None
+                with read_connection(db_path) as conn:
+                    df_pd_temp = pd.read_sql_query(query, conn)
                 df_temp = pl.from_pandas(df_pd_temp)
                 lf = df_temp.lazy()
             except Exception as e3:
                 print(f"{db_path} 읽기 실패: {e3}")
-                if conn:
-                    conn.close()
                 return None
     
     # 컬럼 타입 변환을 LazyFrame 단계로 이동 (한 번에 처리)
@@ -548,13 +652,13 @@ def read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized
         # datetime 컬럼을 Polars datetime 타입으로 변환 (LazyFrame 단계)
         try:
             lf = lf.with_columns(
-                pl.col('datetime').str.to_datetime().alias('datetime')
+                pl.col('datetime').str.to_datetime(time_unit='ns').alias('datetime')
             )
         except Exception:
             # 이미 datetime 타입이거나 변환이 필요한 경우
             try:
                 lf = lf.with_columns(
-                    pl.col('datetime').cast(pl.Datetime).alias('datetime')
+                    pl.col('datetime').cast(DATETIME_DTYPE).alias('datetime')
                 )
             except Exception:
                 pass  # 변환이 필요 없으면 그대로 유지
@@ -563,7 +667,7 @@ def read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized
         # collect_schema()는 스키마만 확인하므로 경량 작업
         schema_names = lf.collect_schema().names()
         if plc_error_col and plc_error_col in schema_names and not skip_plc_restoration:
-            lf = restore_plc_error_data_polars(lf, plc_error_col, cols_in_db)
+            lf = restore_plc_error_data_polars(lf, plc_error_col, cols_in_db, seed=plc_seed)
         elif skip_plc_restoration:
             tprint(f"  파일명이 'restored'로 끝나므로 PLC 복원을 건너뜁니다: {os.path.basename(db_path)}")
         
@@ -581,23 +685,489 @@ def read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized
         # PLC error 기반 NaN 복원 (LazyFrame 체이닝 유지)
         schema_names = lf.collect_schema().names()
         if plc_error_col and plc_error_col in schema_names and not skip_plc_restoration:
-            lf = restore_plc_error_data_polars(lf, plc_error_col, cols_in_db)
+            lf = restore_plc_error_data_polars(lf, plc_error_col, cols_in_db, seed=plc_seed)
         elif skip_plc_restoration:
             tprint(f"  파일명이 'restored'로 끝나므로 PLC 복원을 건너뜁니다: {os.path.basename(db_path)}")
     
     # LazyFrame 실행 - 마지막에 한 번만 collect() 호출
     df_pl_result = lf.collect()
     
-    # matplotlib 호환을 위해 pandas로 변환 (마지막 단계)
-    return df_pl_result.to_pandas()
+    schema_info = {
+        'time_col': time_col,
+        'plc_error_col': plc_error_col,
+        'available_cols': available_cols,
+    }
+    return df_pl_result, schema_info
+
+
+def query_plc_seed(db_path, time_col, plc_error_col, params, before):
+    """
+    time < before인 앞부분 행의 PLC 복원 상태를 SQLite에서 집계 (행을 Python으로 가져오지 않음)
+    
+    하루 전체를 rowid 순서로 복원했을 때 before 직전 시점의 상태와 같습니다
+    (time이 rowid 순서로 증가한다고 가정).
+    - plc_state: 마지막 PLC 상태 (앞부분에 PLC 값이 없으면 하루 첫 유효 상태, 그것도 없으면 0)
+    - last_valid: 파라미터별 마지막 forward fill 값 (PLC 상태가 1이 아닌 행의 마지막 유효값)
+    
+    Args:
+        db_path: DB 파일 경로
+        time_col: 숫자형 time 컬럼명
+        plc_error_col: PLC error 컬럼명
+        params: 복원할 파라미터 리스트
+        before: 구간 시작 (자정 기준 초)
+        
+    Returns:
+        dict: {'plc_state', 'last_valid'}, 집계할 수 없으면 None (구간 안의 값만으로 복원)
+    """
+    params = [p for p in params if p != plc_error_col]
+    # 앞에서부터 PLC 값이 나올 때마다 그룹 번호가 바뀌고, 그룹의 유일한 PLC 값이 그 그룹의 상태
+    last_rid_cols = "".join(
+        f", MAX(CASE WHEN state != 1 AND {p} IS NOT NULL THEN rid END)" for p in params
+    )
+    seed_query = f"""
+        WITH grouped AS (
+            SELECT rowid AS rid, {plc_error_col} AS plc, {', '.join(params) or 'NULL'},
+                   COUNT({plc_error_col}) OVER (ORDER BY rowid) AS grp
+            FROM data WHERE {time_col} < ?
+        ), marked AS (
+            SELECT *, COALESCE(MAX(plc) OVER (PARTITION BY grp), ?) AS state FROM grouped
+        )
+        SELECT MAX(rid){last_rid_cols} FROM marked
+    """
+    try:
+        with read_connection(db_path) as conn:
+            first = conn.execute(f"SELECT {plc_error_col} FROM data WHERE {plc_error_col} IS NOT NULL "
+                                 f"ORDER BY rowid LIMIT 1").fetchone()
+            first_state = int(first[0]) if first else 0
+            row = conn.execute(seed_query, (float(before), first_state)).fetchone()
+            last_rid, param_rids = row[0], row[1:]
+            if last_rid is None:
+                return None  # 구간 앞에 행이 없음 (처음부터 읽는 것과 같음)
+            state_row = conn.execute(f"SELECT {plc_error_col} FROM data WHERE rowid <= ? AND {plc_error_col} "
+                                     f"IS NOT NULL ORDER BY rowid DESC LIMIT 1", (last_rid,)).fetchone()
+            last_valid = {}
+            for p, rid in zip(params, param_rids):
+                if rid is not None:
+                    last_valid[p] = conn.execute(f"SELECT {p} FROM data WHERE rowid = ?", (rid,)).fetchone()[0]
+    except sqlite3.Error as e:
+        # rowid가 없는 테이블, 창 함수를 지원하지 않는 SQLite 등: 구간 안의 값만으로 복원 (근사)
+        tprint(f"  ⚠ 부분 구간 PLC 복원 시작 상태를 구하지 못해 구간 안의 값으로 복원합니다 (근사): "
+               f"{os.path.basename(db_path)} ({e})")
+        return None
+    return {
+        'plc_state': int(state_row[0]) if state_row else first_state,
+        'last_valid': last_valid,
+    }
+
+
+def read_db_file_time_window(db_path, params_to_read, time_cols, start=None, end=None):
+    """
+    하루 파일 중 [start, end] 구간만 읽기 (Polars DataFrame 반환)
+    
+    메모리 캐시나 사이드카에 하루 전체가 있으면 그것을 잘라 쓰고, 없으면
+    WHERE time BETWEEN 절로 구간만 DB에서 읽습니다. 구간 앞부분의 PLC 상태와 마지막 유효값은
+    query_plc_seed로 이어받으므로 하루 전체를 복원한 뒤 자른 결과와 같습니다.
+    구간 읽기 결과는 하루 전체가 아니므로 캐시/사이드카에 저장하지 않습니다.
+    
+    Args:
+        db_path: DB 파일 경로
+        params_to_read: 읽을 파라미터 리스트
+        time_cols: 시간 컬럼 리스트
+        start: 시작 시각 (datetime, None이면 제한 없음)
+        end: 종료 시각 (datetime, None이면 제한 없음)
+        
+    Returns:
+        pl.DataFrame: 구간 데이터, 실패 시 None
+    """
+    df_pl = _cache.get(db_path, params_to_read)
+    if df_pl is None:
+        df_pl = load_sidecar(db_path, params_to_read)
+    
+    if df_pl is None:
+        time_range = None
+        base_date = extract_date_from_filename(db_path)
+        if base_date is not None:
+            range_start = (start - base_date).total_seconds() if start is not None else 0.0
+            range_end = (end - base_date).total_seconds() if end is not None else 86400.0
+            # 종료 쪽도 1초 여유를 두고 읽음 (정확한 구간은 아래에서 datetime으로 필터)
+            # 구간 앞부분의 PLC 복원 상태는 _read_db_file_from_sqlite가 query_plc_seed로 이어받음
+            time_range = (max(0.0, range_start), range_end + 1)
+            tprint(f"  ⏱ 부분 구간 읽기: {os.path.basename(db_path)} "
+                   f"({time_range[0]:.0f}~{time_range[1]:.0f}초)")
+        result = _read_db_file_from_sqlite(db_path, params_to_read, time_cols, time_range=time_range)
+        if result is None:
+            return None
+        df_pl = result[0]
+    
+    if start is not None:
+        df_pl = df_pl.filter(pl.col('datetime') >= start)
+    if end is not None:
+        df_pl = df_pl.filter(pl.col('datetime') <= end)
+    return df_pl
+
+
+# 스트리밍 읽기 시 한 번에 읽는 행 수 (청크 하나의 메모리 상한)
+STREAM_CHUNK_ROWS = 200_000
+
+
+def fetch_rows_after(conn, query_cols, after=None, limit=None, key_col='rowid'):
+    """
+    key_col(기본 rowid) 순서로 after 위치 이후의 행 조회
+    
+    rowid는 고유하므로 'rowid > ?'로 이어 읽습니다. 시간 컬럼은 같은 값이 여러 행에 있을 수 있으므로
+    'time >= ?'로 조회하고 마지막 값에서 이미 읽은 행 수만큼 건너뜁니다. (같은 시간의 행 순서는
+    기본 키 순서로 고정)
+    
+    Args:
+        conn: SQLite 연결
+        query_cols: 조회할 컬럼 리스트
+        after: 이전 호출이 반환한 위치 (None이면 처음부터)
+        limit: 최대 행 수 (None이면 제한 없음)
+        key_col: 순서/위치 기준 컬럼 ('rowid' 또는 시간 컬럼)
+        
+    Returns:
+        tuple: (pl.DataFrame 또는 None, 다음 호출에 넘길 위치)
+               위치는 rowid면 마지막 rowid, 시간 컬럼이면 (마지막 시간 값, 그 값에서 읽은 행 수)
+        
+    Raises:
+        sqlite3.OperationalError: key_col을 쓸 수 없을 때 (rowid가 없는 테이블 등)
+    """
+    if key_col == 'rowid':
+        query = f"SELECT rowid, {', '.join(query_cols)} FROM data"
+        args = ()
+        if after is not None:
+            query += " WHERE rowid > ?"
+            args = (after,)
+        query += " ORDER BY rowid"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        rows = conn.execute(query, args).fetchall()
+        if not rows:
+            return None, after
+        next_after = rows[-1][0]
+    else:
+        last_value, skip = after if after is not None else (None, 0)
+        pk_cols = [row[1] for row in sorted(conn.execute("PRAGMA table_info(data)"), key=lambda row: row[5])
+                   if row[5] > 0 and row[1] != key_col]
+        query = f"SELECT {key_col}, {', '.join(query_cols)} FROM data"
+        args = ()
+        if last_value is not None:
+            query += f" WHERE {key_col} >= ?"
+            args = (last_value,)
+        # 빈 시간 값(NULL)은 맨 앞에 오므로 마지막 값이 NULL이면 처음부터 건너뜀
+        query += f" ORDER BY {', '.join([key_col] + pk_cols)}"
+        if limit is not None:
+            query += f" LIMIT {int(limit) + skip}"
+        all_rows = conn.execute(query, args).fetchall()
+        rows = all_rows[skip:]
+        if not rows:
+            return None, after
+        last = rows[-1][0]
+        n_last = 0
+        for row in reversed(all_rows):
+            if row[0] != last:
+                break
+            n_last += 1
+        next_after = (last, n_last)
+    df = pl.DataFrame([row[1:] for row in rows], schema=query_cols, orient='row', infer_schema_length=None)
+    return df, next_after
+
+
+def resolve_read_columns(db_path, params_to_read, time_cols, available_cols=None):
+    """
+    _read_db_file_from_sqlite와 같은 규칙으로 읽을 컬럼 결정
+    
+    Args:
+        available_cols: data 테이블 컬럼 리스트 (None이면 카탈로그에서 조회)
+    
+    Returns:
+        dict: time_col, cols_in_db, plc_error_col, query_cols (읽을 수 없으면 None)
+    """
+    if available_cols is None:
+        file_info = get_file_info(db_path)
+        if file_info is None:
+            return None
+        available_cols = file_info['columns']
+    time_col = 'datetime' if 'datetime' in available_cols else next((c for c in time_cols if c in available_cols), None)
+    cols_in_db = [col for col in params_to_read if col in available_cols]
+    if time_col is None or not cols_in_db:
+        return None
+    plc_error_col = next((c for c in PLC_ERROR_CANDIDATES if c in available_cols), None)
+    query_cols = [time_col] + cols_in_db
+    if plc_error_col and plc_error_col not in query_cols:
+        query_cols.append(plc_error_col)
+    return {
+        'time_col': time_col,
+        'cols_in_db': cols_in_db,
+        'plc_error_col': plc_error_col,
+        'query_cols': query_cols,
+    }
+
+
+def prepare_raw_chunk(df, db_path, columns):
+    """
+    원본 청크에 _read_db_file_from_sqlite와 같은 타입 변환/datetime 변환 적용 (PLC 복원 전)
+    
+    Args:
+        df: fetch_rows_after로 읽은 Polars DataFrame
+        db_path: DB 파일 경로 (기준 날짜 추출용)
+        columns: resolve_read_columns 결과
+        
+    Returns:
+        pl.DataFrame: datetime 컬럼을 포함한 데이터프레임
+    """
+    casts = [pl.col(c).cast(pl.Float64, strict=False) for c in columns['cols_in_db']
+             if df.schema[c] in (pl.Utf8, pl.Object)]
+    lf = df.lazy()
+    if casts:
+        lf = lf.with_columns(casts)
+    
+    if columns['time_col'] == 'datetime':
+        if df.schema['datetime'] == pl.Utf8:
+            lf = lf.with_columns(pl.col('datetime').str.to_datetime(time_unit='ns').alias('datetime'))
+        return lf.collect()
+    
+    base_date = extract_date_from_filename(db_path)
+    if base_date is None:
+        base_date = datetime.datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return convert_datetime_vectorized_polars(lf, columns['time_col'], base_date).collect()
+
+
+def stream_restored_db_files(db_files, params_to_read, time_cols, chunk_rows=STREAM_CHUNK_ROWS,
+                             cancel_event=None, skip_cnt_check=False):
+    """
+    여러 DB 파일을 날짜 순서로 청크 단위로 읽어 PLC 상태를 파일/청크 경계 너머로 이어받아 복원
+    
+    파일별 복원(restore_plc_error_data_polars)은 자정마다 PLC 상태와 마지막 유효값이 끊기지만,
+    여기서는 StreamingPlcRestorer로 이어받으므로 모든 파일을 이어 붙여 한 번에 복원한 결과와 같습니다.
+    한 번에 chunk_rows행만 메모리에 두므로 기간이 길어도 메모리 사용량이 일정합니다.
+    (결과가 하루 전체 복원과 다르므로 캐시/사이드카는 사용하지 않습니다.)
+    
+    Args:
+        db_files: DB 파일 경로 리스트 (날짜 순으로 정렬해서 읽음)
+        params_to_read: 읽을 파라미터 리스트
+        time_cols: 시간 컬럼 리스트
+        chunk_rows: 한 번에 읽는 행 수
+        cancel_event: threading.Event (설정되면 다음 청크 전에 LoadCancelled 발생)
+        skip_cnt_check: True면 CNT 관련 파일도 읽음
+        
+    Yields:
+        tuple: (읽고 있던 파일 경로, 복원된 청크 Polars DataFrame)
+        
+    Raises:
+        LoadCancelled: cancel_event로 취소되었을 때
+    """
+    ordered = sorted(db_files, key=lambda f: (extract_date_from_filename(f) or datetime.datetime.min,
+                                              os.path.basename(f)))
+    restorer = StreamingPlcRestorer(params_to_read)
+    db_path = None
+    
+    for db_path in ordered:
+        filename = os.path.basename(db_path)
+        if not skip_cnt_check and is_cnt_related_data(db_path, params_to_read):
+            print(f"CNT 관련 데이터 제외: {filename}")
+            continue
+        columns = resolve_read_columns(db_path, params_to_read, time_cols)
+        if columns is None:
+            continue
+        skip_plc_restoration = is_restored_file(db_path)
+        
+        # 읽기 전용 연결 풀 사용 (지난 날짜 파일은 immutable 연결)
+        with read_connection(db_path) as conn:
+            key_col = 'rowid'
+            after = 0
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    tprint(f"  ⏹ 읽기 취소: {filename}")
+                    raise LoadCancelled("스트리밍 읽기 중 취소되었습니다.")
+                try:
+                    df, after = fetch_rows_after(conn, columns['query_cols'], after, chunk_rows, key_col)
+                except sqlite3.OperationalError:
+                    if key_col != 'rowid':
+                        raise
+                    # rowid가 없는 테이블은 시간 컬럼 순서로 읽음
+                    key_col, after = columns['time_col'], None
+                    continue
+                if df is None:
+                    break
+                chunk = prepare_raw_chunk(df, db_path, columns)
+                if skip_plc_restoration:
+                    ready = restorer.flush() + [chunk]
+                else:
+                    ready = restorer.push(chunk, columns['plc_error_col'])
+                for restored in ready:
+                    yield db_path, restored
+                if df.height < chunk_rows:
+                    break
+    
+    save_catalogs(ordered)
+    for restored in restorer.flush():
+        yield db_path, restored
+
+
+# 병렬 읽기 백엔드 설정
+PARALLEL_BACKENDS = ('auto', 'thread', 'process')
+PROCESS_MIN_FILES = 4                      # auto: 프로세스 풀을 쓰는 최소 파일 수
+PROCESS_MIN_TOTAL_BYTES = 256 * 1024 ** 2  # auto: 프로세스 풀을 쓰는 최소 총 파일 크기
+PROCESS_MIN_CPUS = 8                       # auto: 프로세스 풀을 쓰는 최소 논리 프로세서 수
+CANCEL_POLL_SECONDS = 0.2                  # cancel_event 확인 주기 (초)
+
+
+class LoadCancelled(Exception):
+    """cancel_event로 파일 읽기가 취소되었을 때 발생"""
+
+
+_process_pool = None
+_process_pool_workers = 0
+
+
+def _recommended_thread_workers(num_files):
+    """I/O 바운드 스레드 풀의 권장 워커 수 (논리 프로세서 수 기반)"""
+    # I/O 바운드 작업(파일 읽기)이므로 논리 프로세서 수 활용
+    logical_processors = multiprocessing.cpu_count()  # 논리 프로세서 수
+    physical_cores = logical_processors // 2  # 대략적인 물리 코어 수 (하이퍼스레딩 고려)
+    
+    # I/O 바운드 작업(파일 읽기)은 I/O 대기 시간이 많으므로
+    # 논리 프로세서 수의 1.5배가 적절
+    # 논리 프로세서 수에 따라 최대값 동적 조정:
+    # - 8개 이하 (저사양): 최대 논리 프로세서 수의 2배 (예: 8개 → 최대 16개)
+    # - 16개 이상 (고사양): 최대 32개로 제한
+    recommended_workers = logical_processors + logical_processors // 2  # 논리 프로세서 수의 1.5배
+    
+    # 최대값 동적 조정
+    if logical_processors <= 8:
+        # 저사양 CPU (i5-1135G7 등): 논리 프로세서의 2배까지
+        max_recommended = logical_processors * 2  # 8개 → 최대 16개
+    else:
+        # 고사양 CPU (i7-13700 등): 최대 32개로 제한
+        max_recommended = 32
+    
+    recommended_workers = min(recommended_workers, max_recommended)
+    recommended_workers = max(4, recommended_workers)  # 최소 4개
+    
+    # 설정 정보 출력
+    tprint(f"  CPU 정보: {logical_processors} 논리 프로세서, {physical_cores} 물리 코어 (추정)")
+    tprint(f"  권장 워커 수: {recommended_workers}개 (I/O 바운드 작업 최적화)")
+    return min(num_files, recommended_workers)
+
+
+def _recommended_process_workers(num_files):
+    """프로세스 풀의 권장 워커 수 (GIL을 잡는 작업이므로 논리 프로세서 수까지)"""
+    workers = multiprocessing.cpu_count()
+    if sys.platform == 'win32':
+        workers = min(workers, 61)  # Windows ProcessPoolExecutor 최대값
+    return max(1, min(num_files, workers))
+
+
+def choose_parallel_backend(db_files):
+    """
+    파일 수와 총 크기로 스레드/프로세스 백엔드 자동 선택
+    
+    sqlite3 행 변환, pandas 변환 등 GIL을 잡는 작업이 많으므로 파일이 많고 크면 프로세스가 유리하고,
+    파일이 적거나 작으면 프로세스 시작 비용 때문에 스레드가 유리합니다.
+    
+    Args:
+        db_files: 읽을 DB 파일 경로 리스트
+        
+    Returns:
+        str: 'thread' 또는 'process'
+    """
+    if len(db_files) < PROCESS_MIN_FILES or multiprocessing.cpu_count() < PROCESS_MIN_CPUS:
+        return 'thread'
+    
+    total_bytes = 0
+    for db_path in db_files:
+        try:
+            total_bytes += os.path.getsize(db_path)
+        except OSError:
+            pass
+    return 'process' if total_bytes >= PROCESS_MIN_TOTAL_BYTES else 'thread'
+
+
+@contextmanager
+def _spawn_safe_main():
+    """
+    spawn 방식 자식 프로세스가 메인 스크립트를 다시 실행하지 않도록 처리
+    
+    메인 스크립트(GUI)는 모듈 최상위에서 Tk 창을 만들기 때문에, 작업 제출(프로세스 생성) 동안
+    __main__.__spec__ 이름을 '__main__'으로 두어 자식에서 메인 모듈 재실행을 건너뛰게 합니다.
+    (워커 함수는 이 모듈에 있으므로 메인 모듈이 필요 없음)
+    """
+    main_module = sys.modules.get('__main__')
+    if main_module is None or getattr(main_module, '__spec__', None) is not None:
+        yield
+        return
+    
+    main_module.__spec__ = types.SimpleNamespace(name='__main__')
+    try:
+        yield
+    finally:
+        main_module.__spec__ = None
+
+
+def _get_process_pool(max_workers):
+    """재사용 가능한 프로세스 풀 반환 (워커 수가 바뀌면 다시 생성)"""
+    global _process_pool, _process_pool_workers
+    if _process_pool is not None and _process_pool_workers != max_workers:
+        shutdown_process_pool()
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+        _process_pool_workers = max_workers
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """프로세스 풀 종료 (프로그램 종료 시 또는 백엔드 변경 시)"""
+    global _process_pool, _process_pool_workers
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        _process_pool_workers = 0
+
+
+atexit.register(shutdown_process_pool)
+
+
+def _read_file_to_ipc(db_path, params_to_read, params_to_scan, time_cols, skip_cnt_check):
+    """
+    프로세스 풀 워커: 단일 파일을 읽어 Arrow IPC 버퍼로 반환
+    
+    pandas DataFrame을 pickle하는 대신 Arrow IPC 바이트로 넘겨 부모 프로세스에서
+    복사/변환 비용 없이 Polars DataFrame으로 복원합니다.
+    
+    Returns:
+        tuple: (db_path, IPC 바이트 또는 None, 상태 문자열)
+    """
+    try:
+        if not skip_cnt_check and is_cnt_related_data(db_path, params_to_read):
+            return db_path, None, "CNT 관련 데이터 제외"
+        df_pl = _read_db_file_polars(db_path, params_to_scan, time_cols)
+        if df_pl is None:
+            return db_path, None, "읽기 실패"
+        return db_path, df_pl.write_ipc(None).getvalue(), "성공"
+    except Exception as e:
+        return db_path, None, f"오류: {str(e)}"
 
 
 def read_multiple_db_files_parallel(db_files, params_to_read, time_cols, convert_datetime_vectorized, 
-                                     max_workers=None, skip_cnt_check=False):
+                                     max_workers=None, skip_cnt_check=False, use_cache=True,
+                                     use_working_set=True, backend='auto', return_polars=False,
+                                     progress_callback=None, cancel_event=None, result_callback=None):
     """
-    여러 DB 파일을 병렬로 읽기 (ThreadPoolExecutor + Polars 병렬 처리)
+    여러 DB 파일을 병렬로 읽기 (스레드/프로세스 풀 + Polars 병렬 처리)
+    
+    여러 파일을 동시에 읽고, 각 파일 내부의 데이터 처리(PLC 복원, 변환 등)는 Polars가 병렬로 처리합니다.
+    메모리 캐시에 있는 파일은 바로 사용하고, 캐시 미스 파일만 풀에 보내 읽은 결과를 캐시에 채웁니다.
+    cancel_event가 설정되면 아직 시작하지 않은 파일은 취소하고 LoadCancelled를 발생시킵니다
+    (이미 읽고 있는 파일은 백그라운드에서 끝나며 결과는 버려짐).
     
-    ThreadPoolExecutor로 여러 파일을 동시에 읽고, 각 파일 내부의 데이터 처리(PLC 복원, 변환 등)는 Polars가 병렬로 처리합니다.
+    백엔드:
+        - 'thread': ThreadPoolExecutor (시작 비용 없음, 파일이 적을 때 유리)
+        - 'process': ProcessPoolExecutor (GIL 영향 없음, 워커는 Arrow IPC 버퍼로 결과 반환)
+        - 'auto': 파일 수/총 크기/CPU 수로 자동 선택 (choose_parallel_backend)
     
     Args:
         db_files: 읽을 DB 파일 경로 리스트
@@ -606,222 +1176,371 @@ def read_multiple_db_files_parallel(db_files, params_to_read, time_cols, convert
         convert_datetime_vectorized: 벡터화된 datetime 변환 함수
         max_workers: 최대 병렬 작업 수 (None이면 자동 결정)
         skip_cnt_check: CNT 체크 건너뛰기 여부
+        use_cache: 메모리 캐시 사용 여부
+        use_working_set: 캐시 미스 시 작업 세트를 함께 읽을지 여부
+        backend: 'auto', 'thread', 'process' 중 하나
+        return_polars: True면 pandas 변환 없이 Polars DataFrame 리스트 반환
+        progress_callback: 파일 하나가 끝날 때마다 호출할 함수 (완료 수, 전체 수, 메시지)
+        cancel_event: 취소 요청용 threading.Event (None이면 취소 불가)
+        result_callback: 파일 결과가 나올 때마다(캐시 적중 포함, 완료 순서) 호출할 함수 (파일 경로, DataFrame)
         
     Returns:
         list: 읽은 DataFrame 리스트 (실패한 파일은 None)
+        
+    Raises:
+        LoadCancelled: cancel_event로 취소되었을 때
     """
     
     if not db_files:
         return []
+    if backend not in PARALLEL_BACKENDS:
+        raise ValueError(f"지원하지 않는 병렬 백엔드: {backend} (가능: {', '.join(PARALLEL_BACKENDS)})")
+    
+    results = {}
+    
+    # 캐시 확인: 적중한 파일은 바로 결과에 넣고 미스 파일만 병렬로 읽음
+    # (캐시는 skip_cnt_check 읽기 등으로도 채워지므로 CNT 체크는 적중 여부와 관계없이 수행,
+    #  테이블 구조 판정은 카탈로그에 저장된 결과라 DB를 열지 않음)
+    pending_files = []
+    for db_path in db_files:
+        if not skip_cnt_check and is_cnt_related_data(db_path, params_to_read):
+            results[db_path] = (None, "CNT 관련 데이터 제외")
+            continue
+        df_cached = _cache.get(db_path, params_to_read) if use_cache else None
+        if df_cached is not None:
+            results[db_path] = (df_cached if return_polars else _to_pandas(df_cached), "캐시")
+        else:
+            pending_files.append(db_path)
+    # CNT 체크 중 조사한 파일의 카탈로그를 한 번에 저장 (프로세스 워커도 저장된 카탈로그를 읽음)
+    save_catalogs(db_files)
+    
+    cached_count = sum(1 for _, status in results.values() if status == "캐시")
+    if cached_count:
+        tprint(f"  💾 캐시 적중: {cached_count}/{len(db_files)}개 파일 (DB 읽기 생략)")
+        if result_callback:
+            for db_path, (df_cached, status) in results.items():
+                if status == "캐시":
+                    result_callback(db_path, df_cached)
+        if progress_callback:
+            progress_callback(len(db_files) - len(pending_files), len(db_files),
+                              f"💾 캐시 적중: {cached_count}/{len(db_files)}개 파일")
+    if not pending_files:
+        return [results.get(db_path, (None, "처리 안됨"))[0] for db_path in db_files]
+    
+    if backend == 'auto':
+        backend = choose_parallel_backend(pending_files)
     
     # 최적의 워커 수 결정
-    # I/O 바운드 작업(파일 읽기)이므로 논리 프로세서 수 활용
     if max_workers is None:
-        import multiprocessing
-        logical_processors = multiprocessing.cpu_count()  # 논리 프로세서 수
-        physical_cores = logical_processors // 2  # 대략적인 물리 코어 수 (하이퍼스레딩 고려)
-        
-        # I/O 바운드 작업(파일 읽기)은 I/O 대기 시간이 많으므로
-        # 논리 프로세서 수의 1.5배가 적절
-        # 논리 프로세서 수에 따라 최대값 동적 조정:
-        # - 8개 이하 (저사양): 최대 논리 프로세서 수의 2배 (예: 8개 → 최대 16개)
-        # - 16개 이상 (고사양): 최대 32개로 제한
-        recommended_workers = logical_processors + logical_processors // 2  # 논리 프로세서 수의 1.5배
-        
-        # 최대값 동적 조정
-        if logical_processors <= 8:
-            # 저사양 CPU (i5-1135G7 등): 논리 프로세서의 2배까지
-            max_recommended = logical_processors * 2  # 8개 → 최대 16개
+        if backend == 'process':
+            max_workers = _recommended_process_workers(len(pending_files))
         else:
-            # 고사양 CPU (i7-13700 등): 최대 32개로 제한
-            max_recommended = 32
-        
-        recommended_workers = min(recommended_workers, max_recommended)
-        recommended_workers = max(4, recommended_workers)  # 최소 4개
-        max_workers = min(len(db_files), recommended_workers)
-        
-        # 설정 정보 출력
-        tprint(f"  CPU 정보: {logical_processors} 논리 프로세서, {physical_cores} 물리 코어 (추정)")
-        tprint(f"  권장 워커 수: {recommended_workers}개 (I/O 바운드 작업 최적화)")
+            max_workers = _recommended_thread_workers(len(pending_files))
     
-    results = {}
+    # 캐시 미스 시 작업 세트까지 한 번에 읽기
+    params_to_scan = list(params_to_read)
+    if use_cache and use_working_set:
+        params_to_scan += [p for p in _working_set if p not in params_to_read]
     
     def read_single_file(db_path):
-        """단일 파일 읽기 (병렬 실행용)"""
+        """단일 파일 읽기 (스레드 풀 실행용)"""
         try:
-            # CNT 체크
-            if not skip_cnt_check and is_cnt_related_data(db_path, params_to_read):
-                return db_path, None, "CNT 관련 데이터 제외"
-            
+            # CNT 체크는 캐시 확인 단계에서 이미 수행됨
             # Polars가 내부적으로 병렬 처리하여 파일 읽기 및 PLC 복원 수행
-            df = read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized)
-            if df is not None:
-                return db_path, df, "성공"
+            df_pl = _read_db_file_polars(db_path, params_to_scan, time_cols)
+            if df_pl is not None:
+                return db_path, df_pl, "성공"
             else:
                 return db_path, None, "읽기 실패"
         except Exception as e:
             return db_path, None, f"오류: {str(e)}"
     
     # 병렬로 파일 읽기
-    tprint(f"  설정: 최대 {max_workers}개 스레드로 {len(db_files)}개 파일 처리 (각 파일 내부는 Polars가 병렬 처리)")
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # 모든 파일 읽기 작업 제출
+    if backend == 'process':
+        tprint(f"  설정: 최대 {max_workers}개 프로세스로 {len(pending_files)}개 파일 처리 (결과는 Arrow IPC로 전달)")
+        executor = _get_process_pool(max_workers)
+        with _spawn_safe_main():
+            future_to_file = {
+                executor.submit(_read_file_to_ipc, db_path, params_to_read, params_to_scan,
+                               time_cols, True): db_path  # CNT 체크는 캐시 확인 단계에서 수행됨
+                for db_path in pending_files
+            }
+    else:
+        tprint(f"  설정: 최대 {max_workers}개 스레드로 {len(pending_files)}개 파일 처리 (각 파일 내부는 Polars가 병렬 처리)")
+        executor = ThreadPoolExecutor(max_workers=max_workers)
         future_to_file = {
             executor.submit(read_single_file, db_path): db_path 
-            for db_path in db_files
+            for db_path in pending_files
         }
-        
+    
+    cancelled = False
+    try:
         # 진행 상황 추적
         completed = 0
-        total = len(db_files)
+        total = len(pending_files)
+        done_before = len(db_files) - total  # 캐시 적중/CNT 제외 파일
         
-        # 완료된 작업부터 결과 수집
-        for future in as_completed(future_to_file):
-            db_path, df, status = future.result()
-            results[db_path] = (df, status)
-            completed += 1
-            
-            # 진행 상황 출력
-            filename = os.path.basename(db_path)
-            
-            # 남은 작업 수 계산 (제출된 작업 - 완료된 작업)
-            remaining_tasks = total - completed
+        # 완료된 작업부터 결과 수집 (취소 요청은 CANCEL_POLL_SECONDS마다 확인)
+        not_done = set(future_to_file)
+        while not_done:
+            done, not_done = wait(not_done, timeout=CANCEL_POLL_SECONDS if cancel_event else None,
+                                  return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    db_path, df_pl, status = future.result()
+                except Exception as e:
+                    # 워커 프로세스 비정상 종료 등
+                    db_path, df_pl, status = future_to_file[future], None, f"오류: {str(e)}"
+                
+                df = None
+                if df_pl is not None:
+                    if isinstance(df_pl, bytes):
+                        df_pl = pl.read_ipc(df_pl)
+                    if use_cache:
+                        _cache.put(db_path, df_pl)
+                    df_pl = _select_output_columns(df_pl, params_to_read)
+                    if df_pl is not None:
+                        df = df_pl if return_polars else _to_pandas(df_pl)
+                    else:
+                        status = "요청 파라미터 없음"
+                results[db_path] = (df, status)
+                completed += 1
+                if df is not None and result_callback:
+                    result_callback(db_path, df)
+                
+                # 진행 상황 출력
+                filename = os.path.basename(db_path)
+                
+                # 남은 작업 수 계산 (제출된 작업 - 완료된 작업)
+                remaining_tasks = total - completed
+                
+                if df is not None:
+                    message = f"[완료] [{completed}/{total}] {filename}: {len(df):,} 행 (대기: {remaining_tasks}개)"
+                else:
+                    message = f"[오류] [{completed}/{total}] {filename}: {status} (대기: {remaining_tasks}개)"
+                tprint(f"  {message}")
+                if progress_callback:
+                    progress_callback(done_before + completed, len(db_files), message)
             
-            if df is not None:
-                tprint(f"  [완료] [{completed}/{total}] {filename}: {len(df):,} 행 (대기: {remaining_tasks}개)")
-            else:
-                tprint(f"  [오류] [{completed}/{total}] {filename}: {status} (대기: {remaining_tasks}개)")
+            if cancel_event is not None and cancel_event.is_set() and not_done:
+                # 아직 시작하지 않은 파일은 더 이상 보내지 않음
+                cancelled = True
+                for future in not_done:
+                    future.cancel()
+                tprint(f"  ⏹ 읽기 취소: {completed}/{total}개 파일 완료, {len(not_done)}개 파일 중단")
+                raise LoadCancelled(f"{completed}/{total}개 파일을 읽은 뒤 취소되었습니다.")
+    finally:
+        # 프로세스 풀은 다음 호출에서 재사용, 취소 시에는 실행 중인 스레드를 기다리지 않음
+        if backend == 'thread':
+            executor.shutdown(wait=not cancelled, cancel_futures=True)
         
     # 원본 파일 순서대로 결과 반환
     return [results.get(db_path, (None, "처리 안됨"))[0] for db_path in db_files]
 
 
-# 메모리 캐싱을 위한 전역 캐시 (파일별, 파라미터별)
-_cache = {}
-_cache_max_size = 50  # 최대 캐시 항목 수
+# 메모리 캐싱을 위한 전역 캐시 (파일별, 컬럼별 LRU, 메모리 예산 기반)
+_cache_max_bytes = DEFAULT_CACHE_MAX_BYTES  # 캐시 메모리 예산 (바이트)
+_cache = ColumnCache(max_bytes=_cache_max_bytes, plc_error_candidates=PLC_ERROR_CANDIDATES)
+
+# 작업 세트: 캐시 미스 시 요청 파라미터와 함께 한 번의 스캔으로 읽을 파라미터 목록
+_working_set = []
+
+
+def set_working_set(params):
+    """
+    캐시 미스 시 함께 읽을 작업 세트 파라미터 설정
+    
+    Args:
+        params: 파라미터 이름 리스트 (중복은 제거됨)
+    """
+    global _working_set
+    _working_set = list(dict.fromkeys(p for p in params if p))
+    tprint(f"작업 세트 설정: {len(_working_set)}개 파라미터")
 
 
-def _get_cache_key(db_path, params_to_read):
-    """캐시 키 생성"""
-    params_str = ','.join(sorted(params_to_read))
-    return f"{db_path}::{params_str}"
+def get_working_set():
+    """현재 작업 세트 파라미터 리스트 반환"""
+    return list(_working_set)
+
+
+def build_working_set(frequent_params, custom_params=None, frequent_params_file='frequent_params.txt'):
+    """
+    자주 쓰는 파라미터(frequent_params.txt 포함)로 작업 세트 구성
+    
+    사용자 정의 파라미터 이름은 구성 파라미터로 펼칩니다.
+    
+    Args:
+        frequent_params: 자주 쓰는 파라미터 리스트
+        custom_params: 사용자 정의 파라미터 딕셔너리 (선택사항)
+        frequent_params_file: 추가로 읽을 frequent_params.txt 경로
+        
+    Returns:
+        list: 실제 DB 컬럼 이름으로 구성된 작업 세트
+    """
+    names = list(frequent_params)
+    try:
+        from db_parameter import read_frequent_params_file
+        names.extend(read_frequent_params_file(frequent_params_file))
+    except Exception as e:
+        tprint(f"{frequent_params_file} 로드 실패: {e}")
+    
+    working_set = []
+    for name in names:
+        if custom_params and name in custom_params:
+            info = custom_params[name]
+            working_set.extend(info['params'] if isinstance(info, dict) else info)
+        else:
+            working_set.append(name)
+    return list(dict.fromkeys(working_set))
 
 
 def read_db_file_with_cache(db_path, params_to_read, time_cols, convert_datetime_vectorized, 
-                             use_cache=True):
+                             use_cache=True, use_working_set=True, return_polars=False):
     """
     캐싱을 사용한 DB 파일 읽기 (같은 요청 재사용 시 즉시 반환)
     
+    캐시 미스 시 작업 세트(set_working_set)의 파라미터를 요청 파라미터와 함께
+    한 번에 읽어 두므로, 이후 작업 세트 안의 다른 파라미터 요청은 DB를 다시 스캔하지 않습니다.
+    
     Args:
         db_path: DB 파일 경로
         params_to_read: 읽을 파라미터 리스트
         time_cols: 시간 컬럼 리스트
         convert_datetime_vectorized: 벡터화된 datetime 변환 함수
         use_cache: 캐시 사용 여부
+        use_working_set: 캐시 미스 시 작업 세트를 함께 읽을지 여부
+        return_polars: True면 Polars DataFrame 반환 (캐시 적중 시 복사 없음, 읽기 전용)
         
     Returns:
-        pd.DataFrame: 처리된 데이터프레임
+        pd.DataFrame 또는 pl.DataFrame: 처리된 데이터프레임
     """
     if not use_cache:
-        return read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized)
+        df_pl = _read_db_file_polars(db_path, params_to_read, time_cols)
+    else:
+        df_pl = _read_with_cache_polars(db_path, params_to_read, time_cols, use_working_set)
     
-    cache_key = _get_cache_key(db_path, params_to_read)
+    if df_pl is None or return_polars:
+        return df_pl
+    return _to_pandas(df_pl)
+
+
+def _read_with_cache_polars(db_path, params_to_read, time_cols, use_working_set=True):
+    """캐시 조회 후 미스이면 작업 세트까지 읽어 캐시에 저장 (Polars DataFrame 반환)"""
+    # 캐시 확인 (요청 파라미터가 모두 캐시에 있으면 복사 없이 조립)
+    df_pl = _cache.get(db_path, params_to_read)
+    if df_pl is not None:
+        tprint(f"  💾 캐시에서 읽기: {os.path.basename(db_path)}")
+        return df_pl
+    return _read_and_fill_cache(db_path, params_to_read, time_cols, use_working_set)
+
+
+def _read_and_fill_cache(db_path, params_to_read, time_cols, use_working_set=True):
+    """캐시 미스 처리: 작업 세트까지 한 번에 읽어 캐시에 저장하고 요청 컬럼만 반환"""
+    params_to_scan = list(params_to_read)
+    if use_working_set:
+        params_to_scan += [p for p in _working_set if p not in params_to_read]
+    df_pl = _read_db_file_polars(db_path, params_to_scan, time_cols)
+    if df_pl is None:
+        return None
     
-    # 캐시 확인
-    if cache_key in _cache:
-        cached_df, cached_time = _cache[cache_key]
-        # 파일 수정 시간 확인 (파일이 변경되었으면 캐시 무효화)
-        try:
-            file_mtime = os.path.getmtime(db_path)
-            if cached_time >= file_mtime:
-                tprint(f"  💾 캐시에서 읽기: {os.path.basename(db_path)}")
-                return cached_df.copy()
-        except OSError:
-            pass
+    _cache.put(db_path, df_pl)
+    return _select_output_columns(df_pl, params_to_read)
+
+
+def _select_output_columns(df, params_to_read):
+    """
+    넓게 읽은 데이터프레임에서 read_db_file과 같은 컬럼 구성만 선택
     
-    # 캐시 미스: 실제 읽기
-    df = read_db_file(db_path, params_to_read, time_cols, convert_datetime_vectorized)
-                
-    if df is not None:
-        # 캐시에 저장 (최대 크기 제한)
-        if len(_cache) >= _cache_max_size:
-            # 가장 오래된 항목 제거 (FIFO)
-            oldest_key = next(iter(_cache))
-            del _cache[oldest_key]
-        
-        file_mtime = os.path.getmtime(db_path) if os.path.exists(db_path) else 0
-        _cache[cache_key] = (df.copy(), file_mtime)
+    Returns:
+        pl.DataFrame: 요청 파라미터만 포함한 데이터프레임, 요청 파라미터가 없으면 None
+    """
+    time_col = df.columns[0]
+    cols_in_df = [col for col in params_to_read if col in df.columns and col != time_col]
+    if not cols_in_df:
+        return None
     
-    return df
+    columns = [time_col] + cols_in_df
+    plc_error_col = next((c for c in PLC_ERROR_CANDIDATES if c in df.columns), None)
+    if plc_error_col and plc_error_col not in columns:
+        columns.append(plc_error_col)
+    if time_col != 'datetime' and 'datetime' in df.columns:
+        columns.append('datetime')
+    
+    if columns == list(df.columns):
+        return df
+    return df.select(columns)
+
+
+def set_cache_budget(max_bytes):
+    """
+    메모리 캐시 예산 설정
+    
+    Args:
+        max_bytes: 캐시가 사용할 최대 메모리 (바이트)
+    """
+    global _cache_max_bytes
+    _cache_max_bytes = int(max_bytes)
+    _cache.set_max_bytes(_cache_max_bytes)
+
+
+def get_cache_stats():
+    """
+    메모리 캐시 통계 반환
+    
+    Returns:
+        dict: hits, misses, evictions, hit_rate, entries, files, bytes, max_bytes
+    """
+    return _cache.stats()
 
 
 def clear_cache():
     """캐시 초기화"""
-    global _cache
     _cache.clear()
     print("캐시가 초기화되었습니다.")
 
 
+def _is_cnt_by_name(db_path, params_to_read):
+    """파일명과 파라미터명만으로 CNT 관련 여부 확인 (DB를 열지 않음)"""
+    # 파일명 기반 체크 (기존 로직)
+    db_filename = os.path.basename(db_path).lower()
+    if 'cnt' in db_filename or 'monitoring' in db_filename:
+        return True
+    
+    # 파라미터명에서 CNT 관련 패턴 체크 (미리 컴파일된 패턴)
+    for param in params_to_read:
+        if match_cnt_pattern(param):
+            print(f"CNT 관련 파라미터 발견: {param}")
+            return True
+    return False
+
+
 def is_cnt_related_data(db_path, params_to_read):
     """
     데이터베이스 파일이 CNT 관련 데이터를 포함하는지 확인
+    
+    테이블 구조 판정은 폴더 카탈로그에 파일별로 한 번 저장된 결과를 사용하므로
+    파일이 바뀌지 않았으면 DB를 열지 않습니다.
+    
     Args:
         db_path: 데이터베이스 파일 경로
         params_to_read: 읽으려는 파라미터 목록
     Returns:
         bool: CNT 관련 데이터면 True, 아니면 False
     """
-    # 파일명 기반 체크 (기존 로직)
-    db_filename = os.path.basename(db_path).lower()
-    if 'cnt' in db_filename or 'monitoring' in db_filename:
+    # 파일명/파라미터명 기반 체크 (DB를 열지 않음)
+    if _is_cnt_by_name(db_path, params_to_read):
         return True
     
-    # CNT 관련 파라미터명 패턴들
-    cnt_patterns = [
-        r'cnt\d*',  # cnt, cnt1, cnt2 등
-        r'cn[a-z]\d*',  # cnA, cnB, cnC 등
-        r'count\d*',  # count, count1, count2 등
-        r'monitor\d*',  # monitor, monitor1 등
-        r'sensor\d*cnt',  # sensor1cnt 등
-    ]
-    
-    # 파라미터명에서 CNT 관련 패턴 체크
-    for param in params_to_read:
-        param_lower = param.lower()
-        for pattern in cnt_patterns:
-            if re.search(pattern, param_lower):
-                print(f"CNT 관련 파라미터 발견: {param}")
-                return True
-    
-    # 데이터베이스 테이블 구조 체크 (간단한 샘플링)
-    try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # 테이블 목록 확인
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
-        
-        for table_name in tables:
-            table = table_name[0]
-            # 컬럼 목록 확인
-            cursor.execute(f"PRAGMA table_info({table});")
-            columns = cursor.fetchall()
-            
-            for col_info in columns:
-                col_name = col_info[1].lower()
-                for pattern in cnt_patterns:
-                    if re.search(pattern, col_name):
-                        print(f"CNT 관련 컬럼 발견: {col_name} in table {table}")
-                        conn.close()
-                        return True
-        
-        conn.close()
-        
-    except Exception as e:
-        print(f"데이터베이스 구조 체크 실패 {db_path}: {e}")
+    # 데이터베이스 테이블 구조 체크 (카탈로그에 저장된 판정 결과)
+    file_info = get_file_info(db_path)
+    if file_info is None:
+        print(f"데이터베이스 구조 체크 실패 {db_path}")
+        return False
     
+    if file_info.get('cnt_column'):
+        table, col_name = file_info['cnt_column'].split('.', 1)
+        print(f"CNT 관련 컬럼 발견: {col_name.lower()} in table {table}")
+        return True
     return False
 
 
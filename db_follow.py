@@ -0,0 +1,115 @@
+"""
+실시간 추적(follow) 모듈
+기록 중인 오늘 날짜 DB 파일에서 마지막으로 읽은 위치 이후에 추가된 행만 읽습니다.
+
+- 파일별로 마지막 rowid를 기억하고 'WHERE rowid > ?'로 새 행만 조회합니다.
+  (rowid가 없는 테이블이면 시간 컬럼 순서로 조회하고, 마지막 시간 값과 같은 행 중 이미 읽은 행은 건너뜁니다.)
+- PLC 복원은 이전 조회의 마지막 PLC 상태와 파라미터별 마지막 유효값을 이어받아 적용하므로,
+  여러 번에 나눠 읽어도 하루 전체를 한 번에 복원한 결과와 같습니다.
+- 파일 전체를 다시 읽지 않으므로 조회 비용은 새로 기록된 행 수에만 비례합니다.
+- 읽을 컬럼은 처음 한 번 카탈로그로 정하고, 이후에는 'PRAGMA schema_version'이 바뀐 경우
+  (기록 중 컬럼 추가 등)에만 'PRAGMA table_info'로 다시 정합니다. (조회마다 카탈로그를 갱신하지 않음)
+"""
+
+import os
+import sqlite3
+
+from db_file import (StreamingPlcRestorer, fetch_rows_after, is_restored_file, prepare_raw_chunk,
+                     resolve_read_columns)
+from db_connection import read_connection
+
+try:
+    from print_utils import tprint
+except ImportError:
+    tprint = print
+
+
+# 실시간 추적 조회 주기 (밀리초)
+FOLLOW_INTERVAL_MS = 2000
+
+
+class DbTailFollower:
+    """한 DB 파일의 새 행을 이어서 읽는 추적기"""
+
+    def __init__(self, db_path, params_to_read, time_cols):
+        """
+        초기화 (파일은 첫 poll에서 처음부터 읽음)
+        Args:
+            db_path: 추적할 DB 파일 경로 (보통 오늘 날짜 파일)
+            params_to_read: 읽을 파라미터 리스트
+            time_cols: 시간 컬럼 후보 리스트
+        """
+        self.db_path = db_path
+        self.params_to_read = list(params_to_read)
+        self.time_cols = list(time_cols)
+        self.key_col = 'rowid'      # rowid가 없는 테이블이면 시간 컬럼
+        self.last_key = 0           # 마지막으로 읽은 위치 (fetch_rows_after 반환값)
+        self.restorer = StreamingPlcRestorer(self.params_to_read)
+        self.skip_plc_restoration = is_restored_file(db_path)
+        self.rows_read = 0
+        self.schema_version = None  # 컬럼을 마지막으로 확인한 시점의 PRAGMA schema_version
+        self.columns = resolve_read_columns(db_path, self.params_to_read, self.time_cols)
+
+    @property
+    def is_valid(self):
+        """추적 가능한 시간 컬럼과 파라미터가 있으면 True"""
+        return self.columns is not None
+
+    def poll(self):
+        """
+        마지막 조회 이후 추가된 행을 읽어 변환/복원
+
+        Returns:
+            pl.DataFrame: 새 행 (datetime 컬럼 포함, read_db_file과 같은 컬럼 구성), 새 행이 없으면 None
+        """
+        # 오늘 파일은 immutable이 아닌 풀 연결을 재사용
+        with read_connection(self.db_path) as conn:
+            self._check_schema(conn)
+            if self.columns is None:
+                return None
+            df_new = self._fetch_new_rows(conn)
+        if df_new is None:
+            return None
+
+        df_new = prepare_raw_chunk(df_new, self.db_path, self.columns)
+        if not self.skip_plc_restoration:
+            ready = self.restorer.push(df_new, self.columns['plc_error_col'])
+            # 실시간 표시는 기다릴 수 없으므로 PLC 상태가 아직 없으면 기본 상태(0)로 바로 복원
+            ready += self.restorer.flush()
+            df_new = ready[0]
+
+        self.rows_read += df_new.height
+        tprint(f"  📡 실시간 추적: {os.path.basename(self.db_path)} +{df_new.height:,} 행 "
+               f"(누적 {self.rows_read:,} 행)")
+        return df_new
+
+    def _check_schema(self, conn):
+        """스키마가 바뀌었으면(기록 중 컬럼 추가 등) 읽을 컬럼 다시 결정"""
+        schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+        if schema_version == self.schema_version:
+            return
+        first_check = self.schema_version is None
+        self.schema_version = schema_version
+        if first_check and self.columns is not None:
+            return  # 생성 시 카탈로그로 정한 컬럼 사용
+
+        available_cols = [row[1] for row in conn.execute("PRAGMA table_info(data)")]
+        columns = resolve_read_columns(self.db_path, self.params_to_read, self.time_cols,
+                                       available_cols=available_cols)
+        if columns is not None and self.columns is not None and columns['query_cols'] != self.columns['query_cols']:
+            tprint(f"  실시간 추적: 컬럼 변경 감지 ({os.path.basename(self.db_path)})")
+        self.columns = columns
+
+    def _fetch_new_rows(self, conn):
+        """마지막 rowid(또는 time) 이후의 행 조회"""
+        try:
+            df, self.last_key = fetch_rows_after(conn, self.columns['query_cols'], self.last_key,
+                                                 key_col=self.key_col)
+        except sqlite3.OperationalError:
+            if self.key_col != 'rowid':
+                raise
+            tprint(f"  rowid를 사용할 수 없어 시간 기준으로 추적합니다: {os.path.basename(self.db_path)}")
+            self.key_col = self.columns['time_col']
+            df, self.last_key = fetch_rows_after(conn, self.columns['query_cols'], None,
+                                                 key_col=self.key_col)
+        return df
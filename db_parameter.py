@@ -11,26 +11,42 @@ import os
 # 자주 사용하는 파라미터들을 저장하는 전역 리스트
 frequent_params = []
 
+def read_frequent_params_file(path='frequent_params.txt'):
+    """
+    frequent_params.txt 형식의 파일을 파싱하여 파라미터 리스트를 반환합니다.
+    
+    Args:
+        path: 파일 경로
+        
+    Returns:
+        list: 파라미터 이름 리스트 (파일이 없으면 빈 리스트)
+    """
+    params = []
+    if not os.path.exists(path):
+        return params
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read().strip()
+    # 쉼표로 구분된 파라미터들을 파싱
+    if content:
+        # 줄바꿈과 쉼표로 분리하고 따옴표 제거
+        for line in content.split('\n'):
+            line = line.strip()
+            if line and line != ',':
+                # 따옴표와 쉼표를 완전히 제거 (양쪽 끝에서)
+                param = line.strip().rstrip(',').strip('"').strip("'").strip()
+                if param:
+                    params.append(param)
+    return params
+
+
 def load_frequent_params():
     """frequent_params.txt 파일에서 자주 사용하는 파라미터를 로드합니다."""
     global frequent_params
     try:
-        if os.path.exists('frequent_params.txt'):
-            with open('frequent_params.txt', 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                # 쉼표로 구분된 파라미터들을 파싱
-                if content:
-                    # 줄바꿈과 쉼표로 분리하고 따옴표 제거
-                    params = []
-                    for line in content.split('\n'):
-                        line = line.strip()
-                        if line and line != ',':
-                            # 따옴표와 쉼표를 완전히 제거 (양쪽 끝에서)
-                            param = line.strip().rstrip(',').strip('"').strip("'").strip()
-                            if param:
-                                params.append(param)
-                    frequent_params.extend(params)
-                    print(f"frequent_params 로드 완료: {len(params)}개 파라미터")
+        params = read_frequent_params_file('frequent_params.txt')
+        if params:
+            frequent_params.extend(params)
+            print(f"frequent_params 로드 완료: {len(params)}개 파라미터")
     except Exception as e:
         print(f"frequent_params.txt 로드 실패: {e}")
 
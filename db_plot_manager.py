@@ -20,6 +20,9 @@ from collections import defaultdict
 import datetime
 import os
 
+from plot_spans import ErrorSpanCollection
+from time_index import TimeIndex
+
 
 def create_plot_manager(db_files, time_cols, convert_datetime_vectorized, 
                        var_list, custom_params, root, onselect=None):
@@ -376,25 +379,9 @@ def add_plc_error_display(df_all, ax):
     if plc_error_col:
         error_mask = df_all[plc_error_col] == 1
         if error_mask.any():
-            in_error = False
-            error_start = None
-            
-            for time_val, is_error in zip(df_all['datetime'], error_mask):
-                if is_error and not in_error:
-                    error_start = time_val
-                    in_error = True
-                elif not is_error and in_error:
-                    try:
-                        ax.axvspan(error_start, time_val, alpha=0.2, color='orange', label='PLC Error')
-                    except:
-                        pass
-                    in_error = False
-            
-            if in_error and error_start is not None:
-                try:
-                    ax.axvspan(error_start, df_all['datetime'].iloc[-1], alpha=0.2, color='orange', label='PLC Error')
-                except:
-                    pass
+            # 구간 계산은 벡터 연산, 표시는 PolyCollection 하나 (줌 시 보이는 구간만 합쳐 갱신)
+            spans = ErrorSpanCollection(ax, df_all['datetime'].values, error_mask.values)
+            print(f"PLC Error 구간: {len(spans)}개")
         
         print(f"PLC Error 구간 표시: {error_mask.sum()} 포인트")
 
@@ -514,6 +501,8 @@ def add_plot_controls(fig, ax, all_axes, yvar, df_all, root, custom_params, onse
 
 def add_save_functionality(fig, yvar, df_all):
     """저장 기능 추가"""
+    time_index = TimeIndex.from_frame(df_all)
+
     def save_current_data():
         try:
             # 현재 표시된 축의 x축 범위 가져오기
@@ -538,8 +527,8 @@ def add_save_functionality(fig, yvar, df_all):
             
             print(f"현재 화면 시간 범위: {dt_min} ~ {dt_max}")
             
-            # 현재 화면에 표시된 시간 범위의 데이터만 필터링
-            df_visible = df_all[(df_all['datetime'] >= dt_min) & (df_all['datetime'] <= dt_max)].copy()
+            # 현재 화면에 표시된 시간 범위의 데이터만 필터링 (이진 탐색)
+            df_visible = time_index.select(df_all, dt_min, dt_max).copy()
             
             print(f"필터링된 데이터 포인트: {len(df_visible)}개 (전체: {len(df_all)}개)")
             
@@ -0,0 +1,361 @@
+"""
+여러 DB 파일 조회 모듈 (Polars Lazy 기반)
+파일 목록, 파라미터, 시간 구간, 조건(param_conditions)을 받아 한 번에 조회합니다.
+
+- 시간 구간 밖의 날짜 파일은 읽지 않고 건너뜁니다 (파일명 날짜 기준).
+- 조건 필터는 PLC 복원이 끝난 파일별 결과에 Polars lazy predicate로 적용되어
+  병합/정렬 전에 행이 줄어듭니다.
+  (SQLite WHERE로 먼저 거르면 PLC error 구간의 이전 값 복원(forward fill)이 달라지므로 사용하지 않음)
+"""
+
+import bisect
+import datetime
+import os
+
+import numpy as np
+import polars as pl
+
+from db_file import extract_date_from_filename, read_multiple_db_files_parallel, convert_datetime_vectorized
+from db_file import read_db_file_time_window, is_cnt_related_data, LoadCancelled, stream_restored_db_files
+
+try:
+    from print_utils import tprint
+except ImportError:
+    tprint = print
+
+
+ONE_DAY = datetime.timedelta(days=1)
+
+# 시간 구간 입력 형식 (날짜만 입력하면 시작은 0시, 종료는 그날 끝까지)
+TIME_WINDOW_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+
+def parse_time_window(start_text, end_text):
+    """
+    시간 구간 입력 문자열을 datetime으로 변환
+
+    Args:
+        start_text: 시작 시각 문자열 (빈 문자열이면 제한 없음)
+        end_text: 종료 시각 문자열 (빈 문자열이면 제한 없음)
+
+    Returns:
+        tuple: (start, end) datetime 또는 None
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 시작이 종료보다 늦을 때
+    """
+    def parse(text, is_end):
+        text = (text or '').strip()
+        if not text:
+            return None
+        for fmt in TIME_WINDOW_FORMATS:
+            try:
+                value = datetime.datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+            if is_end and fmt == "%Y-%m-%d":
+                value += ONE_DAY - datetime.timedelta(microseconds=1)
+            return value
+        raise ValueError(f"시간 형식이 잘못되었습니다: {text} (예: 2025-10-01 13:00)")
+
+    start = parse(start_text, False)
+    end = parse(end_text, True)
+    if start is not None and end is not None and start > end:
+        raise ValueError("시작 시각이 종료 시각보다 늦습니다.")
+    return start, end
+
+
+def build_date_index(db_files):
+    """
+    폴더 파일 목록의 날짜 인덱스 생성 (파일명 YYYY-MM-DD 기준으로 정렬)
+
+    폴더를 바꿀 때 한 번 만들어 두면 구간 조회 시 이분 탐색으로 파일을 고릅니다.
+
+    Args:
+        db_files: DB 파일 경로 리스트
+
+    Returns:
+        dict: {'dates': 정렬된 날짜 리스트, 'files': 같은 순서의 파일 리스트,
+               'undated': 파일명에 날짜가 없는 파일 리스트}
+    """
+    dated = []
+    undated = []
+    for db_path in db_files:
+        file_date = extract_date_from_filename(db_path)
+        if file_date is None:
+            undated.append(db_path)
+        else:
+            dated.append((file_date, db_path))
+    dated.sort(key=lambda item: item[0])
+    return {
+        'dates': [file_date for file_date, _ in dated],
+        'files': [db_path for _, db_path in dated],
+        'undated': undated,
+    }
+
+
+def filter_files_by_date(db_files, start=None, end=None, date_index=None):
+    """
+    시간 구간과 겹치는 날짜의 파일만 선택 (하루 단위 파일)
+
+    Args:
+        db_files: DB 파일 경로 리스트
+        start: 시작 시각 (datetime, None이면 제한 없음)
+        end: 종료 시각 (datetime, None이면 제한 없음)
+        date_index: build_date_index 결과 (None이면 db_files로 생성)
+
+    Returns:
+        list: 구간과 겹치는 파일 리스트 (파일명에 날짜가 없으면 항상 포함)
+    """
+    if start is None and end is None:
+        return list(db_files)
+
+    if date_index is None:
+        date_index = build_date_index(db_files)
+    dates = date_index['dates']
+
+    # 파일 구간 [날짜, 날짜+1일)이 [start, end]와 겹치는 범위
+    lo = bisect.bisect_right(dates, start - ONE_DAY) if start is not None else 0
+    hi = bisect.bisect_right(dates, end) if end is not None else len(dates)
+    return date_index['files'][lo:hi] + date_index['undated']
+
+
+def _is_partial_day(db_path, start, end):
+    """파일의 하루 중 일부만 구간에 포함되는지 확인"""
+    file_date = extract_date_from_filename(db_path)
+    if file_date is None:
+        return False
+    return (start is not None and start > file_date) or (end is not None and end < file_date + ONE_DAY)
+
+
+def build_condition_expr(param_conditions, logic="AND", columns=None):
+    """
+    param_conditions를 Polars 필터 표현식으로 변환
+
+    빈 값(NaN/null)은 기존 pandas 마스크와 같이 "다름" 조건만 만족합니다.
+
+    Args:
+        param_conditions: {파라미터: {'condition': '초과', 'threshold': '0'}} 형식
+        logic: 'AND' 또는 'OR'
+        columns: 데이터에 있는 컬럼 목록 (없는 파라미터의 조건은 건너뜀, None이면 확인 안 함)
+
+    Returns:
+        pl.Expr: 필터 표현식, 적용할 조건이 없으면 None
+
+    Raises:
+        ValueError: threshold가 숫자가 아닐 때
+    """
+    combined = None
+    # 0 초과 조건은 부동소수 정밀도 이슈를 고려해 epsilon 추가
+    epsilon = np.finfo(float).eps
+
+    for param, condition_data in (param_conditions or {}).items():
+        condition = condition_data.get('condition', '')
+        threshold = condition_data.get('threshold', '')
+
+        if not condition or not threshold:
+            print(f"조건이나 threshold가 비어있음: {param} - '{condition}' '{threshold}'")
+            continue
+        if columns is not None and param not in columns:
+            print(f"경고: 파라미터 '{param}'이 데이터에 없습니다.")
+            continue
+
+        try:
+            threshold_value = float(threshold)
+        except ValueError:
+            raise ValueError(f"Threshold 값은 숫자로 입력해야 합니다: {threshold}")
+
+        col = pl.col(param).cast(pl.Float64, strict=False).fill_nan(None)
+        if condition == "이상":
+            mask = col >= threshold_value
+        elif condition == "이하":
+            mask = col <= threshold_value
+        elif condition == "초과":
+            mask = col > threshold_value + epsilon
+        elif condition == "미만":
+            mask = col < threshold_value
+        elif condition == "같음":
+            mask = col == threshold_value
+        elif condition == "다름":
+            mask = col != threshold_value
+        else:
+            mask = pl.lit(True)
+        mask = mask.fill_null(condition == "다름")
+
+        if combined is None:
+            combined = mask
+        elif logic == "OR":
+            combined = combined | mask
+        else:
+            combined = combined & mask
+
+    return combined
+
+
+def _read_files_carrying_plc_state(db_files, params_to_read, time_cols, start, end, param_conditions, logic,
+                                   progress_callback, partial_callback, cancel_event, skip_cnt_check):
+    """
+    stream_restored_db_files로 읽으면서 청크마다 시간 구간/조건 필터를 적용 (query_db_files의 carry_plc_state 모드)
+
+    Returns:
+        list: 파일별 필터링된 Polars DataFrame 리스트
+    """
+    frames = []
+    current_path = None
+    file_frames = []
+    files_done = 0
+
+    def finish_file():
+        nonlocal files_done
+        files_done += 1
+        df_file = pl.concat(file_frames, how='diagonal_relaxed') if file_frames else None
+        if df_file is not None:
+            frames.append(df_file)
+            if partial_callback:
+                partial_callback(df_file)
+        if progress_callback:
+            rows = f"{df_file.height:,} 행" if df_file is not None else "0 행"
+            progress_callback(files_done, len(db_files), f"[이어받기] {os.path.basename(current_path)}: {rows}")
+
+    for db_path, chunk in stream_restored_db_files(db_files, params_to_read, time_cols,
+                                                   cancel_event=cancel_event, skip_cnt_check=skip_cnt_check):
+        if db_path != current_path:
+            if current_path is not None:
+                finish_file()
+            current_path = db_path
+            file_frames = []
+        lf = chunk.lazy()
+        if start is not None:
+            lf = lf.filter(pl.col('datetime') >= start)
+        if end is not None:
+            lf = lf.filter(pl.col('datetime') <= end)
+        condition_expr = build_condition_expr(param_conditions, logic, set(chunk.columns))
+        if condition_expr is not None:
+            lf = lf.filter(condition_expr)
+        chunk = lf.collect()
+        if chunk.height:
+            file_frames.append(chunk)
+    if current_path is not None:
+        finish_file()
+    return frames
+
+
+def query_db_files(db_files, params_to_read, time_cols, start=None, end=None,
+                   param_conditions=None, logic="AND", date_index=None, **read_kwargs):
+    """
+    여러 DB 파일을 시간 구간/조건으로 조회하여 하나의 Polars DataFrame으로 반환
+
+    하루 전체가 구간에 들어가는 파일은 병렬 읽기(캐시/사이드카 사용)로 읽고,
+    구간 경계에 걸친 파일은 read_db_file_time_window로 필요한 시간대만 읽습니다.
+
+    Args:
+        db_files: DB 파일 경로 리스트
+        params_to_read: 읽을 파라미터 리스트
+        time_cols: 시간 컬럼 리스트
+        start: 시작 시각 (datetime, None이면 제한 없음)
+        end: 종료 시각 (datetime, None이면 제한 없음)
+        param_conditions: 조건 딕셔너리 (custom_params의 'param_conditions' 형식)
+        logic: 조건 결합 로직 ('AND' 또는 'OR')
+        date_index: build_date_index 결과 (None이면 db_files로 생성)
+        **read_kwargs: read_multiple_db_files_parallel에 전달할 옵션
+                       (max_workers, backend, progress_callback, cancel_event 등)
+                       partial_callback을 주면 파일 하나가 끝날 때마다 시간 구간/조건 필터를 적용한
+                       그 파일의 Polars DataFrame으로 호출 (점진적 플롯용, 완료 순서)
+                       carry_plc_state=True면 파일별 복원 대신 stream_restored_db_files로 날짜 순서대로
+                       읽어 PLC 상태를 자정 너머로 이어받음 (캐시/사이드카 미사용)
+
+    Returns:
+        pl.DataFrame: datetime 순으로 정렬된 결과 (읽은 데이터가 없으면 None)
+
+    Raises:
+        ValueError: threshold가 숫자가 아닐 때
+        LoadCancelled: cancel_event로 취소되었을 때
+    """
+    selected_files = filter_files_by_date(db_files, start, end, date_index)
+    skipped = len(db_files) - len(selected_files)
+    if skipped:
+        tprint(f"  📅 시간 구간 밖 파일 {skipped}개 건너뜀 ({len(selected_files)}/{len(db_files)}개 읽기)")
+    if not selected_files:
+        return None
+
+    full_files = [f for f in selected_files if not _is_partial_day(f, start, end)]
+    partial_files = [f for f in selected_files if _is_partial_day(f, start, end)]
+
+    # 진행 상황은 선택된 전체 파일 기준으로 보고 (하루 전체 파일 먼저, 경계 파일은 그 뒤)
+    progress_callback = read_kwargs.pop('progress_callback', None)
+    partial_callback = read_kwargs.pop('partial_callback', None)
+    cancel_event = read_kwargs.get('cancel_event')
+    carry_plc_state = read_kwargs.pop('carry_plc_state', False)
+    total_files = len(selected_files)
+
+    def emit_partial(df):
+        """파일 하나의 결과에 최종 결과와 같은 필터를 적용해 전달"""
+        lf = df.lazy()
+        if start is not None:
+            lf = lf.filter(pl.col('datetime') >= start)
+        if end is not None:
+            lf = lf.filter(pl.col('datetime') <= end)
+        condition_expr = build_condition_expr(param_conditions, logic, set(df.columns))
+        if condition_expr is not None:
+            lf = lf.filter(condition_expr)
+        partial_callback(lf.collect())
+
+    frames = []
+    if carry_plc_state:
+        frames = _read_files_carrying_plc_state(
+            selected_files, params_to_read, time_cols, start, end,
+            param_conditions, logic, progress_callback, partial_callback, cancel_event,
+            read_kwargs.get('skip_cnt_check', False)
+        )
+        full_files = partial_files = []
+    if full_files:
+        frames = read_multiple_db_files_parallel(
+            full_files, params_to_read, time_cols, convert_datetime_vectorized,
+            return_polars=True,
+            progress_callback=(lambda done, _total, message: progress_callback(done, total_files, message))
+            if progress_callback else None,
+            result_callback=(lambda _db_path, df: emit_partial(df)) if partial_callback else None,
+            **read_kwargs
+        )
+    for i, db_path in enumerate(partial_files):
+        if cancel_event is not None and cancel_event.is_set():
+            tprint(f"  ⏹ 읽기 취소: 구간 경계 파일 {i}/{len(partial_files)}개 완료")
+            raise LoadCancelled("구간 경계 파일을 읽는 중 취소되었습니다.")
+        filename = os.path.basename(db_path)
+        if not read_kwargs.get('skip_cnt_check') and is_cnt_related_data(db_path, params_to_read):
+            print(f"CNT 관련 데이터 제외: {filename}")
+            message = f"CNT 관련 데이터 제외: {filename}"
+        else:
+            df_window = read_db_file_time_window(db_path, params_to_read, time_cols, start, end)
+            frames.append(df_window)
+            if partial_callback and df_window is not None:
+                emit_partial(df_window)
+            rows = f"{df_window.height:,} 행" if df_window is not None else "읽기 실패"
+            message = f"[구간] {filename}: {rows}"
+        if progress_callback:
+            progress_callback(len(full_files) + i + 1, total_files, message)
+    frames = [df for df in frames if df is not None]
+    if not frames:
+        return None
+
+    columns = set()
+    for df in frames:
+        columns.update(df.columns)
+
+    # 파일마다 컬럼 구성이 달라도 빈 값으로 채워 병합 (필터는 각 파일 입력으로 내려감)
+    lf = pl.concat([df.lazy() for df in frames], how='diagonal_relaxed')
+    total_rows = sum(df.height for df in frames)
+
+    if start is not None:
+        lf = lf.filter(pl.col('datetime') >= start)
+    if end is not None:
+        lf = lf.filter(pl.col('datetime') <= end)
+
+    condition_expr = build_condition_expr(param_conditions, logic, columns)
+    if condition_expr is not None:
+        lf = lf.filter(condition_expr)
+
+    df_result = lf.sort('datetime').collect()
+    if df_result.height != total_rows:
+        tprint(f"  조회 필터 결과: {total_rows:,} -> {df_result.height:,} 행")
+    return df_result
@@ -0,0 +1,329 @@
+"""
+DB 파일 다단계 롤업(집계 피라미드) 모듈
+일별 DB 파일마다 1초/10초/1분/10분 구간의 파라미터별 min/max/mean/count를 미리 계산해
+사이드카 폴더('.ldr_cache')에 Parquet로 저장합니다.
+
+- 1초 롤업은 변환/복원이 끝난 원본 데이터(read_db_file)에서, 더 큰 구간은 바로 아래 단계에서 계산합니다.
+- 원본 DB 파일의 크기와 수정 시간(mtime)이 바뀌면 롤업은 자동으로 무효화됩니다.
+- 오늘 날짜 파일(기록 중)은 저장하지 않고 메모리에서만 계산합니다.
+- 긴 기간 개요 플롯은 원본 수천만 행 대신 수천 행의 롤업으로 그릴 수 있습니다.
+"""
+
+import os
+import json
+import threading
+
+import polars as pl
+
+from db_sidecar import get_cache_dir, get_file_stamp, is_live_file
+from db_catalog import get_file_info, save_catalogs
+
+try:
+    from print_utils import tprint
+except ImportError:
+    tprint = print
+
+
+# 롤업 단계 (이름, 구간 초) - 작은 구간부터
+ROLLUP_LEVELS = [
+    ('1s', 1),
+    ('10s', 10),
+    ('1m', 60),
+    ('10m', 600),
+]
+
+# 롤업 포맷 버전 (포맷이 바뀌면 기존 롤업 무효화)
+ROLLUP_FORMAT_VERSION = 2  # 2: datetime[ns]
+
+# 롤업 구간 시작 시각 컬럼명
+BUCKET_COL = 'bucket'
+
+AGG_SUFFIXES = ('min', 'max', 'mean', 'count')
+
+_write_lock = threading.Lock()
+
+
+def get_rollup_paths(db_path):
+    """
+    롤업 Parquet(단계별)/메타데이터 파일 경로 반환
+
+    Returns:
+        tuple: ({단계 이름: parquet 경로}, meta 경로)
+    """
+    stem = os.path.splitext(os.path.basename(db_path))[0]
+    cache_dir = get_cache_dir(db_path)
+    parquet_paths = {
+        name: os.path.join(cache_dir, f"{stem}.rollup_{name}.parquet")
+        for name, _ in ROLLUP_LEVELS
+    }
+    return parquet_paths, os.path.join(cache_dir, f"{stem}.rollup.json")
+
+
+def rollup_columns(param):
+    """파라미터의 롤업 컬럼명 리스트 (param__min, param__max, param__mean, param__count)"""
+    return [f"{param}__{suffix}" for suffix in AGG_SUFFIXES]
+
+
+def choose_rollup_level(span_seconds, max_points=5000):
+    """
+    표시 구간 길이에 맞는 가장 촘촘한 롤업 단계 선택
+
+    Args:
+        span_seconds: 표시할 전체 구간 길이 (초)
+        max_points: 파라미터당 최대 점 수
+
+    Returns:
+        str: 롤업 단계 이름 (가장 큰 단계로도 넘치면 가장 큰 단계)
+    """
+    for name, seconds in ROLLUP_LEVELS:
+        if span_seconds / seconds <= max_points:
+            return name
+    return ROLLUP_LEVELS[-1][0]
+
+
+def _aggregate_raw(df, params, seconds):
+    """원본 데이터에서 첫 단계 롤업 계산"""
+    aggs = []
+    for param in params:
+        col = pl.col(param).cast(pl.Float64, strict=False).fill_nan(None)
+        aggs += [
+            col.min().alias(f"{param}__min"),
+            col.max().alias(f"{param}__max"),
+            col.mean().alias(f"{param}__mean"),
+            col.count().alias(f"{param}__count"),
+        ]
+    return (
+        df.lazy()
+        .with_columns(pl.col('datetime').dt.truncate(f"{seconds}s").alias(BUCKET_COL))
+        .group_by(BUCKET_COL)
+        .agg(aggs)
+        .sort(BUCKET_COL)
+        .collect()
+    )
+
+
+def _aggregate_rollup(df, params, seconds):
+    """아래 단계 롤업에서 더 큰 구간 롤업 계산 (mean은 count 가중 평균)"""
+    aggs = []
+    for param in params:
+        col_min, col_max, col_mean, col_count = rollup_columns(param)
+        total = pl.col(col_count).sum()
+        aggs += [
+            pl.col(col_min).min().alias(col_min),
+            pl.col(col_max).max().alias(col_max),
+            pl.when(total > 0)
+            .then((pl.col(col_mean) * pl.col(col_count)).sum() / total)
+            .otherwise(None)
+            .alias(col_mean),
+            total.alias(col_count),
+        ]
+    return (
+        df.lazy()
+        .with_columns(pl.col(BUCKET_COL).dt.truncate(f"{seconds}s"))
+        .group_by(BUCKET_COL)
+        .agg(aggs)
+        .sort(BUCKET_COL)
+        .collect()
+    )
+
+
+def build_rollups(df, params):
+    """
+    변환/복원이 끝난 데이터로 모든 단계 롤업 계산
+
+    Args:
+        df: read_db_file 결과 Polars DataFrame (datetime 컬럼 포함)
+        params: 롤업할 파라미터 리스트
+
+    Returns:
+        dict: {단계 이름: 롤업 DataFrame}
+    """
+    params = [p for p in params if p in df.columns]
+    rollups = {}
+    previous = None
+    for name, seconds in ROLLUP_LEVELS:
+        if previous is None:
+            previous = _aggregate_raw(df, params, seconds)
+        else:
+            previous = _aggregate_rollup(previous, params, seconds)
+        rollups[name] = previous
+    return rollups
+
+
+def _load_meta(db_path):
+    """유효한 롤업 메타데이터 로드 (없거나 원본이 바뀌었으면 None)"""
+    _, meta_path = get_rollup_paths(db_path)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    stamp = get_file_stamp(db_path)
+    if (
+        stamp is None
+        or meta.get("version") != ROLLUP_FORMAT_VERSION
+        or meta.get("source_size") != stamp[0]
+        or meta.get("source_mtime_ns") != stamp[1]
+    ):
+        return None
+    return meta
+
+
+def load_rollup(db_path, params, level):
+    """
+    저장된 롤업에서 요청 파라미터만 읽기
+
+    Args:
+        db_path: 원본 DB 파일 경로
+        params: 파라미터 리스트
+        level: 롤업 단계 이름 ('1s', '10s', '1m', '10m')
+
+    Returns:
+        pl.DataFrame: bucket + 파일에 있는 파라미터별 집계 컬럼, 없거나 무효하면 None
+    """
+    meta = _load_meta(db_path)
+    info = get_file_info(db_path)
+    if meta is None or info is None:
+        return None
+    # 파일에 없는 파라미터는 롤업에도 없으므로 파일에 있는 파라미터만 확인
+    file_params = [p for p in params if p in info['columns']]
+    if not file_params or any(p not in meta["params"] for p in file_params):
+        return None
+
+    parquet_paths, _ = get_rollup_paths(db_path)
+    columns = [BUCKET_COL]
+    for param in file_params:
+        columns += rollup_columns(param)
+    try:
+        return pl.read_parquet(parquet_paths[level], columns=columns)
+    except Exception:
+        return None
+
+
+def save_rollups(db_path, rollups, params):
+    """
+    계산한 롤업을 저장 (기존에 저장된 다른 파라미터와 병합)
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    if is_live_file(db_path):
+        return False
+    stamp = get_file_stamp(db_path)
+    if stamp is None:
+        return False
+
+    parquet_paths, meta_path = get_rollup_paths(db_path)
+    tmp_suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+
+    with _write_lock:
+        try:
+            meta = _load_meta(db_path)
+            stored_params = list(meta["params"]) if meta is not None else []
+            new_params = [p for p in params if p not in stored_params]
+            if meta is not None and not new_params:
+                return True
+
+            os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+            for name, df in rollups.items():
+                if stored_params:
+                    existing = pl.read_parquet(parquet_paths[name])
+                    new_cols = [c for p in new_params for c in rollup_columns(p)]
+                    df = existing.join(df.select([BUCKET_COL] + new_cols), on=BUCKET_COL, how='full',
+                                       coalesce=True).sort(BUCKET_COL)
+                df.write_parquet(parquet_paths[name] + tmp_suffix, compression="zstd")
+                os.replace(parquet_paths[name] + tmp_suffix, parquet_paths[name])
+
+            meta = {
+                "version": ROLLUP_FORMAT_VERSION,
+                "source_size": stamp[0],
+                "source_mtime_ns": stamp[1],
+                "params": stored_params + new_params,
+            }
+            with open(meta_path + tmp_suffix, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(meta_path + tmp_suffix, meta_path)
+        except Exception as e:
+            tprint(f"  롤업 저장 실패: {os.path.basename(db_path)} ({e})")
+            return False
+    return True
+
+
+def get_rollup(db_path, params, time_cols, level):
+    """
+    파일 하나의 롤업 반환 (저장된 롤업이 없으면 계산 후 저장)
+
+    Args:
+        db_path: 원본 DB 파일 경로
+        params: 파라미터 리스트
+        time_cols: 시간 컬럼 리스트
+        level: 롤업 단계 이름
+
+    Returns:
+        pl.DataFrame: 롤업 데이터, 읽을 데이터가 없으면 None
+    """
+    info = get_file_info(db_path)
+    if info is not None and not any(p in info['columns'] for p in params):
+        return None  # 요청 파라미터가 하나도 없는 파일
+
+    df_rollup = load_rollup(db_path, params, level)
+    if df_rollup is not None:
+        return df_rollup
+
+    from db_file import read_db_file
+    df = read_db_file(db_path, params, time_cols, None, return_polars=True)
+    if df is None:
+        return None
+
+    available = [p for p in params if p in df.columns]
+    if not available:
+        return None
+    rollups = build_rollups(df, available)
+    if save_rollups(db_path, rollups, available):
+        tprint(f"  📊 롤업 생성: {os.path.basename(db_path)} ({len(available)}개 파라미터)")
+    return rollups[level]
+
+
+def query_rollups(db_files, params, time_cols, level, start=None, end=None,
+                  progress_callback=None, cancel_event=None):
+    """
+    여러 파일의 롤업을 이어 붙여 반환
+
+    Args:
+        db_files: DB 파일 경로 리스트 (구간에 해당하는 파일만 전달 권장)
+        params: 파라미터 리스트
+        time_cols: 시간 컬럼 리스트
+        level: 롤업 단계 이름
+        start: 시작 시각 (None이면 제한 없음)
+        end: 종료 시각 (None이면 제한 없음)
+        progress_callback: 진행 콜백 progress_callback(완료 수, 전체 수, 메시지) (선택)
+        cancel_event: 취소 요청용 threading.Event (설정되면 다음 파일 전에 LoadCancelled 발생)
+
+    Returns:
+        pl.DataFrame: bucket 순으로 정렬된 롤업, 없으면 None
+
+    Raises:
+        LoadCancelled: cancel_event로 취소되었을 때
+    """
+    from db_file import LoadCancelled
+
+    frames = []
+    for i, db_path in enumerate(db_files, 1):
+        if cancel_event is not None and cancel_event.is_set():
+            raise LoadCancelled()
+        df = get_rollup(db_path, params, time_cols, level)
+        if df is not None:
+            frames.append(df)
+        if progress_callback:
+            progress_callback(i, len(db_files), os.path.basename(db_path))
+    save_catalogs(db_files)
+    if not frames:
+        return None
+
+    lf = pl.concat([df.lazy() for df in frames], how='diagonal_relaxed')
+    if start is not None:
+        lf = lf.filter(pl.col(BUCKET_COL) >= start)
+    if end is not None:
+        lf = lf.filter(pl.col(BUCKET_COL) <= end)
+    return lf.sort(BUCKET_COL).collect()
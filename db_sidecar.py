@@ -0,0 +1,226 @@
+"""
+DB 파일 컬럼형 사이드카 저장소 모듈 (Parquet 기반)
+변환/복원이 끝난 일별 DB 데이터를 Parquet 파일로 보관하여
+다음 읽기부터는 필요한 컬럼만 바로 읽을 수 있도록 합니다.
+
+사이드카는 DB 파일과 같은 폴더의 '.ldr_cache' 디렉터리에 저장되며,
+원본 DB 파일의 크기와 수정 시간(mtime)이 바뀌면 자동으로 무효화됩니다.
+"""
+
+import os
+import json
+import datetime
+import threading
+
+import polars as pl
+
+try:
+    from print_utils import tprint
+except ImportError:
+    tprint = print
+
+
+# 사이드카 저장 디렉터리 이름 (DB 폴더 하위)
+SIDECAR_DIR_NAME = ".ldr_cache"
+
+# 메타데이터 포맷 버전 (포맷이 바뀌면 기존 사이드카 무효화)
+SIDECAR_FORMAT_VERSION = 2  # 2: datetime[ns], 숫자 time의 소수 초 유지
+
+
+def get_cache_dir(db_path):
+    """
+    DB 파일에 대응하는 캐시 디렉터리 경로 반환
+
+    Args:
+        db_path: DB 파일 경로
+
+    Returns:
+        str: 캐시 디렉터리 경로 (DB 폴더/.ldr_cache)
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), SIDECAR_DIR_NAME)
+
+
+def get_file_stamp(db_path):
+    """
+    파일 변경 여부 판단용 스탬프 (크기, mtime 나노초)
+
+    Returns:
+        tuple: (size, mtime_ns), 파일이 없으면 None
+    """
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def is_live_file(db_path):
+    """
+    오늘 날짜 DB 파일인지 확인 (기록 중인 파일은 사이드카를 만들지 않음)
+
+    Args:
+        db_path: DB 파일 경로
+
+    Returns:
+        bool: 파일명의 날짜가 오늘이면 True
+    """
+    from db_file import extract_date_from_filename
+    file_date = extract_date_from_filename(db_path)
+    if file_date is None:
+        return False
+    return file_date.date() == datetime.date.today()
+
+
+def get_sidecar_paths(db_path):
+    """
+    사이드카 Parquet/메타데이터 파일 경로 반환
+
+    Returns:
+        tuple: (parquet_path, meta_path)
+    """
+    stem = os.path.splitext(os.path.basename(db_path))[0]
+    cache_dir = get_cache_dir(db_path)
+    return (
+        os.path.join(cache_dir, f"{stem}.parquet"),
+        os.path.join(cache_dir, f"{stem}.json"),
+    )
+
+
+def _load_meta(db_path):
+    """유효한 사이드카 메타데이터 로드 (없거나 원본이 바뀌었으면 None)"""
+    parquet_path, meta_path = get_sidecar_paths(db_path)
+    if not (os.path.exists(parquet_path) and os.path.exists(meta_path)):
+        return None
+
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    stamp = get_file_stamp(db_path)
+    if (
+        stamp is None
+        or meta.get("version") != SIDECAR_FORMAT_VERSION
+        or meta.get("source_size") != stamp[0]
+        or meta.get("source_mtime_ns") != stamp[1]
+    ):
+        return None
+    return meta
+
+
+def _output_columns(time_col, cols_in_db, plc_error_col):
+    """read_db_file 결과와 같은 순서의 컬럼 목록"""
+    columns = [time_col] + list(cols_in_db)
+    if plc_error_col and plc_error_col not in columns:
+        columns.append(plc_error_col)
+    if time_col != "datetime":
+        columns.append("datetime")
+    return columns
+
+
+def load_sidecar(db_path, params_to_read):
+    """
+    사이드카에서 요청한 파라미터만 읽기
+
+    Args:
+        db_path: 원본 DB 파일 경로
+        params_to_read: 읽을 파라미터 리스트
+
+    Returns:
+        pl.DataFrame: 변환/복원이 끝난 데이터, 사이드카가 없거나 컬럼이 부족하면 None
+    """
+    meta = _load_meta(db_path)
+    if meta is None:
+        return None
+
+    available_cols = set(meta["available_cols"])
+    cols_in_db = [col for col in params_to_read if col in available_cols]
+    if not cols_in_db:
+        return None
+
+    stored_cols = set(meta["columns"])
+    if any(col not in stored_cols for col in cols_in_db):
+        return None
+
+    columns = _output_columns(meta["time_col"], cols_in_db, meta.get("plc_error_col"))
+    parquet_path, _ = get_sidecar_paths(db_path)
+    try:
+        df = pl.read_parquet(parquet_path, columns=columns)
+    except Exception as e:
+        tprint(f"  사이드카 읽기 실패, DB에서 다시 읽습니다: {os.path.basename(db_path)} ({e})")
+        return None
+
+    tprint(f"  📦 사이드카에서 읽기: {os.path.basename(db_path)} ({len(cols_in_db)}개 파라미터)")
+    return df
+
+
+_write_lock = threading.Lock()
+
+
+def update_sidecar(db_path, df, time_col, plc_error_col, available_cols):
+    """
+    새로 읽은 컬럼을 사이드카에 추가 저장 (기존 컬럼과 병합)
+
+    Args:
+        db_path: 원본 DB 파일 경로
+        df: read_db_file이 만든 Polars DataFrame (변환/복원 완료)
+        time_col: 시간 컬럼명
+        plc_error_col: PLC error 컬럼명 (없으면 None)
+        available_cols: DB 파일의 전체 컬럼 목록
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    if df is None or is_live_file(db_path):
+        return False
+
+    stamp = get_file_stamp(db_path)
+    if stamp is None:
+        return False
+
+    parquet_path, meta_path = get_sidecar_paths(db_path)
+
+    with _write_lock:
+        try:
+            meta = _load_meta(db_path)
+            if meta is not None and meta["time_col"] == time_col:
+                existing = pl.read_parquet(parquet_path)
+                new_cols = [c for c in df.columns if c not in existing.columns]
+                if not new_cols:
+                    return True
+                if existing.height == df.height:
+                    df = existing.with_columns(df.select(new_cols))
+
+            os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+            tmp_suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+            df.write_parquet(parquet_path + tmp_suffix, compression="zstd", statistics=True)
+            os.replace(parquet_path + tmp_suffix, parquet_path)
+
+            meta = {
+                "version": SIDECAR_FORMAT_VERSION,
+                "source_size": stamp[0],
+                "source_mtime_ns": stamp[1],
+                "time_col": time_col,
+                "plc_error_col": plc_error_col,
+                "available_cols": list(available_cols),
+                "columns": df.columns,
+            }
+            with open(meta_path + tmp_suffix, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(meta_path + tmp_suffix, meta_path)
+        except Exception as e:
+            # 네트워크 공유 폴더 등 쓰기 권한이 없는 경우 사이드카 없이 계속 진행
+            tprint(f"  사이드카 저장 실패: {os.path.basename(db_path)} ({e})")
+            return False
+
+    return True
+
+
+def clear_sidecar(db_path):
+    """특정 DB 파일의 사이드카 삭제"""
+    for path in get_sidecar_paths(db_path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
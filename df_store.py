@@ -0,0 +1,233 @@
+"""
+병합 결과 저장소 모듈 (메모리 맵 Arrow IPC)
+여러 DB 파일을 읽어 병합/필터링한 결과(df_all)를 캐시 폴더에 Arrow IPC 파일로 저장하고,
+메모리 맵으로 열어 pandas 컬럼이 파일 내용을 복사 없이 바로 참조하도록 합니다.
+
+- 데이터는 OS 페이지 캐시를 통해 필요한 부분만 메모리에 올라오므로 RAM보다 큰 기간도 스왑 없이 다룰 수 있습니다.
+- 같은 선택(파일 + 파라미터 + 시간 구간 + 조건)을 다시 열면 DB를 읽지 않고 저장된 파일을 바로 엽니다.
+- 원본 DB 파일의 크기나 수정 시간이 바뀌면 키가 달라져 다시 읽습니다.
+- 열린 컬럼은 읽기 전용 배열이므로 값을 바꾸려면 복사본을 만들어야 합니다.
+- 저장소 크기가 MERGED_STORE_MAX_BYTES를 넘으면 오래 사용하지 않은 파일부터 지웁니다.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+
+import polars as pl
+
+from db_sidecar import get_cache_dir, get_file_stamp
+from db_dtypes import load_dtype_policy, optimize_dtypes
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401  (pa.ipc 사용)
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    PYARROW_AVAILABLE = False
+
+try:
+    from print_utils import tprint
+except ImportError:
+    tprint = print
+
+
+# 저장소 디렉터리 이름 (첫 번째 DB 파일의 캐시 폴더 하위)
+MERGED_STORE_DIR_NAME = "merged"
+
+# 저장 포맷 버전 (포맷이 바뀌면 기존 저장 파일 무효화)
+MERGED_STORE_FORMAT_VERSION = 3  # 2: float32는 값이 정확히 유지될 때만 사용, 3: 실수형 컬럼은 정수형으로 바꾸지 않음
+
+# 저장소 전체 크기 상한 (바이트)
+MERGED_STORE_MAX_BYTES = 8 * 1024 ** 3
+
+
+def get_store_dir(db_files):
+    """
+    병합 결과 저장소 디렉터리 경로 반환
+
+    Args:
+        db_files: 선택된 DB 파일 리스트
+
+    Returns:
+        str: 첫 번째 DB 파일의 캐시 폴더/merged (파일이 없으면 임시 폴더)
+    """
+    if db_files:
+        return os.path.join(get_cache_dir(sorted(db_files)[0]), MERGED_STORE_DIR_NAME)
+    return os.path.join(tempfile.gettempdir(), "ldr_" + MERGED_STORE_DIR_NAME)
+
+
+def make_selection_key(db_files, params, start=None, end=None, param_conditions=None, logic='AND',
+                       carry_plc_state=False):
+    """
+    선택 조건으로 저장 파일 키 생성
+
+    Args:
+        db_files: 선택된 DB 파일 리스트
+        params: 읽을 파라미터 리스트
+        start, end: 시간 구간 (None이면 제한 없음)
+        param_conditions: 파라미터별 조건
+        logic: 'AND' 또는 'OR'
+        carry_plc_state: 날짜 경계 PLC 상태 이어받기 여부
+
+    Returns:
+        str: 키 (원본 파일 크기/수정 시간과 dtype 정책 포함), 없는 파일이 있으면 None
+    """
+    files = []
+    for path in sorted(db_files):
+        stamp = get_file_stamp(path)
+        if stamp is None:
+            return None
+        files.append([os.path.abspath(path), stamp[0], stamp[1]])
+
+    selection = {
+        'version': MERGED_STORE_FORMAT_VERSION,
+        'files': files,
+        'params': list(params),
+        'start': None if start is None else str(start),
+        'end': None if end is None else str(end),
+        'conditions': param_conditions or {},
+        'logic': logic,
+        'carry_plc_state': bool(carry_plc_state),
+        'dtype_policy': load_dtype_policy(),
+    }
+    text = json.dumps(selection, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _store_path(db_files, key):
+    return os.path.join(get_store_dir(db_files), f"{key}.arrow")
+
+
+def open_merged_store(db_files, key):
+    """
+    저장된 병합 결과를 메모리 맵으로 열기
+
+    Args:
+        db_files: 선택된 DB 파일 리스트 (저장소 위치 결정용)
+        key: make_selection_key 결과
+
+    Returns:
+        pd.DataFrame: 파일을 참조하는 읽기 전용 DataFrame, 없거나 열 수 없으면 None
+    """
+    if not PYARROW_AVAILABLE or key is None:
+        return None
+    path = _store_path(db_files, key)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        source = pa.memory_map(path, 'r')
+        table = pa.ipc.open_file(source).read_all()
+        # split_blocks: 컬럼마다 별도 블록으로 두어 pandas가 배열을 합치며 복사하지 않도록 함
+        df = table.to_pandas(split_blocks=True)
+    except (OSError, pa.ArrowException) as e:
+        tprint(f"  병합 결과 파일 열기 실패 ({os.path.basename(path)}): {e}")
+        return None
+
+    try:
+        os.utime(path)  # 최근 사용 시각 갱신 (정리 순서용)
+    except OSError:
+        pass
+    return df
+
+
+def _prepare_for_store(df):
+    """pandas에서 복사 없이 열 수 있도록 실수형 빈 값을 NaN으로 채움 (validity 비트맵 제거)"""
+    fill_exprs = [
+        pl.col(col).fill_null(float('nan'))
+        for col, dtype in df.schema.items()
+        if dtype in (pl.Float32, pl.Float64) and df[col].null_count() > 0
+    ]
+    return df.with_columns(fill_exprs) if fill_exprs else df
+
+
+def write_merged_store(db_files, key, df):
+    """
+    병합 결과를 Arrow IPC 파일로 저장
+
+    Args:
+        db_files: 선택된 DB 파일 리스트 (저장소 위치 결정용)
+        key: make_selection_key 결과
+        df: dtype 최적화가 끝난 Polars DataFrame
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    if not PYARROW_AVAILABLE or key is None:
+        return False
+    path = _store_path(db_files, key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 레코드 배치 하나로 저장해야 컬럼이 청크 하나가 되어 pandas에서 복사 없이 열림
+        _prepare_for_store(df).rechunk().write_ipc(tmp_path, compression='uncompressed',
+                                                   record_batch_size=max(df.height, 1))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        tprint(f"  병합 결과 저장 실패: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+    evict_merged_store(os.path.dirname(path), keep=path)
+    return True
+
+
+def evict_merged_store(store_dir, max_bytes=MERGED_STORE_MAX_BYTES, keep=None):
+    """
+    저장소 크기가 상한을 넘으면 오래 사용하지 않은 파일부터 삭제
+
+    Args:
+        store_dir: 저장소 디렉터리
+        max_bytes: 전체 크기 상한 (바이트)
+        keep: 지우지 않을 파일 경로 (방금 저장한 파일)
+    """
+    try:
+        entries = []
+        for name in os.listdir(store_dir):
+            if name.endswith('.arrow'):
+                path = os.path.join(store_dir, name)
+                st = os.stat(path)
+                entries.append((st.st_mtime_ns, st.st_size, path))
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if keep is not None and os.path.abspath(path) == os.path.abspath(keep):
+            continue
+        try:
+            os.remove(path)  # Windows에서 아직 열려 있는 파일은 삭제 실패 -> 다음 정리 때 다시 시도
+        except OSError:
+            continue
+        total -= size
+        tprint(f"  🧹 병합 결과 정리: {os.path.basename(path)} ({size / 1024 ** 2:.1f} MiB)")
+
+
+def materialize_merged(db_files, key, df_pl):
+    """
+    병합 결과를 저장소에 쓰고 메모리 맵 pandas DataFrame으로 반환
+
+    Args:
+        db_files: 선택된 DB 파일 리스트
+        key: make_selection_key 결과 (None이면 저장하지 않음)
+        df_pl: 병합/필터링된 Polars DataFrame
+
+    Returns:
+        pd.DataFrame: 저장에 성공하면 파일을 참조하는 DataFrame, 실패하면 메모리 상의 DataFrame
+    """
+    df_pl = optimize_dtypes(df_pl)
+    if write_merged_store(db_files, key, df_pl):
+        df = open_merged_store(db_files, key)
+        if df is not None:
+            tprint(f"  💾 병합 결과 메모리 맵 저장: {df_pl.height:,} 행, "
+                   f"{df_pl.estimated_size() / 1024 ** 2:.1f} MiB")
+            return df
+    return df_pl.to_pandas()
@@ -11,6 +11,8 @@ import pandas as pd
 import threading
 from datetime import datetime
 
+from db_connection import read_connection
+
 
 class ErrorLogManager:
     """Error Log 관리 클래스"""
@@ -169,69 +171,67 @@ class ErrorLogManager:
                     log_tree.after(0, lambda i=i: progress_bar.config(value=i))
                     
                     try:
-                        # DB 연결 및 events 테이블 조회
-                        conn = sqlite3.connect(db_file)
-                        cursor = conn.cursor()
-                        
-                        # events 테이블 존재 확인
-                        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='events';")
-                        if cursor.fetchone():
-                            # 컬럼 정보 먼저 가져오기
-                            cursor.execute("PRAGMA table_info(events)")
-                            columns = [column[1] for column in cursor.fetchall()]
-                            
-                            # 시간 관련 컬럼 찾기
-                            time_columns = ['timestamp', 'time', 'datetime', 'date', 'created_at', 'updated_at']
-                            order_column = None
-                            for time_col in time_columns:
-                                if time_col in columns:
-                                    order_column = time_col
-                                    break
-                            
-                            # 적절한 쿼리 실행
-                            if order_column:
-                                cursor.execute(f"SELECT * FROM events ORDER BY {order_column} DESC LIMIT 1000")
-                            else:
-                                cursor.execute("SELECT * FROM events LIMIT 1000")
+                        # events 테이블 조회 (읽기 전용 연결 풀, 데이터 읽기와 같은 연결 재사용)
+                        with read_connection(db_file) as conn:
+                            cursor = conn.cursor()
                             
-                            events = cursor.fetchall()
-                            
-                            for event in events:
-                                event_dict = dict(zip(columns, event))
-                                event_dict['source_file'] = filename
+                            # events 테이블 존재 확인
+                            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='events';")
+                            if cursor.fetchone():
+                                # 컬럼 정보 먼저 가져오기
+                                cursor.execute("PRAGMA table_info(events)")
+                                columns = [column[1] for column in cursor.fetchall()]
                                 
-                                # 파일명에서 날짜 추출 + Time을 시:분:초로 변환해서 Datetime 생성
-                                if 'time' in event_dict:
-                                    try:
-                                        # 파일명에서 날짜 추출 (예: 2025-09-25.db -> 2025-09-25)
-                                        file_date = filename.replace('.db', '')
-                                        
-                                        # Time 값을 초 단위로 가정하고 시:분:초로 변환
-                                        time_seconds = int(float(event_dict['time']))
-                                        hours = time_seconds // 3600
-                                        minutes = (time_seconds % 3600) // 60
-                                        seconds = time_seconds % 60
-                                        
-                                        # 완전한 datetime 문자열 생성
-                                        time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                                        full_datetime = f"{file_date} {time_str}"
-                                        event_dict['Datetime'] = full_datetime
-                                        
-                                        # 원본 time 컬럼 제거
-                                        del event_dict['time']
-                                        
-                                    except Exception as e:
-                                        print(f"Time → Datetime 변환 오류: {e}")
-                                        # 변환 실패시 원본 값 유지하고 컬럼명만 변경
-                                        event_dict['Datetime'] = str(event_dict.pop('time', ''))
-                                elif 'datetime' in event_dict:
-                                    # datetime 컬럼이 있으면 그대로 사용
-                                    event_dict['Datetime'] = str(event_dict['datetime'])
-                                    del event_dict['datetime']
+                                # 시간 관련 컬럼 찾기
+                                time_columns = ['timestamp', 'time', 'datetime', 'date', 'created_at', 'updated_at']
+                                order_column = None
+                                for time_col in time_columns:
+                                    if time_col in columns:
+                                        order_column = time_col
+                                        break
                                 
-                                all_events.append(event_dict)
-                        
-                        conn.close()
+                                # 적절한 쿼리 실행
+                                if order_column:
+                                    cursor.execute(f"SELECT * FROM events ORDER BY {order_column} DESC LIMIT 1000")
+                                else:
+                                    cursor.execute("SELECT * FROM events LIMIT 1000")
+                                
+                                events = cursor.fetchall()
+                                
+                                for event in events:
+                                    event_dict = dict(zip(columns, event))
+                                    event_dict['source_file'] = filename
+                                    
+                                    # 파일명에서 날짜 추출 + Time을 시:분:초로 변환해서 Datetime 생성
+                                    if 'time' in event_dict:
+                                        try:
+                                            # 파일명에서 날짜 추출 (예: 2025-09-25.db -> 2025-09-25)
+                                            file_date = filename.replace('.db', '')
+                                            
+                                            # Time 값을 초 단위로 가정하고 시:분:초로 변환
+                                            time_seconds = int(float(event_dict['time']))
+                                            hours = time_seconds // 3600
+                                            minutes = (time_seconds % 3600) // 60
+                                            seconds = time_seconds % 60
+                                            
+                                            # 완전한 datetime 문자열 생성
+                                            time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+                                            full_datetime = f"{file_date} {time_str}"
+                                            event_dict['Datetime'] = full_datetime
+                                            
+                                            # 원본 time 컬럼 제거
+                                            del event_dict['time']
+                                            
+                                        except Exception as e:
+                                            print(f"Time → Datetime 변환 오류: {e}")
+                                            # 변환 실패시 원본 값 유지하고 컬럼명만 변경
+                                            event_dict['Datetime'] = str(event_dict.pop('time', ''))
+                                    elif 'datetime' in event_dict:
+                                        # datetime 컬럼이 있으면 그대로 사용
+                                        event_dict['Datetime'] = str(event_dict['datetime'])
+                                        del event_dict['datetime']
+                                    
+                                    all_events.append(event_dict)
                         
                     except Exception as e:
                         print(f"DB 파일 {filename} 처리 중 오류: {e}")
@@ -0,0 +1,133 @@
+"""
+백그라운드 데이터 로드 작업 모듈
+DB 읽기/병합/필터링처럼 오래 걸리는 작업을 Tk 메인 스레드 밖(작업 스레드)에서 실행합니다.
+
+- 작업 스레드는 진행 상황/결과/오류를 큐에 넣기만 하고 Tk 위젯은 건드리지 않습니다.
+- Tk 쪽은 root.after로 큐를 주기적으로 확인해 진행 표시줄을 갱신하고 결과 콜백을 호출합니다.
+- 중간 결과(파일 하나의 데이터 등)는 report_partial로 보내면 순서대로 on_partial이 호출됩니다.
+- 취소는 threading.Event로 요청하며, 작업 함수(read_multiple_db_files_parallel 등)가
+  새 파일 전달을 멈추고 LoadCancelled를 발생시키면 취소 콜백이 호출됩니다.
+"""
+
+import queue
+import threading
+import traceback
+
+from db_file import LoadCancelled
+
+try:
+    from print_utils import tprint
+except ImportError:
+    tprint = print
+
+
+# 큐 확인 주기 (밀리초)
+DEFAULT_POLL_MS = 100
+
+
+class BackgroundLoadJob:
+    """작업 스레드에서 함수를 실행하고 결과를 Tk 메인 스레드로 전달"""
+
+    def __init__(self, root, work, on_done, on_error=None, on_progress=None, on_cancelled=None,
+                 on_partial=None, poll_ms=DEFAULT_POLL_MS):
+        """
+        초기화
+        Args:
+            root: tkinter root (after 호출용)
+            work: 작업 함수 work(progress_callback, cancel_event) -> 결과
+            on_done: 완료 시 Tk 스레드에서 호출 on_done(결과)
+            on_error: 예외 시 Tk 스레드에서 호출 on_error(예외)
+            on_progress: 진행 시 Tk 스레드에서 호출 on_progress(완료 수, 전체 수, 메시지)
+            on_cancelled: 취소 완료 시 Tk 스레드에서 호출 on_cancelled()
+            on_partial: 중간 결과마다 Tk 스레드에서 호출 on_partial(중간 결과)
+            poll_ms: 큐 확인 주기 (밀리초)
+        """
+        self.root = root
+        self.work = work
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancelled = on_cancelled
+        self.on_partial = on_partial
+        self.poll_ms = poll_ms
+        self.cancel_event = threading.Event()
+        self._queue = queue.Queue()
+        self._thread = None
+        self._finished = False
+
+    @property
+    def running(self):
+        """작업이 시작되었고 아직 결과가 전달되지 않았으면 True"""
+        return self._thread is not None and not self._finished
+
+    def start(self):
+        """작업 스레드 시작 및 큐 확인 예약"""
+        self._thread = threading.Thread(target=self._run, name="LoadJob", daemon=True)
+        self._thread.start()
+        self.root.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self):
+        """취소 요청 (이미 읽고 있는 파일은 끝까지 읽지만 새 파일은 시작하지 않음)"""
+        if self.running and not self.cancel_event.is_set():
+            tprint("⏹ 데이터 로드 취소 요청")
+            self.cancel_event.set()
+
+    def report_progress(self, done, total, message=""):
+        """진행 상황 전달 (작업 스레드에서 호출)"""
+        self._queue.put(('progress', (done, total, message)))
+
+    def report_partial(self, payload):
+        """중간 결과 전달 (작업 스레드에서 호출)"""
+        self._queue.put(('partial', payload))
+
+    def _run(self):
+        try:
+            result = self.work(self.report_progress, self.cancel_event)
+        except LoadCancelled:
+            self._queue.put(('cancelled', None))
+        except Exception as e:
+            traceback.print_exc()
+            self._queue.put(('error', e))
+        else:
+            if self.cancel_event.is_set():
+                self._queue.put(('cancelled', None))
+            else:
+                self._queue.put(('done', result))
+
+    def _poll(self):
+        """큐의 메시지를 Tk 스레드에서 처리 (진행 메시지는 마지막 것만, 중간 결과는 모두 순서대로)"""
+        latest_progress = None
+        partials = []
+        final = None
+        try:
+            while final is None:
+                kind, payload = self._queue.get_nowait()
+                if kind == 'progress':
+                    latest_progress = payload
+                elif kind == 'partial':
+                    partials.append(payload)
+                else:
+                    final = (kind, payload)
+        except queue.Empty:
+            pass
+
+        if self.on_partial and not self.cancel_event.is_set():
+            for payload in partials:
+                self.on_partial(payload)
+        if latest_progress is not None and self.on_progress:
+            self.on_progress(*latest_progress)
+
+        if final is None:
+            self.root.after(self.poll_ms, self._poll)
+            return
+
+        self._finished = True
+        kind, payload = final
+        if kind == 'done':
+            self.on_done(payload)
+        elif kind == 'error':
+            if self.on_error:
+                self.on_error(payload)
+        elif self.on_cancelled:
+            self.on_cancelled()
@@ -0,0 +1,193 @@
+"""
+시계열 플롯 다운샘플링 모듈
+구간(버킷)별 최솟값/최댓값을 남기는 방식으로 점 개수를 화면 픽셀 폭의 약 2배로 줄입니다.
+
+- 버킷마다 최솟값과 최댓값 위치를 모두 남기므로 스파이크가 사라지지 않습니다.
+- 줌/팬으로 x축 범위가 바뀌면 보이는 구간만 원본 해상도에서 다시 다운샘플링합니다.
+- 모든 계산은 NumPy 벡터 연산으로 수행합니다 (Python 루프 없음).
+"""
+
+import numpy as np
+import matplotlib.dates as mdates
+
+
+# 이 개수 이하의 점은 다운샘플링하지 않고 그대로 그림
+DOWNSAMPLE_MIN_POINTS = 5000
+
+
+def _first_in_bucket(hit_idx, bucket):
+    """조건을 만족하는 인덱스 중 버킷별 첫 번째만 선택"""
+    if len(hit_idx) == 0:
+        return hit_idx
+    b = bucket[hit_idx]
+    keep = np.empty(len(hit_idx), dtype=bool)
+    keep[0] = True
+    keep[1:] = b[1:] != b[:-1]
+    return hit_idx[keep]
+
+
+def minmax_downsample_indices(x, y, n_buckets):
+    """
+    시간 버킷별 최솟값/최댓값 위치 인덱스 계산 (M4 방식의 min/max 부분)
+
+    Args:
+        x: 정렬된 x 값 (int64 또는 float, datetime64는 int64로 변환해서 전달)
+        y: y 값 (float, NaN 허용)
+        n_buckets: 버킷 수 (보통 축의 픽셀 폭)
+
+    Returns:
+        np.ndarray: 남길 점의 인덱스 (오름차순, 첫/마지막 점 포함)
+    """
+    n = len(x)
+    if n <= max(2 * n_buckets, 2):
+        return np.arange(n)
+
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+
+    span = float(x[-1] - x[0])
+    if span <= 0:
+        bucket = (np.arange(n) * n_buckets) // n
+    else:
+        bucket = ((x - x[0]).astype(float) * (n_buckets / span)).astype(np.int64)
+        np.minimum(bucket, n_buckets - 1, out=bucket)
+
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    counts = np.diff(np.r_[starts, n])
+
+    # NaN만 있는 버킷은 NaN 위치가 선택되어 선의 끊김(PLC 에러 구간 등)이 유지됨
+    y_for_min = np.where(np.isnan(y), np.inf, y)
+    y_for_max = np.where(np.isnan(y), -np.inf, y)
+    mins = np.minimum.reduceat(y_for_min, starts)
+    maxs = np.maximum.reduceat(y_for_max, starts)
+
+    min_idx = _first_in_bucket(np.flatnonzero(y_for_min == np.repeat(mins, counts)), bucket)
+    max_idx = _first_in_bucket(np.flatnonzero(y_for_max == np.repeat(maxs, counts)), bucket)
+
+    return np.unique(np.concatenate([min_idx, max_idx, [0, n - 1]]))
+
+
+def _x_to_int(x):
+    """x 배열을 버킷 계산용 숫자 배열로 변환 (datetime64 -> int64 나노초)"""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').view('i8')
+    return x
+
+
+def _xlim_to_int(x_arr, x0, x1):
+    """축 x 범위(matplotlib 날짜 숫자)를 _x_to_int와 같은 단위로 변환"""
+    if np.issubdtype(x_arr.dtype, np.datetime64):
+        epoch_ns = np.datetime64(mdates.get_epoch(), 'ns').astype('i8')
+        return (epoch_ns + np.array([x0, x1]) * 86400e9).astype('i8')
+    return np.array([x0, x1])
+
+
+def _axes_pixel_width(ax):
+    """축의 화면 폭(픽셀), 최소 100"""
+    try:
+        return max(100, int(ax.get_window_extent().width))
+    except Exception:
+        return 1000
+
+
+class DownsampledPlot:
+    """
+    한 figure의 시계열 artist들을 다운샘플링하여 관리
+
+    Line2D는 set_data, scatter(PathCollection)는 set_offsets로 보이는 구간의 점만 갱신합니다.
+    원본 데이터는 NumPy 배열로 보관하며 artist에는 다운샘플링된 점만 들어갑니다.
+    """
+
+    def __init__(self, axes=()):
+        """
+        초기화
+        Args:
+            axes: x축을 공유하는 축 리스트 (twinx 포함, plot/scatter에 쓰인 축은 자동 추가)
+        """
+        self.axes = []
+        self._cids = []
+        self._series = []  # (artist, x 원본, x 숫자, y 원본, 축)
+        self._last_xlim = None
+        for ax in axes:
+            self._watch(ax)
+
+    def plot(self, ax, x, y, **kwargs):
+        """ax.plot 대신 사용: 다운샘플링된 점으로 선을 그리고 등록"""
+        self._watch(ax)
+        x_arr, x_num, y_arr = self._prepare(x, y)
+        idx = self._initial_indices(ax, x_num, y_arr)
+        lines = ax.plot(x_arr[idx], y_arr[idx], **kwargs)
+        for line in lines:
+            self._series.append((line, x_arr, x_num, y_arr, ax))
+        return lines
+
+    def scatter(self, ax, x, y, **kwargs):
+        """ax.scatter 대신 사용: 다운샘플링된 점으로 scatter를 그리고 등록"""
+        self._watch(ax)
+        x_arr, x_num, y_arr = self._prepare(x, y)
+        idx = self._initial_indices(ax, x_num, y_arr)
+        collection = ax.scatter(x_arr[idx], y_arr[idx], **kwargs)
+        self._series.append((collection, x_arr, x_num, y_arr, ax))
+        return collection
+
+    def refresh(self):
+        """현재 x축 범위 기준으로 모든 artist 다시 다운샘플링"""
+        if not self.axes or not self._series:
+            return
+        self._refresh_xlim(*self.axes[0].get_xlim())
+
+    def disconnect(self):
+        """축 콜백 해제"""
+        for ax, cid in zip(self.axes, self._cids):
+            ax.callbacks.disconnect(cid)
+        self._cids = []
+
+    # ------------------------------------------------------------------
+    # 내부 함수
+    # ------------------------------------------------------------------
+    def _watch(self, ax):
+        """축의 x 범위 변경 콜백 연결 (twinx 축은 팬/줌 시 따로 이벤트가 발생하므로 모두 연결)"""
+        if ax in self.axes:
+            return
+        self.axes.append(ax)
+        self._cids.append(ax.callbacks.connect('xlim_changed', self._on_xlim_changed))
+
+    def _refresh_xlim(self, x0, x1):
+        """x 범위 [x0, x1] 기준으로 모든 artist 갱신"""
+        self._last_xlim = (x0, x1)
+        for artist, x_arr, x_num, y_arr, ax in self._series:
+            idx = self._visible_indices(ax, x_arr, x_num, y_arr, x0, x1)
+            if hasattr(artist, 'set_data'):
+                artist.set_data(x_arr[idx], y_arr[idx])
+            else:
+                x_plot = mdates.date2num(x_arr[idx]) if np.issubdtype(x_arr.dtype, np.datetime64) else x_arr[idx]
+                artist.set_offsets(np.column_stack([x_plot, y_arr[idx]]))
+
+    @staticmethod
+    def _prepare(x, y):
+        x_arr = np.asarray(x)
+        y_arr = np.asarray(y, dtype=float)
+        return x_arr, _x_to_int(x_arr), y_arr
+
+    @staticmethod
+    def _initial_indices(ax, x_num, y_arr):
+        if len(x_num) <= DOWNSAMPLE_MIN_POINTS:
+            return np.arange(len(x_num))
+        return minmax_downsample_indices(x_num, y_arr, _axes_pixel_width(ax))
+
+    @staticmethod
+    def _visible_indices(ax, x_arr, x_num, y_arr, x0, x1):
+        """보이는 x 범위(+양쪽 한 점)의 인덱스를 다운샘플링"""
+        bounds = _xlim_to_int(x_arr, x0, x1)
+        lo = max(0, np.searchsorted(x_num, bounds[0], side='left') - 1)
+        hi = min(len(x_num), np.searchsorted(x_num, bounds[1], side='right') + 1)
+        if hi - lo <= DOWNSAMPLE_MIN_POINTS:
+            return np.arange(lo, hi)
+        return lo + minmax_downsample_indices(x_num[lo:hi], y_arr[lo:hi], _axes_pixel_width(ax))
+
+    def _on_xlim_changed(self, ax):
+        xlim = tuple(ax.get_xlim())
+        if xlim == self._last_xlim:
+            return
+        self._refresh_xlim(*xlim)
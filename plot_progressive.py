@@ -0,0 +1,146 @@
+"""
+점진적 플롯 모듈
+백그라운드 로드 중 파일(하루치)이 끝날 때마다 미리보기 figure의 선에 데이터를 이어 붙입니다.
+
+- figure는 로드 시작과 동시에 열리고, 완료된 파일 순서와 관계없이 시간 순으로 합쳐 그립니다.
+- 다시 그리기는 PROGRESSIVE_REDRAW_SECONDS 간격으로 묶어서 수행하며(draw_idle),
+  선 데이터는 축 픽셀 폭 기준 min/max 다운샘플링으로 줄여 설정합니다.
+- 선마다 다운샘플링된 점만 보관하고 새로 받은 프레임만 다운샘플링해 합치므로
+  다시 그리기 비용은 지금까지 받은 전체 행 수가 아니라 새 행 수에 비례합니다.
+- 로드가 끝나면 호출 측이 미리보기를 닫고 전체 기능 플롯을 만듭니다.
+- 실시간 추적(db_follow)에서는 같은 figure에 새로 기록된 행을 주기적으로 이어 붙입니다.
+"""
+
+import time
+
+import numpy as np
+import polars as pl
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+
+from plot_downsample import minmax_downsample_indices
+
+
+# 미리보기 다시 그리기 최소 간격 (초)
+PROGRESSIVE_REDRAW_SECONDS = 0.5
+
+
+class ProgressivePlot:
+    """로드 중인 데이터를 파일 단위로 이어 붙여 보여주는 미리보기 figure"""
+
+    def __init__(self, title, params, status_label="로딩 중", frame_unit="파일", window_title=None):
+        """
+        초기화 (figure를 바로 열어 표시)
+        Args:
+            title: 플롯 제목 (파라미터 이름)
+            params: 그릴 파라미터 리스트
+            status_label: 제목에 붙일 진행 상태 ('로딩 중', '실시간' 등)
+            frame_unit: add_frame 한 번의 단위 이름 (제목의 'N개 파일' 표시용)
+            window_title: 창 제목 (None이면 'Loading: 제목')
+        """
+        self.title = title
+        self.params = list(params)
+        self.status_label = status_label
+        self.frame_unit = frame_unit
+        self._pending = []  # 아직 선에 반영하지 않은 프레임
+        self._buffers = {}  # 파라미터 -> (x int64 ns, y float) 다운샘플링된 누적 점
+        self.n_frames = 0
+        self.rows = 0
+        self._dirty = False
+        self._last_draw = 0.0
+
+        self.fig, self.ax = plt.subplots(figsize=(12, 6))
+        try:
+            if self.fig.canvas.manager is not None:
+                self.fig.canvas.manager.set_window_title(window_title or f"Loading: {title}")
+        except Exception:
+            pass
+        self.lines = {}
+        for param in self.params:
+            self.lines[param], = self.ax.plot([], [], linewidth=0.8, label=param)
+        self.ax.xaxis_date()
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))
+        self.ax.set_xlabel("Time")
+        self.ax.grid(True)
+        if len(self.params) > 1:
+            self.ax.legend(loc='upper right')
+        self.ax.set_title(f"{title} ({status_label}...)")
+        plt.show(block=False)
+        self.fig.canvas.draw_idle()
+
+    @property
+    def is_open(self):
+        """미리보기 창이 아직 열려 있으면 True"""
+        return plt.fignum_exists(self.fig.number)
+
+    def add_frame(self, df):
+        """
+        완료된 파일 데이터 추가 (Tk 스레드에서 호출)
+        Args:
+            df: datetime 컬럼을 포함한 Polars DataFrame (조건/시간 구간 필터 적용 후)
+        """
+        if df is None or df.height == 0 or 'datetime' not in df.columns:
+            return
+        columns = ['datetime'] + [p for p in self.params if p in df.columns]
+        self._pending.append(df.select(columns))
+        self.n_frames += 1
+        self.rows += df.height
+        self._dirty = True
+        if time.monotonic() - self._last_draw >= PROGRESSIVE_REDRAW_SECONDS:
+            self.redraw()
+
+    def redraw(self):
+        """새로 받은 프레임을 선마다 누적된 점에 합쳐 선과 축 범위 갱신"""
+        if not self._dirty or not self.is_open:
+            return
+        self._dirty = False
+        self._last_draw = time.monotonic()
+        try:
+            n_buckets = max(100, int(self.ax.get_window_extent().width))
+        except Exception:
+            n_buckets = 1000
+
+        pending, self._pending = self._pending, []
+        if pending:
+            merged = pl.concat(pending, how='diagonal_relaxed').sort('datetime')
+            x_new = merged['datetime'].to_numpy().astype('datetime64[ns]').view('i8')
+            for param in self.lines:
+                if param not in merged.columns:
+                    continue
+                y_new = merged[param].cast(pl.Float64, strict=False).to_numpy()
+                idx = minmax_downsample_indices(x_new, y_new, n_buckets)
+                self._merge_into_buffer(param, x_new[idx], y_new[idx], n_buckets)
+
+        for param, line in self.lines.items():
+            if param in self._buffers:
+                x, y = self._buffers[param]
+                line.set_data(mdates.date2num(x.view('datetime64[ns]')), y)
+
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.ax.set_title(f"{self.title} ({self.status_label}: {self.n_frames}개 {self.frame_unit}, {self.rows:,} 행)")
+        self.fig.canvas.draw_idle()
+
+    def _merge_into_buffer(self, param, x, y, n_buckets):
+        """다운샘플링된 새 점을 누적 점과 시간 순으로 합친 뒤 다시 버킷 수 이내로 줄임"""
+        if param in self._buffers:
+            old_x, old_y = self._buffers[param]
+            x = np.concatenate([old_x, x])
+            y = np.concatenate([old_y, y])
+            order = np.argsort(x, kind='stable')
+            x, y = x[order], y[order]
+        idx = minmax_downsample_indices(x, y, n_buckets)
+        self._buffers[param] = (x[idx], y[idx])
+
+    def finish(self, status_text):
+        """로드가 끝났지만 전체 플롯으로 바꾸지 않을 때(취소 등) 마지막 상태 표시"""
+        self._dirty = True
+        self.redraw()
+        if self.is_open:
+            self.ax.set_title(f"{self.title} ({status_text}: {self.n_frames}개 {self.frame_unit}, {self.rows:,} 행)")
+            self.fig.canvas.draw_idle()
+
+    def close(self):
+        """미리보기 창 닫기"""
+        if self.is_open:
+            plt.close(self.fig)
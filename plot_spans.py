@@ -0,0 +1,119 @@
+"""
+PLC 에러 구간 표시 모듈
+에러 마스크를 벡터 연산(run-length)으로 구간으로 바꾸고, 구간 전체를 PolyCollection 하나로 그립니다.
+
+- 구간마다 axvspan artist를 만들지 않으므로 에러가 수천 번인 날도 artist는 1개입니다.
+- 줌/팬 시 보이는 구간만 남기고, 1픽셀보다 가까운 구간은 하나로 합쳐 다시 그립니다.
+"""
+
+import numpy as np
+import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
+
+
+def _x_to_num(x):
+    """x 값을 matplotlib 축 숫자로 변환 (datetime64/datetime -> 날짜 숫자)"""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64) or x.dtype == object:
+        return mdates.date2num(x)
+    return x.astype(float)
+
+
+def mask_to_intervals(x, mask):
+    """
+    불리언 마스크의 연속 True 구간을 (시작, 끝) 배열로 변환
+
+    구간 끝은 에러가 끝난 뒤 첫 정상 샘플의 x 값이며, 마지막까지 에러면 마지막 x 값입니다.
+
+    Args:
+        x: 정렬된 x 값 (datetime64 또는 숫자)
+        mask: 에러 여부 불리언 배열
+
+    Returns:
+        tuple: (starts, ends) matplotlib 축 숫자 배열
+    """
+    mask = np.asarray(mask, dtype=bool)
+    n = len(mask)
+    if n == 0 or not mask.any():
+        return np.empty(0), np.empty(0)
+
+    x_num = _x_to_num(x)
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    start_idx = np.flatnonzero(edges == 1)
+    end_idx = np.flatnonzero(edges == -1)  # 구간 다음 첫 인덱스 (마지막까지면 n)
+    starts = x_num[start_idx]
+    ends = x_num[np.minimum(end_idx, n - 1)]
+    return starts, ends
+
+
+def merge_intervals(starts, ends, min_gap):
+    """
+    간격이 min_gap 이하인 인접 구간 합치기 (정렬된 비중첩 구간)
+
+    Returns:
+        tuple: (starts, ends) 합쳐진 구간
+    """
+    if len(starts) <= 1:
+        return starts, ends
+    new_group = np.concatenate(([True], starts[1:] - ends[:-1] > min_gap))
+    first = np.flatnonzero(new_group)
+    return starts[first], np.maximum.reduceat(ends, first)
+
+
+class ErrorSpanCollection:
+    """에러 구간을 PolyCollection 하나로 그리고 줌 수준에 맞춰 합치기/잘라내기"""
+
+    def __init__(self, ax, x, mask, color='orange', alpha=0.2, label='PLC Error'):
+        """
+        초기화 (생성 즉시 축에 추가)
+        Args:
+            ax: 표시할 축
+            x: 정렬된 x 값 (datetime64 또는 숫자)
+            mask: 에러 여부 불리언 배열
+            color, alpha, label: 표시 스타일
+        """
+        self.ax = ax
+        self.starts, self.ends = mask_to_intervals(x, mask)
+        self.collection = PolyCollection(
+            [], closed=True, transform=ax.get_xaxis_transform(),
+            facecolor=color, edgecolor='none', alpha=alpha, label=label,
+        )
+        ax.add_collection(self.collection, autolim=False)
+        self._last_xlim = None
+        # 함수 콜백은 강한 참조로 보관되므로 이 객체를 따로 보관하지 않아도 줌 시 갱신됨
+        self._cid = ax.callbacks.connect('xlim_changed', lambda changed_ax: self.update())
+        self.update()
+
+    def __len__(self):
+        return len(self.starts)
+
+    def update(self):
+        """현재 x 범위에 보이는 구간만 1픽셀 단위로 합쳐 다시 설정"""
+        if len(self.starts) == 0:
+            return
+        x0, x1 = self.ax.get_xlim()
+        if (x0, x1) == self._last_xlim:
+            return
+        self._last_xlim = (x0, x1)
+
+        visible = (self.ends >= x0) & (self.starts <= x1)
+        starts = self.starts[visible]
+        ends = self.ends[visible]
+
+        try:
+            width_px = max(1.0, self.ax.get_window_extent().width)
+        except Exception:
+            width_px = 1000.0
+        starts, ends = merge_intervals(starts, ends, (x1 - x0) / width_px)
+
+        verts = np.empty((len(starts), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = starts
+        verts[:, 2, 0] = verts[:, 3, 0] = ends
+        verts[:, [0, 3], 1] = 0.0
+        verts[:, [1, 2], 1] = 1.0
+        self.collection.set_verts(verts)
+
+    def remove(self):
+        """축에서 제거하고 콜백 해제"""
+        self.ax.callbacks.disconnect(self._cid)
+        self.collection.remove()
@@ -0,0 +1,129 @@
+"""
+구간 통계 인덱스 모듈
+한 컬럼에 대해 누적합/제곱 누적합과 블록 sparse table(min/max)을 한 번(O(n)) 만들어 두고,
+임의의 행 구간 [lo, hi)의 개수/합/평균/표준편차/최솟값/최댓값을 상수 시간에 계산합니다.
+
+- NaN은 pandas(dropna)와 같이 모든 통계에서 제외합니다.
+- 제곱합의 자릿수 손실을 줄이기 위해 전체 평균만큼 이동한 값으로 누적합니다.
+- 행 단위 sparse table은 n·log n 메모리가 필요하므로 BLOCK_SIZE 블록 단위로 만들고,
+  구간 양 끝의 부분 블록(최대 2·BLOCK_SIZE개)만 직접 비교합니다.
+"""
+
+import numpy as np
+
+
+# sparse table 블록 크기 (부분 블록 비교 비용과 메모리의 균형)
+BLOCK_SIZE = 64
+
+
+def _build_sparse_table(block_values, reduce_func):
+    """블록 대표값 배열로 sparse table 생성 (levels[k][i] = block[i : i + 2^k] 집계)"""
+    levels = [block_values]
+    width = 1
+    while width * 2 <= len(block_values):
+        prev = levels[-1]
+        levels.append(reduce_func(prev[:-width], prev[width:]))
+        width *= 2
+    return levels
+
+
+def _query_sparse_table(levels, first, last, reduce_func):
+    """블록 구간 [first, last)의 집계 (겹치는 두 구간으로 O(1))"""
+    k = (last - first).bit_length() - 1
+    return reduce_func(levels[k][first], levels[k][last - (1 << k)])
+
+
+class RangeStats:
+    """한 컬럼의 행 구간 통계 인덱스"""
+
+    def __init__(self, values):
+        """
+        초기화 (O(n))
+        Args:
+            values: 숫자 배열 (NaN 허용, DataFrame 행 순서와 같아야 함)
+        """
+        values = np.asarray(values, dtype=float)
+        valid = ~np.isnan(values)
+        self.n = len(values)
+        self.shift = float(values[valid].mean()) if valid.any() else 0.0
+        shifted = np.where(valid, values - self.shift, 0.0)
+
+        self.cum_count = np.concatenate(([0], np.cumsum(valid, dtype=np.int64)))
+        self.cum_sum = np.concatenate(([0.0], np.cumsum(shifted)))
+        self.cum_sq = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+
+        # min/max 비교용 (NaN은 비교에서 지는 값으로 치환)
+        self._for_min = np.where(valid, values, np.inf)
+        self._for_max = np.where(valid, values, -np.inf)
+        n_blocks = -(-self.n // BLOCK_SIZE)
+        pad = n_blocks * BLOCK_SIZE - self.n
+        block_min = np.pad(self._for_min, (0, pad), constant_values=np.inf).reshape(-1, BLOCK_SIZE).min(axis=1)
+        block_max = np.pad(self._for_max, (0, pad), constant_values=-np.inf).reshape(-1, BLOCK_SIZE).max(axis=1)
+        self._min_table = _build_sparse_table(block_min, np.minimum)
+        self._max_table = _build_sparse_table(block_max, np.maximum)
+
+    def __len__(self):
+        return self.n
+
+    def count(self, lo, hi):
+        """[lo, hi) 구간의 NaN이 아닌 값 개수"""
+        return int(self.cum_count[hi] - self.cum_count[lo])
+
+    def sum(self, lo, hi):
+        """[lo, hi) 구간 합"""
+        return float(self.cum_sum[hi] - self.cum_sum[lo]) + self.shift * self.count(lo, hi)
+
+    def mean(self, lo, hi):
+        """[lo, hi) 구간 평균 (값이 없으면 NaN)"""
+        count = self.count(lo, hi)
+        if count == 0:
+            return np.nan
+        return float(self.cum_sum[hi] - self.cum_sum[lo]) / count + self.shift
+
+    def std(self, lo, hi, ddof=1):
+        """[lo, hi) 구간 표준편차 (기본 ddof=1, pandas std와 동일)"""
+        count = self.count(lo, hi)
+        if count - ddof <= 0:
+            return np.nan
+        s = float(self.cum_sum[hi] - self.cum_sum[lo])
+        sq = float(self.cum_sq[hi] - self.cum_sq[lo])
+        return float(np.sqrt(max(sq - s * s / count, 0.0) / (count - ddof)))
+
+    def min(self, lo, hi):
+        """[lo, hi) 구간 최솟값 (값이 없으면 NaN)"""
+        result = self._extreme(lo, hi, self._for_min, self._min_table, np.minimum)
+        return np.nan if np.isinf(result) and result > 0 else float(result)
+
+    def max(self, lo, hi):
+        """[lo, hi) 구간 최댓값 (값이 없으면 NaN)"""
+        result = self._extreme(lo, hi, self._for_max, self._max_table, np.maximum)
+        return np.nan if np.isinf(result) and result < 0 else float(result)
+
+    def summary(self, lo, hi):
+        """
+        [lo, hi) 구간 통계 묶음
+
+        Returns:
+            dict: count, sum, mean, std, min, max
+        """
+        return {
+            'count': self.count(lo, hi),
+            'sum': self.sum(lo, hi),
+            'mean': self.mean(lo, hi),
+            'std': self.std(lo, hi),
+            'min': self.min(lo, hi),
+            'max': self.max(lo, hi),
+        }
+
+    def _extreme(self, lo, hi, values, table, reduce_func):
+        """블록 sparse table + 양 끝 부분 블록으로 구간 극값 계산"""
+        lo, hi = int(lo), int(hi)
+        if hi - lo <= 2 * BLOCK_SIZE:
+            identity = values.dtype.type(np.inf if reduce_func is np.minimum else -np.inf)
+            return reduce_func.reduce(values[lo:hi], initial=identity)
+
+        first_block = -(-lo // BLOCK_SIZE)
+        last_block = hi // BLOCK_SIZE
+        result = _query_sparse_table(table, first_block, last_block, reduce_func)
+        result = reduce_func(result, reduce_func.reduce(values[lo:first_block * BLOCK_SIZE], initial=result))
+        return reduce_func(result, reduce_func.reduce(values[last_block * BLOCK_SIZE:hi], initial=result))
@@ -0,0 +1,114 @@
+"""
+정렬된 시간 컬럼 인덱스 모듈
+datetime 컬럼을 int64 나노초 배열로 한 번만 변환해 두고, 구간 선택 시 np.searchsorted로
+행 범위를 찾아 DataFrame 슬라이스(iloc)를 반환합니다.
+
+- 선택할 때마다 전체 길이의 불리언 마스크를 만들지 않으므로 수백만 행에서도 선택이 즉시 끝납니다.
+- 경계는 양쪽 모두 포함합니다 (기존 '(t >= start) & (t <= end)' 마스크와 같은 결과).
+- 시간이 정렬되어 있지 않으면 마스크 방식으로 동작합니다.
+"""
+
+import numpy as np
+import pandas as pd
+import matplotlib.dates as mdates
+
+
+def _to_ns_array(times):
+    """시간 값(Series/배열)을 tz 없는 int64 나노초 배열로 변환"""
+    if isinstance(times, pd.Series):
+        if not pd.api.types.is_datetime64_any_dtype(times):
+            times = pd.to_datetime(times)
+        if times.dt.tz is not None:
+            times = times.dt.tz_localize(None)
+        times = times.values
+    times = np.asarray(times)
+    if not np.issubdtype(times.dtype, np.datetime64):
+        times = pd.to_datetime(times).values
+    return times.astype('datetime64[ns]').view('i8')
+
+
+def to_ns(value):
+    """datetime/Timestamp/datetime64/int(ns) 값을 int64 나노초로 변환"""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts.value
+
+
+def num_to_ns(x):
+    """matplotlib 날짜 숫자를 int64 나노초로 변환 (num2date(x).replace(tzinfo=None)과 같은 시각)"""
+    epoch_ns = int(np.datetime64(mdates.get_epoch(), 'ns').astype('i8'))
+    # num2date와 같이 마이크로초 단위로 반올림
+    return epoch_ns + int(round(float(x) * 86400e6)) * 1000
+
+
+class TimeIndex:
+    """정렬된 datetime 컬럼의 이진 탐색 인덱스"""
+
+    def __init__(self, times):
+        """
+        초기화
+        Args:
+            times: datetime Series 또는 datetime64 배열 (DataFrame 행 순서와 같아야 함)
+        """
+        self.ns = _to_ns_array(times)
+        # NaT(최소 int64)가 섞여 있거나 정렬되어 있지 않으면 이진 탐색 불가
+        self.is_sorted = bool(len(self.ns) < 2 or np.all(self.ns[1:] >= self.ns[:-1]))
+        if self.is_sorted and len(self.ns) and self.ns[0] == np.iinfo(np.int64).min:
+            self.is_sorted = False
+
+    @classmethod
+    def from_frame(cls, df, time_col='datetime'):
+        """DataFrame의 시간 컬럼으로 인덱스 생성"""
+        return cls(df[time_col])
+
+    def __len__(self):
+        return len(self.ns)
+
+    @property
+    def max_ns(self):
+        """가장 늦은 시각 (int64 나노초, 비어 있으면 None)"""
+        if len(self.ns) == 0:
+            return None
+        return int(self.ns[-1]) if self.is_sorted else int(self.ns.max())
+
+    def bounds(self, start, end):
+        """
+        [start, end] 구간에 해당하는 행 범위 반환 (정렬된 경우만)
+
+        Returns:
+            tuple: (lo, hi) - df.iloc[lo:hi]가 구간의 행
+        """
+        lo = int(np.searchsorted(self.ns, to_ns(start), side='left'))
+        hi = int(np.searchsorted(self.ns, to_ns(end), side='right'))
+        return lo, max(lo, hi)
+
+    def mask(self, start, end):
+        """[start, end] 구간 불리언 마스크 (정렬되지 않은 경우용)"""
+        return (self.ns >= to_ns(start)) & (self.ns <= to_ns(end))
+
+    def count(self, start, end):
+        """[start, end] 구간 행 수"""
+        if self.is_sorted:
+            lo, hi = self.bounds(start, end)
+            return hi - lo
+        return int(self.mask(start, end).sum())
+
+    def select(self, df, start, end):
+        """
+        [start, end] 구간의 행 반환 (정렬된 경우 복사 없는 iloc 슬라이스)
+
+        Args:
+            df: 인덱스를 만든 DataFrame (또는 같은 행 순서의 Series)
+            start, end: 구간 시작/끝 (datetime, Timestamp, datetime64, int 나노초)
+        """
+        if self.is_sorted:
+            lo, hi = self.bounds(start, end)
+            return df.iloc[lo:hi]
+        return df[self.mask(start, end)]
+
+    def select_num(self, df, xmin, xmax):
+        """matplotlib 날짜 숫자 구간 [xmin, xmax]의 행 반환 (SpanSelector 콜백용)"""
+        return self.select(df, num_to_ns(xmin), num_to_ns(xmax))